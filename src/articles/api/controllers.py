@@ -1,4 +1,4 @@
-from typing import ClassVar
+from typing import Annotated, ClassVar
 from uuid import UUID
 
 from dishka import FromDishka as Depends
@@ -7,6 +7,8 @@ from litestar import Controller, Request, Response, delete, get, patch, post, pu
 from litestar.datastructures import State
 from litestar.di import Provide
 from litestar.dto import DTOData
+from litestar.params import Parameter
+from litestar.response import Stream
 
 from articles.api.schemas import (
     ArticleCreateSchema,
@@ -37,6 +39,7 @@ from articles.application.dto.article import (
     ArticleDTO,
     CommentDTO,
     PaginatedArticleDTO,
+    ReactionCountsDTO,
     SpecializationDTO,
     SubArticleDTO,
     TagDTO,
@@ -51,6 +54,7 @@ from articles.application.exceptions import (
     NothingToCancelError,
     ViewAlreadyExistError,
 )
+from articles.application.queries.export_articles import ExportArticles, ExportArticlesHandler
 from articles.application.queries.get_article_by_id import GetArticleById, GetArticleByIdHandler
 from articles.application.queries.get_articles import ArticleFilter, GetArticles, GetArticlesHandler
 from articles.application.queries.get_comments import GetComments, GetCommentsHandler
@@ -61,10 +65,24 @@ from articles.domain.value_objects.article_title import TooLongArticleTitleError
 from articles.domain.value_objects.tag_name import TooLongTagNameError
 from auth.api.schemas import JWTUserPayload
 from common.api.exception_handlers import error_handler
+from common.api.export import ExportFormat, export_response
 from common.application.dto import PaginatedDTO
 from common.application.query import PaginationParams
 
 
+def _get_article_filter(filters: GetArticleFilters, user_id: UUID, search: str | None) -> ArticleFilter:
+    return ArticleFilter(
+        search=search,
+        liked_user_id=user_id if filters.liked else None,
+        disliked_user_id=user_id if filters.disliked else None,
+        viewed_user_id=user_id if filters.viewed else None,
+        specializations_id=filters.specializations_id,
+        exclude_words=filters.exclude_words,
+        include_words=filters.include_words,
+        tags_id=filters.tags_id,
+    )
+
+
 class ArticleController(Controller):
     exception_handlers: ClassVar = {  # type: ignore  # noqa: PGH003
         TooLongArticleTitleError: error_handler(status_codes.HTTP_422_UNPROCESSABLE_ENTITY),
@@ -147,19 +165,32 @@ class ArticleController(Controller):
             GetArticles(
                 pagination=pagination_params,
                 user_id=request.user.sub,
-                articles_filter=ArticleFilter(
-                    search=search,
-                    liked_user_id=request.user.sub if filters.liked else None,
-                    disliked_user_id=request.user.sub if filters.disliked else None,
-                    viewed_user_id=request.user.sub if filters.viewed else None,
-                    specializations_id=filters.specializations_id,
-                    exclude_words=filters.exclude_words,
-                    include_words=filters.include_words,
-                    tags_id=filters.tags_id,
-                ),
+                articles_filter=_get_article_filter(filters, request.user.sub, search),
             ),
         )
 
+    @get(
+        "/export",
+        status_code=status_codes.HTTP_200_OK,
+        dependencies={"filters": Provide(GetArticleFilters)},
+    )
+    @inject
+    async def export_articles(
+        self,
+        export_articles: Depends[ExportArticlesHandler],
+        filters: GetArticleFilters,
+        request: Request[JWTUserPayload, str, State],
+        search: str | None = None,
+        file_format: Annotated[ExportFormat, Parameter(query="format")] = ExportFormat.JSONL,
+    ) -> Stream:
+        batches = export_articles(
+            ExportArticles(
+                user_id=request.user.sub,
+                articles_filter=_get_article_filter(filters, request.user.sub, search),
+            ),
+        )
+        return export_response(batches, ArticleDTO, file_format, filename="articles")
+
     @get("/{article_id:uuid}", status_code=status_codes.HTTP_200_OK)
     @inject
     async def get_article_by_id(
@@ -257,9 +288,8 @@ class ArticleController(Controller):
         article_id: UUID,
         request: Request[JWTUserPayload, str, State],
         like_article: Depends[LikeArticleHandler],
-    ) -> Response[str]:
-        await like_article(LikeArticle(id=article_id, user_id=request.user.sub))
-        return Response(content="", status_code=status_codes.HTTP_200_OK)
+    ) -> ReactionCountsDTO:
+        return await like_article(LikeArticle(id=article_id, user_id=request.user.sub))
 
     @delete(
         "/{article_id:uuid}/likes",
@@ -271,9 +301,8 @@ class ArticleController(Controller):
         article_id: UUID,
         request: Request[JWTUserPayload, str, State],
         cancel_like_article: Depends[CancelLikeArticleHandler],
-    ) -> Response[str]:
-        await cancel_like_article(CancelLikeArticle(id=article_id, user_id=request.user.sub))
-        return Response(content="", status_code=status_codes.HTTP_200_OK)
+    ) -> ReactionCountsDTO:
+        return await cancel_like_article(CancelLikeArticle(id=article_id, user_id=request.user.sub))
 
     @post(
         "/{article_id:uuid}/dislikes",
@@ -285,9 +314,8 @@ class ArticleController(Controller):
         article_id: UUID,
         request: Request[JWTUserPayload, str, State],
         dislike_article: Depends[DislikeArticleHandler],
-    ) -> Response[str]:
-        await dislike_article(DislikeArticle(id=article_id, user_id=request.user.sub))
-        return Response(content="", status_code=status_codes.HTTP_200_OK)
+    ) -> ReactionCountsDTO:
+        return await dislike_article(DislikeArticle(id=article_id, user_id=request.user.sub))
 
     @delete(
         "/{article_id:uuid}/dislikes",
@@ -299,9 +327,8 @@ class ArticleController(Controller):
         article_id: UUID,
         request: Request[JWTUserPayload, str, State],
         cancel_dislike_article: Depends[CancelDislikeArticleHandler],
-    ) -> Response[str]:
-        await cancel_dislike_article(CancelDislikeArticle(id=article_id, user_id=request.user.sub))
-        return Response(content="", status_code=status_codes.HTTP_200_OK)
+    ) -> ReactionCountsDTO:
+        return await cancel_dislike_article(CancelDislikeArticle(id=article_id, user_id=request.user.sub))
 
     @post(
         "/{article_id:uuid}/views",
@@ -313,9 +340,8 @@ class ArticleController(Controller):
         article_id: UUID,
         request: Request[JWTUserPayload, str, State],
         view_article: Depends[ViewArticleHandler],
-    ) -> Response[str]:
-        await view_article(ViewArticle(id=article_id, user_id=request.user.sub))
-        return Response(content="", status_code=status_codes.HTTP_200_OK)
+    ) -> ReactionCountsDTO:
+        return await view_article(ViewArticle(id=article_id, user_id=request.user.sub))
 
     @post(
         "/comments/{comment_id:uuid}/likes",
@@ -327,9 +353,8 @@ class ArticleController(Controller):
         comment_id: UUID,
         request: Request[JWTUserPayload, str, State],
         like_comment: Depends[LikeCommentHandler],
-    ) -> Response[str]:
-        await like_comment(LikeComment(id=comment_id, user_id=request.user.sub))
-        return Response(content="", status_code=status_codes.HTTP_200_OK)
+    ) -> ReactionCountsDTO:
+        return await like_comment(LikeComment(id=comment_id, user_id=request.user.sub))
 
     @delete(
         "/comments/{comment_id:uuid}/likes",
@@ -341,9 +366,8 @@ class ArticleController(Controller):
         comment_id: UUID,
         request: Request[JWTUserPayload, str, State],
         cancel_like_comment: Depends[CancelLikeCommentHandler],
-    ) -> Response[str]:
-        await cancel_like_comment(CancelLikeComment(id=comment_id, user_id=request.user.sub))
-        return Response(content="", status_code=status_codes.HTTP_200_OK)
+    ) -> ReactionCountsDTO:
+        return await cancel_like_comment(CancelLikeComment(id=comment_id, user_id=request.user.sub))
 
     @post(
         "/comments/{comment_id:uuid}/dislikes",
@@ -355,9 +379,8 @@ class ArticleController(Controller):
         comment_id: UUID,
         request: Request[JWTUserPayload, str, State],
         dislike_comment: Depends[DislikeCommentHandler],
-    ) -> Response[str]:
-        await dislike_comment(DislikeComment(id=comment_id, user_id=request.user.sub))
-        return Response(content="", status_code=status_codes.HTTP_200_OK)
+    ) -> ReactionCountsDTO:
+        return await dislike_comment(DislikeComment(id=comment_id, user_id=request.user.sub))
 
     @delete(
         "/comments/{comment_id:uuid}/dislikes",
@@ -369,6 +392,5 @@ class ArticleController(Controller):
         comment_id: UUID,
         request: Request[JWTUserPayload, str, State],
         cancel_dislike_comment: Depends[CancelDislikeCommentHandler],
-    ) -> Response[str]:
-        await cancel_dislike_comment(CancelDislikeComment(id=comment_id, user_id=request.user.sub))
-        return Response(content="", status_code=status_codes.HTTP_200_OK)
+    ) -> ReactionCountsDTO:
+        return await cancel_dislike_comment(CancelDislikeComment(id=comment_id, user_id=request.user.sub))
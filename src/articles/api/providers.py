@@ -1,4 +1,8 @@
+from collections.abc import AsyncIterable
+
 from dishka import Provider, Scope, provide  # type: ignore  # noqa: PGH003
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from articles.application.commands.cancel_dislike_article import CancelDislikeArticleHandler
 from articles.application.commands.cancel_dislike_comment import CancelDislikeCommentHandler
@@ -16,22 +20,43 @@ from articles.application.commands.like_article import LikeArticleHandler
 from articles.application.commands.like_comment import LikeCommentHandler
 from articles.application.commands.view_article import ViewArticleHandler
 from articles.application.ports.repo import ArticleReader, ArticleRepo, CommentReader, CommentRepo
+from articles.application.queries.export_articles import ExportArticlesHandler
 from articles.application.queries.get_article_by_id import GetArticleByIdHandler
 from articles.application.queries.get_articles import GetArticlesHandler
 from articles.application.queries.get_comments import GetCommentsHandler
 from articles.application.queries.get_specialization import GetSpecializationsHandler
 from articles.application.queries.get_tag_list import GetTagListHandler
+from articles.infrastructure.cache import RedisArticleCache
+from articles.infrastructure.counters import ARTICLE_COUNTERS, COMMENT_COUNTERS
 from articles.infrastructure.repositories.article import AlchemyArticleReader, AlchemyArticleRepo
 from articles.infrastructure.repositories.article_stats import AlchemyArticleStatRepo
 from articles.infrastructure.repositories.comment import AlchemyCommentReader, AlchemyCommentRepo
 from articles.infrastructure.repositories.comment_stats import AlchemyCommentStatRepo
 from articles.infrastructure.repositories.sub_article import AlchemySubArticleReader, AlchemySubArticleRepo
 from articles.infrastructure.repositories.tag import AlchemyTagReader, AlchemyTagRepo
+from common.infrastructure.adapters.counter_buffer import RedisCounterBuffer
+from config import Settings
 
 
 class ArticleProvider(Provider):
     scope = Scope.REQUEST
 
+    @provide(scope=Scope.APP)
+    async def provide_counter_buffer(
+        self,
+        config: Settings,
+        redis: Redis,
+        session_maker: async_sessionmaker[AsyncSession],
+    ) -> AsyncIterable[RedisCounterBuffer]:
+        counters = RedisCounterBuffer(redis, config.redis.PREFIX, tables=(ARTICLE_COUNTERS, COMMENT_COUNTERS))
+        counters.start(session_maker, config.redis.COUNTER_FLUSH_INTERVAL)
+        yield counters
+        await counters.stop(session_maker)
+
+    @provide(scope=Scope.APP)
+    def provide_article_cache(self, config: Settings, redis: Redis) -> RedisArticleCache:
+        return RedisArticleCache(redis, config.redis.PREFIX, ttl=config.redis.ARTICLE_CACHE_TTL)
+
     article_repo = provide(AlchemyArticleRepo, provides=ArticleRepo)
     article_reader = provide(AlchemyArticleReader, provides=ArticleReader)
     sub_article_repo = provide(AlchemySubArticleRepo)
@@ -63,6 +88,7 @@ class ArticleProvider(Provider):
 
     get_tag_list = provide(GetTagListHandler)
     get_articles = provide(GetArticlesHandler)
+    export_articles = provide(ExportArticlesHandler)
     get_comments = provide(GetCommentsHandler)
     get_article_by_id = provide(GetArticleByIdHandler)
     get_specialization = provide(GetSpecializationsHandler)
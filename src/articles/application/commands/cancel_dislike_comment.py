@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from articles.application.dto.article import ReactionCountsDTO
 from articles.application.ports.repo import CommentReader, CommentRepo
 from common.application.command import Command, CommandHandler
 from common.application.uow import UnitOfWork
@@ -8,22 +9,23 @@ from users.application.ports.repo import UserReader, UserRepo
 
 
 @dataclass(frozen=True, slots=True)
-class CancelDislikeComment(Command[None]):
+class CancelDislikeComment(Command[ReactionCountsDTO]):
     id: UUID
     user_id: UUID
 
 
 @dataclass
-class CancelDislikeCommentHandler(CommandHandler[CancelDislikeComment, None]):
+class CancelDislikeCommentHandler(CommandHandler[CancelDislikeComment, ReactionCountsDTO]):
     _comment_reader: CommentReader
     _comment_repo: CommentRepo
     _user_repo: UserRepo
     _user_reader: UserReader
     _uow: UnitOfWork
 
-    async def __call__(self, command: CancelDislikeComment) -> None:
+    async def __call__(self, command: CancelDislikeComment) -> ReactionCountsDTO:
         comment = await self._comment_reader.get_comment_by_id(comment_id=command.id, user_id=command.user_id)
-        await self._comment_repo.cancel_dislike_comment(comment_id=command.id, user_id=command.user_id)
+        counts = await self._comment_repo.cancel_dislike_comment(comment_id=command.id, user_id=command.user_id)
         user = await self._user_reader.get_user_by_id(comment.author.id)
         await self._user_repo.update_user({"rating": user.rating + 1}, {"id": user.id})
         await self._uow.commit()
+        return counts
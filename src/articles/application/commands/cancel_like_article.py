@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from articles.application.dto.article import ReactionCountsDTO
 from articles.application.ports.repo import ArticleReader, ArticleRepo
 from common.application.command import Command, CommandHandler
 from common.application.uow import UnitOfWork
@@ -8,22 +9,23 @@ from users.application.ports.repo import UserReader, UserRepo
 
 
 @dataclass(frozen=True, slots=True)
-class CancelLikeArticle(Command[None]):
+class CancelLikeArticle(Command[ReactionCountsDTO]):
     id: UUID
     user_id: UUID
 
 
 @dataclass
-class CancelLikeArticleHandler(CommandHandler[CancelLikeArticle, None]):
+class CancelLikeArticleHandler(CommandHandler[CancelLikeArticle, ReactionCountsDTO]):
     _article_repo: ArticleRepo
     _article_reader: ArticleReader
     _user_reader: UserReader
     _user_repo: UserRepo
     _uow: UnitOfWork
 
-    async def __call__(self, command: CancelLikeArticle) -> None:
+    async def __call__(self, command: CancelLikeArticle) -> ReactionCountsDTO:
         article = await self._article_reader.get_article_by_id(user_id=command.user_id, article_id=command.id)
-        await self._article_repo.cancel_like_article(article_id=command.id, user_id=command.user_id)
+        counts = await self._article_repo.cancel_like_article(article_id=command.id, user_id=command.user_id)
         user = await self._user_reader.get_user_by_id(article.author.id)
         await self._user_repo.update_user({"rating": user.rating - 1}, {"id": user.id})
         await self._uow.commit()
+        return counts
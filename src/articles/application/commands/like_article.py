@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from articles.application.dto.article import ReactionCountsDTO
 from articles.application.exceptions import NothingToCancelError
 from articles.application.ports.repo import ArticleReader, ArticleRepo
 from common.application.command import Command, CommandHandler
@@ -9,20 +10,20 @@ from users.application.ports.repo import UserReader, UserRepo
 
 
 @dataclass(frozen=True, slots=True)
-class LikeArticle(Command[None]):
+class LikeArticle(Command[ReactionCountsDTO]):
     id: UUID
     user_id: UUID
 
 
 @dataclass
-class LikeArticleHandler(CommandHandler[LikeArticle, None]):
+class LikeArticleHandler(CommandHandler[LikeArticle, ReactionCountsDTO]):
     _article_repo: ArticleRepo
     _article_reader: ArticleReader
     _user_reader: UserReader
     _user_repo: UserRepo
     _uow: UnitOfWork
 
-    async def __call__(self, command: LikeArticle) -> None:
+    async def __call__(self, command: LikeArticle) -> ReactionCountsDTO:
         article = await self._article_reader.get_article_by_id(user_id=command.user_id, article_id=command.id)
         plus_rating = 1
 
@@ -33,7 +34,8 @@ class LikeArticleHandler(CommandHandler[LikeArticle, None]):
         else:
             plus_rating += 1
 
-        await self._article_repo.like_article(article_id=command.id, user_id=command.user_id)
+        counts = await self._article_repo.like_article(article_id=command.id, user_id=command.user_id)
         user = await self._user_reader.get_user_by_id(article.author.id)
         await self._user_repo.update_user({"rating": user.rating + plus_rating}, {"id": user.id})
         await self._uow.commit()
+        return counts
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from articles.application.dto.article import ReactionCountsDTO
 from articles.application.exceptions import NothingToCancelError
 from articles.application.ports.repo import CommentReader, CommentRepo
 from common.application.command import Command, CommandHandler
@@ -9,20 +10,20 @@ from users.application.ports.repo import UserReader, UserRepo
 
 
 @dataclass(frozen=True, slots=True)
-class LikeComment(Command[None]):
+class LikeComment(Command[ReactionCountsDTO]):
     id: UUID
     user_id: UUID
 
 
 @dataclass
-class LikeCommentHandler(CommandHandler[LikeComment, None]):
+class LikeCommentHandler(CommandHandler[LikeComment, ReactionCountsDTO]):
     _comment_repo: CommentRepo
     _comment_reader: CommentReader
     _user_reader: UserReader
     _user_repo: UserRepo
     _uow: UnitOfWork
 
-    async def __call__(self, command: LikeComment) -> None:
+    async def __call__(self, command: LikeComment) -> ReactionCountsDTO:
         comment = await self._comment_reader.get_comment_by_id(comment_id=command.id, user_id=command.user_id)
         plus_rating = 1
 
@@ -33,7 +34,8 @@ class LikeCommentHandler(CommandHandler[LikeComment, None]):
         else:
             plus_rating += 1
 
-        await self._comment_repo.like_comment(comment_id=command.id, user_id=command.user_id)
+        counts = await self._comment_repo.like_comment(comment_id=command.id, user_id=command.user_id)
         user = await self._user_reader.get_user_by_id(comment.author.id)
         await self._user_repo.update_user({"rating": user.rating + plus_rating}, {"id": user.id})
         await self._uow.commit()
+        return counts
@@ -1,24 +1,26 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from articles.application.dto.article import ReactionCountsDTO
 from articles.application.ports.repo import ArticleReader, ArticleRepo
 from common.application.command import Command, CommandHandler
 from common.application.uow import UnitOfWork
 
 
 @dataclass(frozen=True, slots=True)
-class ViewArticle(Command[None]):
+class ViewArticle(Command[ReactionCountsDTO]):
     id: UUID
     user_id: UUID
 
 
 @dataclass
-class ViewArticleHandler(CommandHandler[ViewArticle, None]):
+class ViewArticleHandler(CommandHandler[ViewArticle, ReactionCountsDTO]):
     _article_repo: ArticleRepo
     _article_reader: ArticleReader
     _uow: UnitOfWork
 
-    async def __call__(self, command: ViewArticle) -> None:
+    async def __call__(self, command: ViewArticle) -> ReactionCountsDTO:
         await self._article_reader.get_article_by_id(article_id=command.id, user_id=command.user_id)
-        await self._article_repo.view_article(article_id=command.id, user_id=command.user_id)
+        counts = await self._article_repo.view_article(article_id=command.id, user_id=command.user_id)
         await self._uow.commit()
+        return counts
@@ -78,4 +78,11 @@ class ArticleDTO(DTO):
     id: UUID = field(default_factory=uuid4)
 
 
+@dataclass(frozen=True, slots=True)
+class ReactionCountsDTO(DTO):
+    likes_cnt: int
+    dislikes_cnt: int
+    views_cnt: int | None = None
+
+
 type PaginatedArticleDTO = PaginatedDTO[ArticleDTO]
@@ -1,7 +1,9 @@
+from .export_articles import ExportArticles
 from .get_articles import GetArticles
 from .get_tag_list import GetTagList
 
 __all__ = (
+    "ExportArticles",
     "GetArticles",
     "GetTagList",
 )
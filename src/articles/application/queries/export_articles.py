@@ -0,0 +1,22 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from uuid import UUID
+
+from articles.application.dto.article import ArticleDTO
+from articles.application.ports.repo import ArticleReader
+from articles.application.queries.get_articles import ArticleFilter
+from common.application.query import EXPORT_BATCH_SIZE
+
+
+@dataclass(frozen=True, slots=True)
+class ExportArticles:
+    user_id: UUID
+    articles_filter: ArticleFilter | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ExportArticlesHandler:
+    _reader: ArticleReader
+
+    def __call__(self, query: ExportArticles) -> AsyncIterator[list[ArticleDTO]]:
+        return self._reader.export_articles(query, batch_size=EXPORT_BATCH_SIZE)
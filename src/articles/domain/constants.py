@@ -1,2 +1,3 @@
 ARTICLE_TITLE_LEN = 500
 TAG_NAME_LEN = 50
+ARTICLE_EXCERPT_LEN = 300
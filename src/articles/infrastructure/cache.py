@@ -0,0 +1,109 @@
+import asyncio
+from dataclasses import replace
+from uuid import UUID
+
+import msgspec
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from articles.application.dto.article import ArticleDTO
+
+logger = structlog.get_logger(__name__)
+
+_SESSION_KEY = "article_cache_invalidate"
+_LISTENING_KEY = "article_cache_listening"
+
+# put article only if it wasn't invalidated since the reader read the version
+_PUT_SCRIPT = """
+if tonumber(redis.call('GET', KEYS[2]) or '0') == tonumber(ARGV[1]) then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+end
+"""
+
+
+class RedisArticleCache:
+    """Read-through cache of article detail.
+
+    Only the user-independent part of `ArticleDTO` is stored, reaction status, counters and author
+    are overlaid by the reader. Entries are dropped after the session which changed the article commits,
+    and the version of the article is bumped. `put` writes the article only if the version is the same
+    as the reader got from `get` before loading it, so a reader which loaded the article before the commit
+    can't put the old version back.
+    """
+
+    def __init__(self, redis: Redis, prefix: str, ttl: int) -> None:
+        self._redis = redis
+        self._prefix = prefix
+        self._ttl = ttl
+        self._decoder = msgspec.json.Decoder(ArticleDTO)
+        self._encoder = msgspec.json.Encoder()
+        self._put = redis.register_script(_PUT_SCRIPT)
+        self._invalidate_tasks: set[asyncio.Task[None]] = set()
+
+    def _key(self, article_id: UUID) -> str:
+        return f"{self._prefix}:article:{article_id}"
+
+    def _version_key(self, article_id: UUID) -> str:
+        return f"{self._prefix}:article_version:{article_id}"
+
+    async def get(self, article_id: UUID) -> tuple[ArticleDTO | None, int | None]:
+        """Return cached article and version, which must be passed to `put` of the article loaded on miss."""
+        try:
+            raw, version = await self._redis.mget(self._key(article_id), self._version_key(article_id))
+        except RedisError:
+            logger.exception("failed to read article cache", article_id=article_id)
+            return None, None
+        if raw is None:
+            return None, int(version or 0)
+        try:
+            return self._decoder.decode(raw), None
+        except msgspec.DecodeError:
+            logger.warning("dropped malformed article cache entry", article_id=article_id)
+            return None, int(version or 0)
+
+    async def put(self, article: ArticleDTO, version: int | None) -> None:
+        if self._ttl <= 0 or version is None:
+            return
+        article = replace(article, reaction_status="no_reaction", is_viewed=None)
+        try:
+            await self._put(
+                keys=[self._key(article.id), self._version_key(article.id)],
+                args=[version, self._encoder.encode(article), self._ttl],
+            )
+        except RedisError:
+            logger.exception("failed to write article cache", article_id=article.id)
+
+    def invalidate(self, session: AsyncSession, article_id: UUID) -> None:
+        """Drop article from cache when session commits."""
+        if not session.info.get(_LISTENING_KEY):
+            event.listen(session.sync_session, "after_commit", self._on_commit)
+            event.listen(session.sync_session, "after_rollback", self._on_rollback)
+            session.info[_LISTENING_KEY] = True
+        session.info.setdefault(_SESSION_KEY, set()).add(article_id)
+
+    def _on_commit(self, session: Session) -> None:
+        if not (article_ids := session.info.pop(_SESSION_KEY, None)):
+            return
+        task = asyncio.get_running_loop().create_task(self._delete(article_ids))
+        self._invalidate_tasks.add(task)
+        task.add_done_callback(self._invalidate_tasks.discard)
+
+    @staticmethod
+    def _on_rollback(session: Session) -> None:
+        session.info.pop(_SESSION_KEY, None)
+
+    async def _delete(self, article_ids: set[UUID]) -> None:
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for article_id in article_ids:
+                    pipe.incr(self._version_key(article_id))
+                    # kept as long as entries, readers which got an older version only skip their `put`
+                    pipe.expire(self._version_key(article_id), max(self._ttl, 1))
+                pipe.delete(*(self._key(article_id) for article_id in article_ids))
+                await pipe.execute()
+        except RedisError:
+            logger.exception("failed to invalidate article cache", article_ids=article_ids)
@@ -0,0 +1,14 @@
+from articles.infrastructure.models import Article, ArticleFeed, Comment
+from common.infrastructure.adapters.counter_buffer import CounterTable
+
+ARTICLE_COUNTERS = CounterTable(
+    name="article",
+    table=Article.__table__,  # type: ignore[arg-type]
+    fields={"views_cnt": "views_cnt", "likes_cnt": "likes_cnt", "dislikes_cnt": "dislikes_cnt"},
+    mirrors=(ArticleFeed.__table__,),  # type: ignore[arg-type]
+)
+COMMENT_COUNTERS = CounterTable(
+    name="comment",
+    table=Comment.__table__,  # type: ignore[arg-type]
+    fields={"like_cnt": "likes_cnt", "dislikes_cnt": "dislikes_cnt"},
+)
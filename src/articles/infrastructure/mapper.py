@@ -2,6 +2,7 @@ from collections import defaultdict
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
+import msgspec
 from sqlalchemy import RowMapping
 
 from articles.application.dto.article import (
@@ -41,43 +42,49 @@ def convert_db_to_tag_dto(db_tag: RowMapping) -> TagDTO:
     return TagDTO(name=db_tag.name, id=db_tag.id)
 
 
-def convert_db_to_article_dto(
-    article: RowMapping,
-    sub_articles: list[SubArticleWithArticleIdDTO],
-    imgs: Sequence[str],
-    tags: Sequence[RowMapping],
-) -> ArticleDTO:
+def get_reaction_status(row: RowMapping) -> ReactionStatus:
+    if row.is_disliked:
+        return "is_disliked"
+    if row.is_liked:
+        return "is_liked"
+    return "no_reaction"
+
+
+def convert_db_to_author_dto(row: RowMapping) -> UserDTO:
+    """Author of article from `author_*` columns."""
     author_fullname = " ".join(
         [
-            article.author_lastname or "",
-            article.author_name or "",
-            article.author_patronymic or "",
+            row.author_lastname or "",
+            row.author_name or "",
+            row.author_patronymic or "",
         ],
     ).strip()
+    return UserDTO(
+        id=row.author_id,
+        nickname=row.author_nickname,
+        full_name=author_fullname,
+        img=row.author_img,
+        rating=row.author_rating,
+    )
 
-    reaction_status: ReactionStatus = "no_reaction"
-    if article.is_liked:
-        reaction_status = "is_liked"
-    if article.is_disliked:
-        reaction_status = "is_disliked"
 
+def convert_db_to_article_dto(
+    article: RowMapping,
+    sub_articles: list[SubArticleWithArticleIdDTO],
+    imgs: Sequence[str],
+    tags: Sequence[RowMapping],
+) -> ArticleDTO:
     return ArticleDTO(
         title=article.title,
         text=article.text,
-        author=UserDTO(
-            id=article.author_id,
-            nickname=article.author_nickname,
-            full_name=author_fullname,
-            img=article.author_img,
-            rating=article.author_rating,
-        ),
+        author=convert_db_to_author_dto(article),
         tags=[convert_db_to_tag_dto(db_tag) for db_tag in tags],
         is_visible=article.is_visible,
         sub_articles=[
             SubArticleDTO(**{key: value for key, value in sub_article.to_dict().items() if key != "article_id"})
             for sub_article in sub_articles
         ],
-        reaction_status=reaction_status,
+        reaction_status=get_reaction_status(article),
         views_cnt=article.views_cnt,
         likes_cnt=article.likes_cnt,
         dislikes_cnt=article.dislikes_cnt,
@@ -90,33 +97,29 @@ def convert_db_to_article_dto(
     )
 
 
-def convert_db_to_article_dto_list(
-    articles: Sequence[RowMapping],
-    sub_articles: list[SubArticleWithArticleIdDTO],
-    tags: Sequence[RowMapping],
-    imgs: Sequence[RowMapping],
-) -> list[ArticleDTO]:
-    tags_map: dict[UUID, list[RowMapping]] = defaultdict(list)
-    for tag in tags:
-        tags_map[tag.article_id].append(tag)
-
-    sub_articles_map: dict[UUID, list[SubArticleWithArticleIdDTO]] = defaultdict(list)
-    for sub_article in sub_articles:
-        sub_articles_map[sub_article.article_id].append(sub_article)
+def convert_db_to_feed_dto(article: RowMapping) -> ArticleDTO:
+    """Article list item, `text` holds the excerpt and sub-articles are shown only in article detail."""
+    return ArticleDTO(
+        title=article.title,
+        text=article.excerpt,
+        author=convert_db_to_author_dto(article),
+        tags=msgspec.convert(article.tags, list[TagDTO]),
+        is_visible=article.is_visible,
+        reaction_status=get_reaction_status(article),
+        views_cnt=article.views_cnt,
+        likes_cnt=article.likes_cnt,
+        dislikes_cnt=article.dislikes_cnt,
+        imgs=list(article.imgs),
+        specialization=SpecializationDTO(name=article.specialization_name, id=article.specialization_id)
+        if article.specialization_id
+        else None,
+        is_viewed=article.is_viewed,
+        id=article.id,
+    )
 
-    img_map: dict[UUID, list[str]] = defaultdict(list)
-    for img in imgs:
-        img_map[img.article_id].append(img.url)
 
-    return [
-        convert_db_to_article_dto(
-            article=article,
-            sub_articles=sub_articles_map[article.id],
-            imgs=img_map[article.id],
-            tags=tags_map[article.id],
-        )
-        for article in articles
-    ]
+def convert_db_to_feed_dto_list(articles: Sequence[RowMapping]) -> list[ArticleDTO]:
+    return [convert_db_to_feed_dto(article) for article in articles]
 
 
 def convert_db_to_comment_dto(comment: RowMapping) -> CommentDTO:
@@ -4,9 +4,12 @@ from sqlalchemy import (
     BigInteger,
     Boolean,
     ForeignKey,
+    Index,
     String,
     Text,
+    text,
 )
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from articles.domain.constants import ARTICLE_TITLE_LEN, TAG_NAME_LEN
@@ -26,6 +29,11 @@ class Specialization(ArticleBase):
 
 class Article(ArticleBase):
     __tablename__ = "article"
+    __table_args__ = (
+        Index("ix_article_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_article_created_at_id", text("created_at DESC"), text("id DESC")),
+        {"schema": "article"},
+    )
 
     title: Mapped[str] = mapped_column(String(length=ARTICLE_TITLE_LEN))
     text: Mapped[str] = mapped_column(Text)
@@ -38,10 +46,15 @@ class Article(ArticleBase):
         ForeignKey("article.specialization.id", ondelete="SET NULL"),
         nullable=True,
     )
+    search_vector: Mapped[str | None] = mapped_column(TSVECTOR, nullable=True)
 
 
 class Tag(ArticleBase):
     __tablename__ = "tag"
+    __table_args__ = (
+        Index("ix_tag_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        {"schema": "article"},
+    )
 
     name: Mapped[str] = mapped_column(String(TAG_NAME_LEN), unique=True)
 
@@ -78,6 +91,10 @@ class SubArticleImg(ArticleBase):
 
 class Comment(ArticleBase):
     __tablename__ = "comment"
+    __table_args__ = (
+        Index("ix_comment_created_at_id", text("created_at DESC"), text("id DESC")),
+        {"schema": "article"},
+    )
 
     text: Mapped[str] = mapped_column(Text)
     article_id: Mapped[UUID] = mapped_column(ForeignKey("article.article.id", ondelete="CASCADE"))
@@ -121,3 +138,38 @@ class RelCommentUserDislike(ArticleBase):
     id: None = None  # type: ignore  # noqa: PGH003
     comment_id: Mapped[UUID] = mapped_column(ForeignKey("article.comment.id", ondelete="CASCADE"), primary_key=True)
     user_id: Mapped[UUID] = mapped_column(ForeignKey("auth.user.id", ondelete="CASCADE"), primary_key=True)
+
+
+class ArticleFeed(ArticleBase):
+    """Read model of article list, one row per article with everything the list shows.
+
+    Rows are written by `AlchemyArticleRepo` with the article and by `AlchemyUserRepo` with the author profile,
+    counters are copied on insert and then kept by the counter buffer flush. Author rating changes with every
+    reaction, so it isn't copied and is read from the user on list.
+    """
+
+    __tablename__ = "article_feed"
+    __table_args__ = (
+        Index("ix_article_feed_created_at_id", "created_at", "id"),
+        Index("ix_article_feed_search_vector", "search_vector", postgresql_using="gin"),
+        {"schema": "article"},
+    )
+
+    id: Mapped[UUID] = mapped_column(ForeignKey("article.article.id", ondelete="CASCADE"), primary_key=True)
+    title: Mapped[str] = mapped_column(String(length=ARTICLE_TITLE_LEN))
+    excerpt: Mapped[str] = mapped_column(Text)
+    is_visible: Mapped[bool] = mapped_column(Boolean)
+    author_id: Mapped[UUID] = mapped_column(ForeignKey("auth.user.id", ondelete="CASCADE"), index=True)
+    author_nickname: Mapped[str] = mapped_column(String(20))
+    author_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    author_lastname: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    author_patronymic: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    author_img: Mapped[str | None] = mapped_column(String, nullable=True)
+    specialization_id: Mapped[UUID | None] = mapped_column(nullable=True, index=True)
+    specialization_name: Mapped[str | None] = mapped_column(String, nullable=True)
+    tags: Mapped[list[dict[str, str]]] = mapped_column(JSONB, server_default="[]")
+    imgs: Mapped[list[str]] = mapped_column(ARRAY(Text), server_default="{}")
+    views_cnt: Mapped[int] = mapped_column(BigInteger, default=0)
+    likes_cnt: Mapped[int] = mapped_column(BigInteger, default=0)
+    dislikes_cnt: Mapped[int] = mapped_column(BigInteger, default=0)
+    search_vector: Mapped[str | None] = mapped_column(TSVECTOR, nullable=True)
@@ -1,6 +1,8 @@
 import asyncio
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, ClassVar
+import itertools
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, ClassVar
 from uuid import UUID
 
 from sqlalchemy import delete, update
@@ -11,18 +13,24 @@ from articles.application.commands.edit_article import EditArticle
 from articles.application.dto.article import (
     ArticleDTO,
     PaginatedArticleDTO,
+    ReactionCountsDTO,
     SpecializationDTO,
     TagDTO,
 )
 from articles.application.exceptions import ArticleIdNotExistError
 from articles.application.ports.repo import ArticleReader, ArticleRepo
+from articles.application.queries.export_articles import ExportArticles
 from articles.application.queries.get_articles import GetArticles
 from articles.application.queries.get_tag_list import GetTagList
+from articles.infrastructure.cache import RedisArticleCache
+from articles.infrastructure.counters import ARTICLE_COUNTERS
 from articles.infrastructure.mapper import (
     convert_db_to_article_dto,
-    convert_db_to_article_dto_list,
+    convert_db_to_author_dto,
+    convert_db_to_feed_dto_list,
+    get_reaction_status,
 )
-from articles.infrastructure.models import Article, ArticleImg
+from articles.infrastructure.models import Article, ArticleFeed, ArticleImg, Specialization
 from articles.infrastructure.repositories.article_stats import AlchemyArticleStatRepo
 from articles.infrastructure.repositories.qb import ArticleQueryBuilder
 from articles.infrastructure.repositories.sub_article import AlchemySubArticleReader, AlchemySubArticleRepo
@@ -30,12 +38,12 @@ from articles.infrastructure.repositories.tag import AlchemyTagReader, AlchemyTa
 from auth.infrastructure.models import User
 from common.application.dto import PaginatedDTO
 from common.domain.constants import Empty
+from common.infrastructure.adapters.counter_buffer import RedisCounterBuffer
 from common.infrastructure.repositories.base import AlchemyReader, AlchemyRepo
+from common.infrastructure.repositories.dictionary import DictionaryCache
 from common.infrastructure.repositories.pagination import AlchemyPaginator
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
-
     from articles.application.queries.get_specialization import GetSpecializations
 
 
@@ -45,11 +53,14 @@ class AlchemyArticleRepo(ArticleRepo):
 
     _article: ClassVar[type[Article]] = Article
     _article_img: ClassVar[type[ArticleImg]] = ArticleImg
+    _qb: ClassVar[type[ArticleQueryBuilder]] = ArticleQueryBuilder
+    _search_fields: ClassVar[frozenset[str]] = frozenset(("title", "text", "sub_articles", "tags"))
 
     _base: AlchemyRepo
     _sub_article: AlchemySubArticleRepo
     _tag: AlchemyTagRepo
     _stat: AlchemyArticleStatRepo
+    _cache: RedisArticleCache
 
     async def _create_article_imgs(self, article_id: UUID, imgs: list[str]) -> None:
         if not imgs:
@@ -59,39 +70,44 @@ class AlchemyArticleRepo(ArticleRepo):
         )
 
     async def create_article(self, article: CreateArticle) -> None:
-        await self._base.execute(
-            insert(self._article).values(
-                title=article.title,
-                text=article.text,
-                is_visible=article.is_visible,
-                author_id=article.author_id,
-                specialization_id=article.specialization_id,
-                id=article.id,
-            ),
-        )
-        tasks: list[Coroutine[Any, Any, Any]] = []
-        if article.sub_articles:
-            tasks.append(self._sub_article.create_sub_articles(article.id, article.sub_articles))
-        if article.imgs:
-            tasks.append(self._create_article_imgs(article.id, article.imgs))
-
-        await asyncio.gather(
-            *tasks,
-            self._tag.create_tags_if_not_exists(article.tags),
-            self._tag.map_tags_to_article({dto.id for dto in article.tags}, article.id),
-        )
+        async with self._base.batch():
+            await self._base.execute(
+                insert(self._article).values(
+                    title=article.title,
+                    text=article.text,
+                    is_visible=article.is_visible,
+                    author_id=article.author_id,
+                    specialization_id=article.specialization_id,
+                    id=article.id,
+                ),
+            )
+            if article.sub_articles:
+                await self._sub_article.create_sub_articles(article.id, article.sub_articles)
+            if article.imgs:
+                await self._create_article_imgs(article.id, article.imgs)
+            await self._tag.create_tags_if_not_exists(article.tags)
+            await self._tag.map_tags_to_article({dto.id for dto in article.tags}, article.id)
+            await self.refresh_search_vector(article.id)
+            await self.refresh_feed(article.id)
+
+    async def refresh_search_vector(self, article_id: UUID) -> None:
+        await self._base.execute(self._qb.get_refresh_search_vector_qs(article_id))
+
+    async def refresh_feed(self, article_id: UUID) -> None:
+        await self._base.execute(self._qb.get_refresh_feed_qs(article_id))
 
     async def _delete_article_imgs(self, article_id: UUID) -> None:
         await self._base.execute(delete(self._article_img).filter(self._article_img.article_id == article_id))
 
     async def update_article_imgs(self, article_id: UUID, imgs: list[str]) -> None:
-        await asyncio.gather(
-            self._delete_article_imgs(article_id),
-            self._create_article_imgs(article_id, imgs),
-        )
+        self._cache.invalidate(self._base.session, article_id)
+        async with self._base.batch():
+            await self._delete_article_imgs(article_id)
+            await self._create_article_imgs(article_id, imgs)
 
     async def update_article(self, article: EditArticle) -> None:
         article_dict = article.to_dict_exclude_unset()
+        search_changed = not self._search_fields.isdisjoint(article_dict)
         article_id = article_dict.pop("id")
         article_dict.pop("author_id")
         article_dict.pop("sub_articles", None)
@@ -99,38 +115,39 @@ class AlchemyArticleRepo(ArticleRepo):
         article_dict.pop("tags", None)
 
         query = update(self._article).values(article_dict).filter(self._article.id == article_id)
-
-        tasks: list[Coroutine[Any, Any, None]] = []
-        if article.sub_articles is not Empty.UNSET:
-            tasks.append(
-                self._sub_article.update_sub_articles(article_id=article_id, sub_articles=article.sub_articles),
-            )
-
-        if article.imgs is not Empty.UNSET:
-            tasks.append(self.update_article_imgs(article_id, article.imgs))
-
-        if article.tags is not Empty.UNSET:
-            tasks.append(self._tag.update_article_tags(article_id, article.tags))
-
-        await asyncio.gather(*tasks, self._base.execute(query))
+        self._cache.invalidate(self._base.session, article_id)
+
+        async with self._base.batch():
+            await self._base.execute(query)
+            if article.sub_articles is not Empty.UNSET:
+                await self._sub_article.update_sub_articles(article_id=article_id, sub_articles=article.sub_articles)
+            if article.imgs is not Empty.UNSET:
+                await self.update_article_imgs(article_id, article.imgs)
+            if article.tags is not Empty.UNSET:
+                await self._tag.update_article_tags(article_id, article.tags)
+            # sub-articles and tags are written by now, so vector is rebuilt once for all of them
+            if search_changed:
+                await self.refresh_search_vector(article_id)
+            await self.refresh_feed(article_id)
 
     async def delete_article(self, article_id: UUID) -> None:
         await self._base.execute(delete(self._article).where(self._article.id == article_id))
+        self._cache.invalidate(self._base.session, article_id)
 
-    async def like_article(self, article_id: UUID, user_id: UUID) -> None:
-        await self._stat.like_article(article_id, user_id)
+    async def like_article(self, article_id: UUID, user_id: UUID) -> ReactionCountsDTO:
+        return await self._stat.like_article(article_id, user_id)
 
-    async def dislike_article(self, article_id: UUID, user_id: UUID) -> None:
-        await self._stat.dislike_article(article_id, user_id)
+    async def dislike_article(self, article_id: UUID, user_id: UUID) -> ReactionCountsDTO:
+        return await self._stat.dislike_article(article_id, user_id)
 
-    async def view_article(self, article_id: UUID, user_id: UUID) -> None:
-        await self._stat.view_article(article_id, user_id)
+    async def view_article(self, article_id: UUID, user_id: UUID) -> ReactionCountsDTO:
+        return await self._stat.view_article(article_id, user_id)
 
-    async def cancel_like_article(self, article_id: UUID, user_id: UUID) -> None:
-        await self._stat.cancel_like_article(article_id, user_id)
+    async def cancel_like_article(self, article_id: UUID, user_id: UUID) -> ReactionCountsDTO:
+        return await self._stat.cancel_like_article(article_id, user_id)
 
-    async def cancel_dislike_article(self, article_id: UUID, user_id: UUID) -> None:
-        await self._stat.cancel_dislike_article(article_id, user_id)
+    async def cancel_dislike_article(self, article_id: UUID, user_id: UUID) -> ReactionCountsDTO:
+        return await self._stat.cancel_dislike_article(article_id, user_id)
 
 
 class AlchemyArticleReader(ArticleReader):
@@ -138,68 +155,107 @@ class AlchemyArticleReader(ArticleReader):
 
     _paginator = AlchemyPaginator
     _article = Article
+    _feed = ArticleFeed
     _article_img = ArticleImg
     _author = User
     _qb = ArticleQueryBuilder
-
-    def __init__(self, base: AlchemyReader, tag: AlchemyTagReader, sub_article: AlchemySubArticleReader) -> None:
+    _counters = ARTICLE_COUNTERS
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        base: AlchemyReader,
+        tag: AlchemyTagReader,
+        sub_article: AlchemySubArticleReader,
+        counters: RedisCounterBuffer,
+        cache: RedisArticleCache,
+        dictionaries: DictionaryCache,
+    ) -> None:
         self._base = base
         self._sub_article = sub_article
         self._tag = tag
+        self._counter_buffer = counters
+        self._cache = cache
+        self._dictionaries = dictionaries
 
     async def get_tag_list(self, query: GetTagList) -> PaginatedDTO[TagDTO]:
         return await self._tag.get_tag_list(query)
 
-    async def get_article_by_id(self, article_id: UUID, user_id: UUID | None = None) -> ArticleDTO:
-        qs = self._qb.get_articles_qs(user_id)
-        qs = qs.where(self._article.id == article_id)
-        article = await self._base.fetch_one(qs)
-        if not article:
-            raise ArticleIdNotExistError(article_id)
-        sub_articles, article_imgs, article_tags = await asyncio.gather(
-            self._sub_article.get_sub_articles({article_id}),
-            self._base.fetch_sequence(self._qb.get_img_urls_qs({article_id})),
-            self._base.fetch_all(self._tag.get_tags_qs({article_id})),
+    async def _overlay_cached_article(self, article_dto: ArticleDTO, user_id: UUID | None = None) -> ArticleDTO:
+        """Fill cached article with current counters, author and reaction of user."""
+        reaction = await self._base.fetch_one(self._qb.get_article_reaction_qs(article_dto.id, user_id))
+        if not reaction:
+            raise ArticleIdNotExistError(article_dto.id)
+        return replace(
+            article_dto,
+            author=convert_db_to_author_dto(reaction),
+            reaction_status=get_reaction_status(reaction),
+            is_viewed=reaction.is_viewed,
+            views_cnt=reaction.views_cnt,
+            likes_cnt=reaction.likes_cnt,
+            dislikes_cnt=reaction.dislikes_cnt,
         )
-        return convert_db_to_article_dto(article, sub_articles, article_imgs, article_tags)
 
-    async def get_articles(self, query: GetArticles) -> PaginatedArticleDTO:
-        qs = self._qb.get_articles_qs(user_id=query.user_id, article_filter=query.articles_filter)
+    async def get_article_by_id(self, article_id: UUID, user_id: UUID | None = None) -> ArticleDTO:
+        article_dto, cache_version = await self._cache.get(article_id)
+        if article_dto is not None:
+            article_dto = await self._overlay_cached_article(article_dto, user_id)
+        else:
+            qs = self._qb.get_articles_qs(user_id)
+            qs = qs.where(self._article.id == article_id)
+            article = await self._base.fetch_one(qs)
+            if not article:
+                raise ArticleIdNotExistError(article_id)
+            sub_articles, article_imgs, article_tags = await asyncio.gather(
+                self._sub_article.get_sub_articles({article_id}),
+                self._base.fetch_sequence(self._qb.get_img_urls_qs({article_id})),
+                self._base.fetch_all(self._tag.get_tags_qs({article_id})),
+            )
+            article_dto = convert_db_to_article_dto(article, sub_articles, article_imgs, article_tags)
+            # replica may not have the last edit yet, its row would stay in the cache for the whole TTL
+            if not self._base.on_replica:
+                await self._cache.put(article_dto, cache_version)
+        return (await self._counter_buffer.merge(self._counters, [article_dto]))[0]
 
-        value_count = await self._base.count(qs)
-        qs = self._paginator.paginate(qs, query.pagination.page, query.pagination.per_page)
+    async def get_articles(self, query: GetArticles) -> PaginatedArticleDTO:
+        qs = self._qb.get_feed_qs(user_id=query.user_id, article_filter=query.articles_filter)
+
+        value_count = await self._base.count(qs) if query.pagination.with_count else None
+        # search results are ordered by rank, so they can't be paginated by `(created_at, id)` cursor
+        is_search = bool(query.articles_filter and query.articles_filter.search)
+        if is_search:
+            qs = self._paginator.paginate(qs, query.pagination.page, query.pagination.per_page)
+        else:
+            qs = self._paginator.paginate_keyset(qs, query.pagination, self._feed.created_at, self._feed.id)
         page_count = self._paginator.get_page_count(value_count, query.pagination.per_page)
 
         articles = await self._base.fetch_all(qs)
         if not articles:
             return PaginatedDTO[ArticleDTO](count=page_count, page=query.pagination.page, results=[])
 
-        article_ids = {article.id for article in articles}
-        sub_articles, article_imgs, article_tags = await asyncio.gather(
-            self._sub_article.get_sub_articles(article_ids),
-            self._base.fetch_all(self._qb.get_img_qs(article_ids)),
-            self._base.fetch_all(self._tag.get_tags_qs(article_ids)),
-        )
-        article_dto_list = convert_db_to_article_dto_list(
-            articles=articles,
-            sub_articles=sub_articles,
-            imgs=article_imgs,
-            tags=article_tags,
+        article_dto_list = await self._counter_buffer.merge(self._counters, convert_db_to_feed_dto_list(articles))
+
+        return PaginatedDTO[ArticleDTO](
+            count=value_count,
+            page=query.pagination.page,
+            results=article_dto_list,
+            next_cursor=None if is_search else self._paginator.get_next_cursor(articles, query.pagination.per_page),
         )
 
-        return PaginatedDTO[ArticleDTO](count=value_count, page=query.pagination.page, results=article_dto_list)
+    async def export_articles(self, query: ExportArticles, batch_size: int) -> AsyncIterator[list[ArticleDTO]]:
+        qs = self._qb.get_feed_qs(user_id=query.user_id, article_filter=query.articles_filter)
+        async for articles in self._base.stream(qs, batch_size):
+            yield await self._counter_buffer.merge(self._counters, convert_db_to_feed_dto_list(articles))
 
     async def get_specialization(self, query: "GetSpecializations") -> PaginatedDTO[SpecializationDTO]:
-        qs = self._qb.get_specialization_qs(name=query.name)
-        value_count = await self._base.count(qs)
-        qs = self._paginator.paginate(qs, query.pagination.page, query.pagination.per_page)
-
-        specializations = await self._base.fetch_all(qs)
-        if not specializations:
-            return PaginatedDTO[SpecializationDTO](count=value_count, page=query.pagination.page, results=[])
+        specializations = await self._dictionaries.get(Specialization.__table__, self._base)
+        if query.name:
+            search = query.name.casefold()
+            specializations = {id_: name for id_, name in specializations.items() if search in name.casefold()}
 
+        offset = self._paginator.get_offset(query.pagination.page, query.pagination.per_page)
+        page = itertools.islice(specializations.items(), offset, offset + query.pagination.per_page)
         return PaginatedDTO[SpecializationDTO](
-            count=value_count,
+            count=len(specializations),
             page=query.pagination.page,
-            results=[SpecializationDTO(name=spec.name, id=spec.id) for spec in specializations],
+            results=[SpecializationDTO(name=name, id=id_) for id_, name in page],
         )
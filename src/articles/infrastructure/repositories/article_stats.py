@@ -1,106 +1,109 @@
-import asyncio
-import contextlib
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import CTE, Select, delete, func, select
 from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.exc import IntegrityError
 
+from articles.application.dto.article import ReactionCountsDTO
 from articles.application.exceptions import (
+    ArticleIdNotExistError,
     DislikeAlreadyExistError,
     LikeAlreadyExistError,
     NothingToCancelError,
     ViewAlreadyExistError,
 )
+from articles.infrastructure.counters import ARTICLE_COUNTERS
 from articles.infrastructure.models import (
     Article,
     RelArticleUserDislike,
     RelArticleUserLike,
     RelArticleUserView,
 )
-from common.infrastructure.repositories.base import AlchemyReader, AlchemyRepo
+from common.infrastructure.adapters.counter_buffer import RedisCounterBuffer
+from common.infrastructure.repositories.base import AlchemyRepo
+
+type Reaction = type[RelArticleUserLike | RelArticleUserDislike | RelArticleUserView]
 
 
 class AlchemyArticleStatRepo:
+    """Article reactions.
+
+    Every reaction is a single statement: the relation row is inserted or deleted in a data-modifying CTE
+    and the same statement reads current counters of the article.
+    """
+
     _like = RelArticleUserLike
     _dislike = RelArticleUserDislike
     _view = RelArticleUserView
     _article = Article
+    _counters = ARTICLE_COUNTERS
 
-    def __init__(self, base: AlchemyRepo, reader: AlchemyReader) -> None:
+    def __init__(self, base: AlchemyRepo, counters: RedisCounterBuffer) -> None:
         self.base = base
-        self.reader = reader
+        self.counters = counters
 
-    async def cancel_dislike_article(self, article_id: UUID, user_id: UUID) -> None:
-        if not await self.reader.fetch_one(
-            select(self._dislike).where((self._dislike.article_id == article_id) & (self._dislike.user_id == user_id)),
-        ):
-            raise NothingToCancelError
-        await asyncio.gather(
-            self.base.execute(
-                update(self._article)
-                .values(dislikes_cnt=self._article.dislikes_cnt - 1)
-                .where(self._article.id == article_id),
-            ),
-            self.base.execute(
-                delete(self._dislike).where(
-                    (self._dislike.article_id == article_id) & (self._dislike.user_id == user_id)
-                ),
-            ),
+    def _get_reaction_qs(self, article_id: UUID, changed: CTE) -> Select[Any]:
+        return select(
+            select(func.count()).select_from(changed).scalar_subquery().label("changed"),
+            self._article.views_cnt,
+            self._article.likes_cnt,
+            self._article.dislikes_cnt,
+        ).where(self._article.id == article_id)
+
+    async def _react(self, article_id: UUID, changed: CTE, column_name: str, delta: int) -> ReactionCountsDTO | None:
+        """Execute reaction, return new counters or None if nothing changed."""
+        row = await self.base.fetch_one(self._get_reaction_qs(article_id, changed))
+        if row is None:
+            raise ArticleIdNotExistError(article_id)
+        if not row.changed:
+            return None
+        self.counters.incr(self.base.session, self._counters, article_id, column_name, delta)
+        values = await self.counters.get_values(self._counters, article_id, row, session=self.base.session)
+        return ReactionCountsDTO(**values)
+
+    def _add(self, reaction: Reaction, article_id: UUID, user_id: UUID) -> CTE:
+        return (
+            insert(reaction)
+            .values({"article_id": article_id, "user_id": user_id})
+            .on_conflict_do_nothing()
+            .returning(reaction.article_id)
+            .cte("changed")
         )
 
-    async def cancel_like_article(self, article_id: UUID, user_id: UUID) -> None:
-        if not await self.reader.fetch_one(
-            select(self._like).where((self._like.article_id == article_id) & (self._like.user_id == user_id)),
-        ):
-            raise NothingToCancelError
-        await asyncio.gather(
-            self.base.execute(
-                delete(self._like).where((self._like.article_id == article_id) & (self._like.user_id == user_id)),
-            ),
-            self.base.execute(
-                update(self._article)
-                .values(likes_cnt=self._article.likes_cnt - 1)
-                .where(self._article.id == article_id),
-            ),
+    def _remove(self, reaction: Reaction, article_id: UUID, user_id: UUID) -> CTE:
+        return (
+            delete(reaction)
+            .where((reaction.article_id == article_id) & (reaction.user_id == user_id))
+            .returning(reaction.article_id)
+            .cte("changed")
         )
 
-    async def like_article(self, article_id: UUID, user_id: UUID) -> None:
-        try:
-            await self.base.execute(
-                insert(self._like).values({"article_id": article_id, "user_id": user_id}),
-            )
-        except IntegrityError as e:
-            raise LikeAlreadyExistError from e
+    async def cancel_dislike_article(self, article_id: UUID, user_id: UUID) -> ReactionCountsDTO:
+        counts = await self._react(article_id, self._remove(self._dislike, article_id, user_id), "dislikes_cnt", -1)
+        if counts is None:
+            raise NothingToCancelError
+        return counts
 
-        await self.base.execute(
-            update(self._article).values(likes_cnt=self._article.likes_cnt + 1).where(self._article.id == article_id),
-        )
+    async def cancel_like_article(self, article_id: UUID, user_id: UUID) -> ReactionCountsDTO:
+        counts = await self._react(article_id, self._remove(self._like, article_id, user_id), "likes_cnt", -1)
+        if counts is None:
+            raise NothingToCancelError
+        return counts
 
-    async def dislike_article(self, article_id: UUID, user_id: UUID) -> None:
-        try:
-            await self.base.execute(
-                insert(self._dislike).values({"article_id": article_id, "user_id": user_id}),
-            )
-        except IntegrityError as e:
-            raise DislikeAlreadyExistError from e
-
-        await self.base.execute(
-            update(self._article)
-            .values(dislikes_cnt=self._article.dislikes_cnt + 1)
-            .where(self._article.id == article_id),
-        )
+    async def like_article(self, article_id: UUID, user_id: UUID) -> ReactionCountsDTO:
+        counts = await self._react(article_id, self._add(self._like, article_id, user_id), "likes_cnt", 1)
+        if counts is None:
+            raise LikeAlreadyExistError
+        return counts
+
+    async def dislike_article(self, article_id: UUID, user_id: UUID) -> ReactionCountsDTO:
+        counts = await self._react(article_id, self._add(self._dislike, article_id, user_id), "dislikes_cnt", 1)
+        if counts is None:
+            raise DislikeAlreadyExistError
+        return counts
 
-    async def view_article(self, article_id: UUID, user_id: UUID) -> None:
-        try:
-            await self.base.execute(
-                insert(self._view).values({"article_id": article_id, "user_id": user_id}),
-            )
-        except IntegrityError as e:
-            raise ViewAlreadyExistError from e
-        else:
-            await self.base.execute(
-                update(self._article)
-                .values(views_cnt=self._article.views_cnt + 1)
-                .where(self._article.id == article_id),
-            )
+    async def view_article(self, article_id: UUID, user_id: UUID) -> ReactionCountsDTO:
+        counts = await self._react(article_id, self._add(self._view, article_id, user_id), "views_cnt", 1)
+        if counts is None:
+            raise ViewAlreadyExistError
+        return counts
@@ -9,15 +9,18 @@ from articles.application.commands.create_comment import CreateComment
 from articles.application.commands.edit_comment import EditComment
 from articles.application.dto.article import (
     CommentDTO,
+    ReactionCountsDTO,
 )
 from articles.application.exceptions import CommentIdNotExistError
 from articles.application.ports.repo import CommentReader, CommentRepo
+from articles.infrastructure.counters import COMMENT_COUNTERS
 from articles.infrastructure.mapper import convert_db_to_comment_dto
 from articles.infrastructure.models import Comment, RelCommentUserDislike, RelCommentUserLike
 from articles.infrastructure.repositories.comment_stats import AlchemyCommentStatRepo
 from auth.infrastructure.models import User
 from common.application.dto import PaginatedDTO
 from common.application.query import PaginationParams
+from common.infrastructure.adapters.counter_buffer import CounterTable, RedisCounterBuffer
 from common.infrastructure.repositories.base import AlchemyReader, AlchemyRepo
 from common.infrastructure.repositories.pagination import AlchemyPaginator
 
@@ -44,17 +47,17 @@ class AlchemyCommentRepo(CommentRepo):
             update(self.comment).filter(self.comment.id == comment.id).values(text=comment.text),
         )
 
-    async def like_comment(self, comment_id: UUID, user_id: UUID) -> None:
-        await self._stat.like_comment(comment_id, user_id)
+    async def like_comment(self, comment_id: UUID, user_id: UUID) -> ReactionCountsDTO:
+        return await self._stat.like_comment(comment_id, user_id)
 
-    async def dislike_comment(self, comment_id: UUID, user_id: UUID) -> None:
-        await self._stat.dislike_comment(comment_id, user_id)
+    async def dislike_comment(self, comment_id: UUID, user_id: UUID) -> ReactionCountsDTO:
+        return await self._stat.dislike_comment(comment_id, user_id)
 
-    async def cancel_like_comment(self, comment_id: UUID, user_id: UUID) -> None:
-        await self._stat.cancel_like_comment(comment_id, user_id)
+    async def cancel_like_comment(self, comment_id: UUID, user_id: UUID) -> ReactionCountsDTO:
+        return await self._stat.cancel_like_comment(comment_id, user_id)
 
-    async def cancel_dislike_comment(self, comment_id: UUID, user_id: UUID) -> None:
-        await self._stat.cancel_dislike_comment(comment_id, user_id)
+    async def cancel_dislike_comment(self, comment_id: UUID, user_id: UUID) -> ReactionCountsDTO:
+        return await self._stat.cancel_dislike_comment(comment_id, user_id)
 
 
 @dataclass(slots=True)
@@ -66,8 +69,10 @@ class AlchemyCommentReader(CommentReader):
     _like: ClassVar[type[RelCommentUserLike]] = RelCommentUserLike
     _dislike: ClassVar[type[RelCommentUserDislike]] = RelCommentUserDislike
     _paginator: ClassVar[type[AlchemyPaginator]] = AlchemyPaginator
+    _counters: ClassVar[CounterTable] = COMMENT_COUNTERS
 
     _base: AlchemyReader
+    _counter_buffer: RedisCounterBuffer
 
     def get_comments_qs(self, user_id: UUID | None = None) -> Select[Any]:
         comment_authors_join = self._comment.__table__.join(
@@ -107,8 +112,8 @@ class AlchemyCommentReader(CommentReader):
         qs = self.get_comments_qs(user_id=user_id)
         qs = qs.where(self._comment.article_id == article_id)
 
-        value_count = await self._base.count(qs)
-        qs = self._paginator.paginate(qs, pagination.page, pagination.per_page)
+        value_count = await self._base.count(qs) if pagination.with_count else None
+        qs = self._paginator.paginate_keyset(qs, pagination, self._comment.created_at, self._comment.id)
         page_count = self._paginator.get_page_count(value_count, pagination.per_page)
 
         comments = await self._base.fetch_all(qs)
@@ -116,7 +121,11 @@ class AlchemyCommentReader(CommentReader):
         return PaginatedDTO[CommentDTO](
             count=page_count,
             page=pagination.page,
-            results=[convert_db_to_comment_dto(comment) for comment in comments],
+            results=await self._counter_buffer.merge(
+                self._counters,
+                [convert_db_to_comment_dto(comment) for comment in comments],
+            ),
+            next_cursor=self._paginator.get_next_cursor(comments, pagination.per_page),
         )
 
     async def get_comment_by_id(self, comment_id: UUID, user_id: UUID | None = None) -> CommentDTO:
@@ -126,4 +135,4 @@ class AlchemyCommentReader(CommentReader):
         if not comment:
             raise CommentIdNotExistError(comment_id)
 
-        return convert_db_to_comment_dto(comment)
+        return (await self._counter_buffer.merge(self._counters, [convert_db_to_comment_dto(comment)]))[0]
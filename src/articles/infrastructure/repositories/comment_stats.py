@@ -1,89 +1,95 @@
-import asyncio
-import contextlib
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import CTE, Select, delete, func, select
 from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.exc import IntegrityError
 
+from articles.application.dto.article import ReactionCountsDTO
 from articles.application.exceptions import (
+    CommentIdNotExistError,
     DislikeAlreadyExistError,
     LikeAlreadyExistError,
     NothingToCancelError,
 )
+from articles.infrastructure.counters import COMMENT_COUNTERS
 from articles.infrastructure.models import (
     Comment,
     RelCommentUserDislike,
     RelCommentUserLike,
 )
-from common.infrastructure.repositories.base import AlchemyReader, AlchemyRepo
+from common.infrastructure.adapters.counter_buffer import RedisCounterBuffer
+from common.infrastructure.repositories.base import AlchemyRepo
+
+type Reaction = type[RelCommentUserLike | RelCommentUserDislike]
 
 
 class AlchemyCommentStatRepo:
+    """Comment reactions, every reaction is a single statement like in `AlchemyArticleStatRepo`."""
+
     _like = RelCommentUserLike
     _dislike = RelCommentUserDislike
     _comment = Comment
+    _counters = COMMENT_COUNTERS
 
-    def __init__(self, base: AlchemyRepo, reader: AlchemyReader) -> None:
+    def __init__(self, base: AlchemyRepo, counters: RedisCounterBuffer) -> None:
         self.base = base
-        self.reader = reader
+        self.counters = counters
 
-    async def cancel_dislike_comment(self, comment_id: UUID, user_id: UUID) -> None:
-        if not await self.reader.fetch_one(
-            select(self._dislike).where((self._dislike.comment_id == comment_id) & (self._dislike.user_id == user_id)),
-        ):
-            raise NothingToCancelError
-        await asyncio.gather(
-            self.base.execute(
-                update(self._comment)
-                .values(dislikes_cnt=self._comment.dislikes_cnt - 1)
-                .where(self._comment.id == comment_id),
-            ),
-            self.base.execute(
-                delete(self._dislike).where(
-                    (self._dislike.comment_id == comment_id) & (self._dislike.user_id == user_id)
-                ),
-            ),
+    def _get_reaction_qs(self, comment_id: UUID, changed: CTE) -> Select[Any]:
+        return select(
+            select(func.count()).select_from(changed).scalar_subquery().label("changed"),
+            self._comment.like_cnt,
+            self._comment.dislikes_cnt,
+        ).where(self._comment.id == comment_id)
+
+    async def _react(self, comment_id: UUID, changed: CTE, column_name: str, delta: int) -> ReactionCountsDTO | None:
+        """Execute reaction, return new counters or None if nothing changed."""
+        row = await self.base.fetch_one(self._get_reaction_qs(comment_id, changed))
+        if row is None:
+            raise CommentIdNotExistError(comment_id)
+        if not row.changed:
+            return None
+        self.counters.incr(self.base.session, self._counters, comment_id, column_name, delta)
+        values = await self.counters.get_values(self._counters, comment_id, row, session=self.base.session)
+        return ReactionCountsDTO(**values)
+
+    def _add(self, reaction: Reaction, comment_id: UUID, user_id: UUID) -> CTE:
+        return (
+            insert(reaction)
+            .values({"comment_id": comment_id, "user_id": user_id})
+            .on_conflict_do_nothing()
+            .returning(reaction.comment_id)
+            .cte("changed")
         )
 
-    async def cancel_like_comment(self, comment_id: UUID, user_id: UUID) -> None:
-        if not await self.reader.fetch_one(
-            select(self._like).where((self._like.comment_id == comment_id) & (self._like.user_id == user_id)),
-        ):
-            raise NothingToCancelError
-        await asyncio.gather(
-            self.base.execute(
-                delete(self._like).where((self._like.comment_id == comment_id) & (self._like.user_id == user_id)),
-            ),
-            self.base.execute(
-                update(self._comment)
-                .values(like_cnt=self._comment.like_cnt - 1)
-                .where(self._comment.id == comment_id),
-            ),
+    def _remove(self, reaction: Reaction, comment_id: UUID, user_id: UUID) -> CTE:
+        return (
+            delete(reaction)
+            .where((reaction.comment_id == comment_id) & (reaction.user_id == user_id))
+            .returning(reaction.comment_id)
+            .cte("changed")
         )
 
-    async def like_comment(self, comment_id: UUID, user_id: UUID) -> None:
-        try:
-            await self.base.execute(
-                insert(self._like).values({"comment_id": comment_id, "user_id": user_id}),
-            )
-        except IntegrityError as e:
-            raise LikeAlreadyExistError from e
+    async def cancel_dislike_comment(self, comment_id: UUID, user_id: UUID) -> ReactionCountsDTO:
+        counts = await self._react(comment_id, self._remove(self._dislike, comment_id, user_id), "dislikes_cnt", -1)
+        if counts is None:
+            raise NothingToCancelError
+        return counts
 
-        await self.base.execute(
-            update(self._comment).values(like_cnt=self._comment.like_cnt + 1).where(self._comment.id == comment_id),
-        )
+    async def cancel_like_comment(self, comment_id: UUID, user_id: UUID) -> ReactionCountsDTO:
+        counts = await self._react(comment_id, self._remove(self._like, comment_id, user_id), "like_cnt", -1)
+        if counts is None:
+            raise NothingToCancelError
+        return counts
 
-    async def dislike_comment(self, comment_id: UUID, user_id: UUID) -> None:
-        try:
-            await self.base.execute(
-                insert(self._dislike).values({"comment_id": comment_id, "user_id": user_id}),
-            )
-        except IntegrityError as e:
-            raise DislikeAlreadyExistError from e
+    async def like_comment(self, comment_id: UUID, user_id: UUID) -> ReactionCountsDTO:
+        counts = await self._react(comment_id, self._add(self._like, comment_id, user_id), "like_cnt", 1)
+        if counts is None:
+            raise LikeAlreadyExistError
+        return counts
 
-        await self.base.execute(
-            update(self._comment)
-            .values(dislikes_cnt=self._comment.dislikes_cnt + 1)
-            .where(self._comment.id == comment_id),
-        )
+    async def dislike_comment(self, comment_id: UUID, user_id: UUID) -> ReactionCountsDTO:
+        counts = await self._react(comment_id, self._add(self._dislike, comment_id, user_id), "dislikes_cnt", 1)
+        if counts is None:
+            raise DislikeAlreadyExistError
+        return counts
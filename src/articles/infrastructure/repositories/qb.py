@@ -1,12 +1,16 @@
 from dataclasses import dataclass
+from functools import reduce
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import Select, exists, func, or_, select, true
+from sqlalchemy import ColumnElement, Select, Update, exists, func, literal_column, select, true, update
+from sqlalchemy.dialects.postgresql import Insert, aggregate_order_by, insert
 
 from articles.application.queries.get_articles import ArticleFilter
+from articles.domain.constants import ARTICLE_EXCERPT_LEN
 from articles.infrastructure.models import (
     Article,
+    ArticleFeed,
     ArticleImg,
     RelArticleTag,
     RelArticleUserDislike,
@@ -17,6 +21,9 @@ from articles.infrastructure.models import (
     Tag,
 )
 from auth.infrastructure.models import User
+from common.infrastructure.repositories.search import trgm_distance, trgm_match
+
+ARTICLE_SEARCH_CONFIG = "russian"  # maps ascii words to english stemmer, so mixed texts are stemmed too
 
 
 @dataclass
@@ -25,14 +32,13 @@ class TagFilters:
 
     def filter_qs(self, qs: Select[Any]) -> Select[Any]:
         if self.name:
-            qs = qs.where(Tag.name.ilike(f"%{self.name}%")).order_by(
-                func.similarity(Tag.name, self.name).desc(),
-            )
+            qs = qs.where(trgm_match(Tag.name, self.name)).order_by(trgm_distance(Tag.name, self.name))
         return qs
 
 
 class ArticleQueryBuilder:
     _article = Article
+    _feed = ArticleFeed
     _article_img = ArticleImg
     _author = User
     _sub_article = SubArticle
@@ -42,133 +48,290 @@ class ArticleQueryBuilder:
     _view = RelArticleUserView
     _tag = Tag
     _rel_tag_article = RelArticleTag
+    _search_config = literal_column(f"'{ARTICLE_SEARCH_CONFIG}'::regconfig")
+
+    @classmethod
+    def _weighted_vector(cls, document: ColumnElement[Any], weight: str) -> ColumnElement[Any]:
+        return func.setweight(
+            func.to_tsvector(cls._search_config, func.coalesce(document, "")),
+            literal_column(f"'{weight}'"),
+        )
+
+    @classmethod
+    def get_search_vector(cls) -> ColumnElement[Any]:
+        """Weighted document of article: title, sub-article titles and tags, text, sub-article texts."""
+        sub_article_titles = (
+            select(func.string_agg(cls._sub_article.title, " "))
+            .where(cls._sub_article.article_id == cls._article.id)
+            .scalar_subquery()
+        )
+        sub_article_texts = (
+            select(func.string_agg(cls._sub_article.text, " "))
+            .where(cls._sub_article.article_id == cls._article.id)
+            .scalar_subquery()
+        )
+        tag_names = (
+            select(func.string_agg(cls._tag.name, " "))
+            .join(cls._rel_tag_article.__table__, cls._rel_tag_article.tag_id == cls._tag.id)
+            .where(cls._rel_tag_article.article_id == cls._article.id)
+            .scalar_subquery()
+        )
+        vectors = (
+            cls._weighted_vector(cls._article.title, "A"),
+            cls._weighted_vector(sub_article_titles, "B"),
+            cls._weighted_vector(tag_names, "B"),
+            cls._weighted_vector(cls._article.text, "C"),
+            cls._weighted_vector(sub_article_texts, "D"),
+        )
+        return reduce(lambda left, right: left.op("||")(right), vectors)
+
+    @classmethod
+    def get_refresh_search_vector_qs(cls, article_id: UUID) -> Update:
+        return (
+            update(cls._article)
+            .values(search_vector=cls.get_search_vector())
+            .where(cls._article.id == article_id)
+            .execution_options(synchronize_session=False)
+        )
+
+    @classmethod
+    def _get_search_tsquery(cls, search: str) -> ColumnElement[Any]:
+        return func.websearch_to_tsquery(cls._search_config, search)
+
+    @classmethod
+    def get_tsquery(cls, article_filter: ArticleFilter) -> ColumnElement[Any] | None:
+        """Compile `search`, `include_words` and `exclude_words` into one tsquery.
+
+        `search && (include_1 || include_2 ...) && !!exclude_1 && !!exclude_2 ...`
+        """
+        tsqueries: list[ColumnElement[Any]] = []
+        if article_filter.search:
+            tsqueries.append(cls._get_search_tsquery(article_filter.search))
+        if article_filter.include_words:
+            tsqueries.append(
+                reduce(
+                    func.tsquery_or,
+                    (func.plainto_tsquery(cls._search_config, word) for word in article_filter.include_words),
+                ),
+            )
+        if article_filter.exclude_words:
+            tsqueries.extend(
+                func.tsquery_not(func.plainto_tsquery(cls._search_config, word))
+                for word in article_filter.exclude_words
+            )
+        if not tsqueries:
+            return None
+        return reduce(func.tsquery_and, tsqueries)
 
     @classmethod
     def _filter_article(cls, qs: Select[Any], article_filter: ArticleFilter) -> Select[Any]:
+        if (tsquery := cls.get_tsquery(article_filter)) is not None:
+            qs = qs.where(cls._feed.search_vector.op("@@")(tsquery))
         if search := article_filter.search:
-            search_qs = select(cls._sub_article.article_id).where(
-                cls._sub_article.title.ilike(f"%{search}%") | cls._sub_article.text.ilike(f"%{search}%")
-            )
-            search_filter = (
-                cls._article.title.ilike(f"%{search}%")
-                | cls._article.text.ilike(f"%{search}%")
-                | cls._article.id.in_(search_qs)
+            qs = qs.order_by(None).order_by(
+                func.ts_rank_cd(cls._feed.search_vector, cls._get_search_tsquery(search)).desc(),
+                cls._feed.created_at.desc(),
             )
-            qs = qs.where(search_filter)
-            qs = qs.order_by(cls._article.created_at.desc())
         if article_filter.liked_user_id:
             qs = qs.join(
                 cls._like.__table__,
-                (cls._article.id == cls._like.article_id) & (cls._like.user_id == article_filter.liked_user_id),
+                (cls._feed.id == cls._like.article_id) & (cls._like.user_id == article_filter.liked_user_id),
             )
         if article_filter.disliked_user_id:
             qs = qs.join(
                 cls._dislike.__table__,
-                (cls._article.id == cls._dislike.article_id)
-                & (cls._dislike.user_id == article_filter.disliked_user_id),
+                (cls._feed.id == cls._dislike.article_id) & (cls._dislike.user_id == article_filter.disliked_user_id),
             )
         if article_filter.viewed_user_id:
             qs = qs.join(
                 cls._view.__table__,
-                (cls._article.id == cls._view.article_id) & (cls._view.user_id == article_filter.viewed_user_id),
+                (cls._feed.id == cls._view.article_id) & (cls._view.user_id == article_filter.viewed_user_id),
             )
         if article_filter.specializations_id:
-            qs = qs.where(cls._article.specialization_id.in_(article_filter.specializations_id))
+            qs = qs.where(cls._feed.specialization_id.in_(article_filter.specializations_id))
         if article_filter.tags_id:
             tag_qs = select(cls._rel_tag_article.article_id).join(
                 cls._tag.__table__,
                 (cls._tag.id == cls._rel_tag_article.tag_id) & (cls._tag.id.in_(article_filter.tags_id)),
             )
-            qs = qs.where(cls._article.id.in_(tag_qs))
-        if article_filter.exclude_words:
-            for word in article_filter.exclude_words:
-                qs = qs.where(cls._article.title.not_ilike(f"%{word}%"))
-                qs = qs.where(cls._article.text.not_ilike(f"%{word}%"))
-                qs = qs.where(
-                    cls._article.id.in_(
-                        select(cls._sub_article.article_id)
-                        .where(cls._sub_article.text.not_ilike(f"%{word}%"))
-                        .where(cls._sub_article.title.not_ilike(f"%{word}%")),
-                    ),
-                )
-        if article_filter.include_words:
-            conditions = [
-                cls._article.title.ilike(f"%{word}%")
-                | cls._article.text.ilike(f"%{word}%")
-                | cls._article.id.in_(
-                    select(cls._sub_article.article_id).where(
-                        cls._sub_article.text.ilike(f"%{word}%") | cls._sub_article.title.ilike(f"%{word}%"),
-                    )
-                )
-                for word in article_filter.include_words
-            ]
-            qs = qs.where(or_(*conditions))
+            qs = qs.where(cls._feed.id.in_(tag_qs))
         return qs
 
     @classmethod
-    def get_articles_qs(cls, user_id: UUID | None = None, article_filter: ArticleFilter | None = None) -> Select[Any]:
-        article_authors_join = cls._article.__table__.join(
-            cls._author.__table__,
-            cls._article.author_id == cls._author.id,
-        ).outerjoin(cls._specialization.__table__, cls._article.specialization_id == cls._specialization.id)
+    def _get_reaction_columns(
+        cls,
+        user_id: UUID | None = None,
+        source: type[Article | ArticleFeed] = Article,
+    ) -> tuple[ColumnElement[bool], ...]:
         is_liked_subq = select(
-            exists()
-            .where(cls._like.article_id == cls._article.id, cls._like.user_id == user_id)
-            .correlate(cls._article),
+            exists().where(cls._like.article_id == source.id, cls._like.user_id == user_id).correlate(source),
         ).scalar_subquery()
 
         is_disliked_subq = select(
-            exists()
-            .where(cls._dislike.article_id == cls._article.id, cls._dislike.user_id == user_id)
-            .correlate(cls._article),
+            exists().where(cls._dislike.article_id == source.id, cls._dislike.user_id == user_id).correlate(source),
         ).scalar_subquery()
 
         is_viewed_subq = select(
-            exists()
-            .where(cls._view.article_id == cls._article.id, cls._view.user_id == user_id)
-            .correlate(cls._article),
+            exists().where(cls._view.article_id == source.id, cls._view.user_id == user_id).correlate(source),
         ).scalar_subquery()
 
-        qs = (
+        return (
+            is_liked_subq.label("is_liked"),
+            is_disliked_subq.label("is_disliked"),
+            is_viewed_subq.label("is_viewed"),
+        )
+
+    @classmethod
+    def _get_author_columns(cls) -> tuple[ColumnElement[Any], ...]:
+        return (
+            cls._author.nickname.label("author_nickname"),
+            cls._author.name.label("author_name"),
+            cls._author.lastname.label("author_lastname"),
+            cls._author.patronymic.label("author_patronymic"),
+            cls._author.image.label("author_img"),
+            cls._author.rating.label("author_rating"),
+        )
+
+    @classmethod
+    def get_article_reaction_qs(cls, article_id: UUID, user_id: UUID | None = None) -> Select[Any]:
+        """Counters, author and reaction of user, everything of article detail which isn't cached."""
+        return (
             select(
-                cls._article.__table__,
-                cls._author.nickname.label("author_nickname"),
-                cls._author.name.label("author_name"),
-                cls._author.lastname.label("author_lastname"),
-                cls._author.patronymic.label("author_patronymic"),
-                cls._author.image.label("author_img"),
-                cls._author.rating.label("author_rating"),
+                cls._article.views_cnt,
+                cls._article.likes_cnt,
+                cls._article.dislikes_cnt,
+                cls._article.author_id,
+                *cls._get_author_columns(),
+                *cls._get_reaction_columns(user_id),
+            )
+            .join(cls._author, cls._article.author_id == cls._author.id)
+            .where(cls._article.id == article_id)
+        )
+
+    @classmethod
+    def get_articles_qs(cls, user_id: UUID | None = None) -> Select[Any]:
+        article_authors_join = cls._article.__table__.join(
+            cls._author.__table__,
+            cls._article.author_id == cls._author.id,
+        ).outerjoin(cls._specialization.__table__, cls._article.specialization_id == cls._specialization.id)
+
+        return (
+            select(
+                *(column for column in cls._article.__table__.c if column.key != "search_vector"),
+                *cls._get_author_columns(),
                 cls._specialization.name.label("specialization_name"),
-                is_liked_subq.label("is_liked"),
-                is_disliked_subq.label("is_disliked"),
-                is_viewed_subq.label("is_viewed"),
+                *cls._get_reaction_columns(user_id),
             )
             .select_from(article_authors_join)
             .order_by(cls._article.created_at.desc())
         )
 
+    @classmethod
+    def get_feed_qs(cls, user_id: UUID | None = None, article_filter: ArticleFilter | None = None) -> Select[Any]:
+        """Article list from the feed read model, only author rating and reactions of user are read on list."""
+        author_rating = select(cls._author.rating).where(cls._author.id == cls._feed.author_id).scalar_subquery()
+        qs = select(
+            *(column for column in cls._feed.__table__.c if column.key not in {"search_vector", "updated_at"}),
+            author_rating.label("author_rating"),
+            *cls._get_reaction_columns(user_id, cls._feed),
+        ).order_by(cls._feed.created_at.desc())
+
         if article_filter:
             qs = cls._filter_article(qs=qs, article_filter=article_filter)
 
         return qs
 
     @classmethod
-    def get_img_urls_qs(cls, article_ids: set[UUID] | None = None) -> Select[Any]:
-        query = select(cls._article_img.url)
-        if article_ids:
-            query = query.where(cls._article_img.article_id.in_(article_ids))
-        return query
+    def get_refresh_feed_qs(cls, article_id: UUID) -> Insert:
+        """Upsert feed row of article from its current state, counters are copied only into the new row."""
+        tags = (
+            select(
+                func.coalesce(
+                    func.jsonb_agg(
+                        aggregate_order_by(
+                            func.jsonb_build_object("id", cls._tag.id, "name", cls._tag.name),
+                            cls._tag.name,
+                        ),
+                    ),
+                    literal_column("'[]'::jsonb"),
+                ),
+            )
+            .join(cls._rel_tag_article.__table__, cls._rel_tag_article.tag_id == cls._tag.id)
+            .where(cls._rel_tag_article.article_id == cls._article.id)
+            .scalar_subquery()
+        )
+        imgs = (
+            select(
+                func.coalesce(
+                    func.array_agg(aggregate_order_by(cls._article_img.url, cls._article_img.created_at)),
+                    literal_column("'{}'::text[]"),
+                ),
+            )
+            .where(cls._article_img.article_id == cls._article.id)
+            .scalar_subquery()
+        )
+        source = (
+            select(
+                cls._article.id,
+                cls._article.title,
+                func.left(cls._article.text, ARTICLE_EXCERPT_LEN).label("excerpt"),
+                cls._article.is_visible,
+                cls._article.author_id,
+                cls._author.nickname.label("author_nickname"),
+                cls._author.name.label("author_name"),
+                cls._author.lastname.label("author_lastname"),
+                cls._author.patronymic.label("author_patronymic"),
+                cls._author.image.label("author_img"),
+                cls._article.specialization_id,
+                cls._specialization.name.label("specialization_name"),
+                tags.label("tags"),
+                imgs.label("imgs"),
+                cls._article.views_cnt,
+                cls._article.likes_cnt,
+                cls._article.dislikes_cnt,
+                cls._article.search_vector,
+                cls._article.created_at,
+            )
+            .join(cls._author.__table__, cls._article.author_id == cls._author.id)
+            .outerjoin(cls._specialization.__table__, cls._article.specialization_id == cls._specialization.id)
+            .where(cls._article.id == article_id)
+        )
+        qs = insert(cls._feed).from_select([column.name for column in source.selected_columns], source)
+        return qs.on_conflict_do_update(
+            index_elements=[cls._feed.id],
+            set_={
+                **{
+                    column.name: qs.excluded[column.name]
+                    for column in source.selected_columns
+                    if column.name not in {"id", "views_cnt", "likes_cnt", "dislikes_cnt", "created_at"}
+                },
+                "updated_at": func.now(),
+            },
+        )
 
     @classmethod
-    def get_img_qs(cls, article_ids: set[UUID] | None = None) -> Select[Any]:
-        query = select(cls._article_img.__table__)
+    def get_refresh_feed_authors_qs(cls, user_filters: dict[str, Any]) -> Update:
+        """Copy profile of users matching filters into feed rows of their articles."""
+        return (
+            update(cls._feed)
+            .where(
+                cls._feed.author_id == cls._author.id,
+                *(cls._author.__table__.c[key] == value for key, value in user_filters.items()),
+            )
+            .values(
+                author_nickname=cls._author.nickname,
+                author_name=cls._author.name,
+                author_lastname=cls._author.lastname,
+                author_patronymic=cls._author.patronymic,
+                author_img=cls._author.image,
+                updated_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    @classmethod
+    def get_img_urls_qs(cls, article_ids: set[UUID] | None = None) -> Select[Any]:
+        query = select(cls._article_img.url)
         if article_ids:
             query = query.where(cls._article_img.article_id.in_(article_ids))
         return query
-
-    @classmethod
-    def get_specialization_qs(cls, name: str | None = None) -> Select[Any]:
-        qs = select(cls._specialization.__table__)
-        if name:
-            qs = qs.where(cls._specialization.name.ilike(f"%{name}%"))
-        return qs
@@ -1,4 +1,3 @@
-import asyncio
 from collections.abc import Iterable, Sequence
 from uuid import UUID
 
@@ -9,6 +8,7 @@ from articles.application.dto.article import (
     SubArticleDTO,
     SubArticleWithArticleIdDTO,
 )
+from articles.infrastructure.cache import RedisArticleCache
 from articles.infrastructure.mapper import convert_db_to_sub_article_dto_list
 from articles.infrastructure.models import SubArticle, SubArticleImg
 from common.infrastructure.repositories.base import AlchemyReader, AlchemyRepo
@@ -20,8 +20,9 @@ class AlchemySubArticleRepo:
     sub_article = SubArticle
     sub_article_img = SubArticleImg
 
-    def __init__(self, base: AlchemyRepo) -> None:
+    def __init__(self, base: AlchemyRepo, cache: RedisArticleCache) -> None:
         self.base = base
+        self.cache = cache
 
     async def create_sub_article_imgs(self, sub_article_id: UUID, imgs: list[str]) -> None:
         await self.base.execute(
@@ -41,12 +42,15 @@ class AlchemySubArticleRepo:
             ),
         )
 
-        await asyncio.gather(*(self.create_sub_article_imgs(dto.id, dto.imgs) for dto in sub_articles if dto.imgs))
+        for dto in sub_articles:
+            if dto.imgs:
+                await self.create_sub_article_imgs(dto.id, dto.imgs)
 
     async def delete_sub_articles(self, article_id: UUID) -> None:
         await self.base.execute(delete(self.sub_article).filter(self.sub_article.article_id == article_id))
 
     async def update_sub_articles(self, article_id: UUID, sub_articles: list[SubArticleDTO]) -> None:
+        self.cache.invalidate(self.base.session, article_id)
         await self.delete_sub_articles(article_id)
         await self.create_sub_articles(article_id=article_id, sub_articles=sub_articles)
 
@@ -1,4 +1,3 @@
-import asyncio
 from typing import Any
 from uuid import UUID
 
@@ -8,6 +7,7 @@ from sqlalchemy.dialects.postgresql import insert
 from articles.application.dto.article import TagDTO
 from articles.application.ports.repo import ArticleReader, ArticleRepo
 from articles.application.queries.get_tag_list import GetTagList
+from articles.infrastructure.cache import RedisArticleCache
 from articles.infrastructure.mapper import convert_db_to_tag_dto
 from articles.infrastructure.models import RelArticleTag, Tag
 from articles.infrastructure.repositories.qb import TagFilters
@@ -22,8 +22,9 @@ class AlchemyTagRepo:
     tag = Tag
     rel_article_tag = RelArticleTag
 
-    def __init__(self, base: AlchemyRepo) -> None:
+    def __init__(self, base: AlchemyRepo, cache: RedisArticleCache) -> None:
         self.base = base
+        self.cache = cache
 
     async def create_tags_if_not_exists(self, tags: list[TagDTO]) -> None:
         await self.base.execute(
@@ -41,9 +42,8 @@ class AlchemyTagRepo:
         await self.base.execute(delete(self.rel_article_tag).filter(self.rel_article_tag.article_id == article_id))
 
     async def update_article_tags(self, article_id: UUID, tags: list[TagDTO]) -> None:
-        await asyncio.gather(
-            self.unmap_tags_from_article(article_id),
-        )
+        self.cache.invalidate(self.base.session, article_id)
+        await self.unmap_tags_from_article(article_id)
         await self.create_tags_if_not_exists(tags)
         await self.map_tags_to_article({dto.id for dto in tags}, article_id)
 
@@ -1,4 +1,6 @@
-from dishka import Provider, Scope, provide  # type: ignore
+from collections.abc import AsyncIterable, Iterable
+
+from dishka import AnyOf, Provider, Scope, provide  # type: ignore
 
 from auth.application.commands.forget_password import ForgetPasswordHandler
 from auth.application.commands.login import LoginHandler
@@ -12,6 +14,7 @@ from auth.application.commands.verify_email import VerifyEmailHandler
 from auth.application.ports.jwt import JWTManager
 from auth.application.ports.pwd_manager import IPasswordManager
 from auth.application.ports.repo import AuthReader, AuthRepo, VerifyCodeRepo
+from auth.infrastructure.adapters.jwt_cache import PemKeyStore, VerifiedTokenCache
 from auth.infrastructure.adapters.jwt_manager import PyJWTManager
 from auth.infrastructure.adapters.pwd_manager import PasswordManager
 from auth.infrastructure.repositories import (
@@ -20,7 +23,7 @@ from auth.infrastructure.repositories import (
     RedisVerifyCodeRepo,
 )
 from common.application.ports.email_sender import IEmailSender
-from common.infrastructure.adapters.email_sender import EmailSender
+from common.infrastructure.adapters.email_sender import EmailDeliveryWorker, EmailSender
 from config import Settings
 from users.application.ports.repo import UserReader, UserRepo
 from users.infrastructure.repositories.user import AlchemyUserReader, AlchemyUserRepo
@@ -29,7 +32,7 @@ from users.infrastructure.repositories.user import AlchemyUserReader, AlchemyUse
 class AuthProvider(Provider):
     scope = Scope.REQUEST
 
-    @provide
+    @provide(scope=Scope.APP)
     def provide_jwt_manager(self, config: Settings) -> JWTManager:
         auth_config = config.app.auth
         return PyJWTManager(
@@ -40,6 +43,11 @@ class AuthProvider(Provider):
             refresh_private_path=auth_config.REFRESH_PRIVATE_PATH,
             refresh_public_path=auth_config.REFRESH_PUBLIC_PATH,
             refresh_token_expire=auth_config.REFRESH_TOKEN_EXPIRE,
+            key_store=PemKeyStore(reload_interval=auth_config.KEY_RELOAD_INTERVAL),
+            token_cache=VerifiedTokenCache(
+                maxsize=auth_config.VERIFIED_TOKEN_CACHE_SIZE,
+                max_ttl=auth_config.VERIFIED_TOKEN_CACHE_TTL,
+            ),
         )
 
     auth_repo = provide(AlchemyAuthRepo, provides=AuthRepo)
@@ -48,8 +56,22 @@ class AuthProvider(Provider):
     user_reader = provide(AlchemyUserReader, provides=UserReader)
     user_repo = provide(AlchemyUserRepo, provides=UserRepo)
 
-    pwd_manager = provide(PasswordManager, provides=IPasswordManager)
-    email_sender = provide(EmailSender, provides=IEmailSender)
+    @provide(scope=Scope.APP)
+    def provide_pwd_manager(self, config: Settings) -> Iterable[AnyOf[IPasswordManager, PasswordManager]]:
+        auth_config = config.app.auth
+        pwd_manager = PasswordManager(
+            rounds=auth_config.BCRYPT_ROUNDS,
+            max_workers=auth_config.PASSWORD_HASH_WORKERS,
+        )
+        yield pwd_manager
+        pwd_manager.close()
+
+    @provide(scope=Scope.APP)
+    async def provide_email_sender(self, config: Settings) -> AsyncIterable[IEmailSender]:
+        worker = EmailDeliveryWorker(config.email)
+        worker.start()
+        yield EmailSender(worker)
+        await worker.stop()
 
     login_handler = provide(LoginHandler)
     signup_handler = provide(SignUpHandler)
@@ -7,7 +7,7 @@ from auth.application.ports.repo import AuthRepo
 from auth.domain.value_objects.jwt import JWTPair
 from common.application.command import Command, CommandHandler
 from common.application.uow import UnitOfWork
-from users.application.ports.repo import UserReader
+from users.application.ports.repo import UserReader, UserRepo
 from users.domain.value_objects.email import Email
 from users.domain.value_objects.password import Password
 
@@ -23,16 +23,20 @@ class LoginHandler(CommandHandler[Login, JWTPair]):
     uow: UnitOfWork
     auth_repo: AuthRepo
     user_reader: UserReader
+    user_repo: UserRepo
     pwd_manager: IPasswordManager
     jwt_manager: JWTManager
 
     async def __call__(self, command: Login) -> JWTPair:
         user = await self.user_reader.get_user_by_email(email=Email(command.email).to_base())
-        if not self.pwd_manager.verify_password(
-            password=Password(command.password).to_base(),
-            hash_password=user.password,
-        ):
+        password = Password(command.password).to_base()
+        if not await self.pwd_manager.verify_password(password=password, hash_password=user.password):
             raise InvalidCredentialsError
+        if self.pwd_manager.needs_rehash(user.password):
+            await self.user_repo.update_user(
+                values={"password": await self.pwd_manager.hash_password(password)},
+                filters={"id": user.id},
+            )
         jwt = self.jwt_manager.create_pair(payload={"sub": str(user.id), "email": command.email})
         await self.auth_repo.refresh_jwt(jwt=jwt, user_id=user.id)
         await self.uow.commit()
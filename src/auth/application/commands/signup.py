@@ -35,7 +35,7 @@ class SignUpHandler(CommandHandler[SignUp, JWTPair]):
             raise UserEmailAlreadyExistError(command.email)
         user = User(
             email=Email(command.email),
-            password=self._pwd_manager.hash_password(Password(command.password).to_base()),
+            password=await self._pwd_manager.hash_password(Password(command.password).to_base()),
             nickname=Nickname(command.nickname),
         )
         jwt = self._jwt_manager.create_pair(payload={"sub": str(user.id), "email": command.email})
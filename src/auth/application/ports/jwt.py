@@ -17,26 +17,32 @@ class JWTManager(ABC):
     refresh_token_expire: int
 
     @abstractmethod
-    def _encode_jwt(self, payload: dict[str, Any], expire_minutes: int, key: str) -> str: ...
+    def _encode_jwt(self, payload: dict[str, Any], expire_minutes: int, key: Any) -> str: ...  # noqa: ANN401
 
     @abstractmethod
-    def _decode_jwt(self, token: str, key: str) -> dict[str, Any]: ...
+    def _decode_jwt(self, token: str, key: Any) -> dict[str, Any]: ...  # noqa: ANN401
+
+    @abstractmethod
+    def _get_signing_key(self, path: Path) -> Any: ...  # noqa: ANN401
+
+    @abstractmethod
+    def _get_verifying_key(self, path: Path) -> Any: ...  # noqa: ANN401
 
     def create_pair(self, payload: dict[str, Any]) -> JWTPair:
         access_token = self._encode_jwt(
             payload=payload,
             expire_minutes=self.access_token_expire,
-            key=self.access_private_path.read_text(),
+            key=self._get_signing_key(self.access_private_path),
         )
         refresh_token = self._encode_jwt(
             payload=payload,
             expire_minutes=self.refresh_token_expire,
-            key=self.refresh_private_path.read_text(),
+            key=self._get_signing_key(self.refresh_private_path),
         )
         return JWTPair(access_token, refresh_token)
 
     def decode_refresh(self, refresh_token: str) -> dict[str, Any]:
-        return self._decode_jwt(token=refresh_token, key=self.refresh_public_path.read_text())
+        return self._decode_jwt(token=refresh_token, key=self._get_verifying_key(self.refresh_public_path))
 
     def decode_access(self, access_token: str) -> dict[str, Any]:
-        return self._decode_jwt(token=access_token, key=self.access_public_path.read_text())
+        return self._decode_jwt(token=access_token, key=self._get_verifying_key(self.access_public_path))
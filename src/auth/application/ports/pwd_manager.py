@@ -2,11 +2,11 @@ from typing import Protocol
 
 
 class IPasswordManager(Protocol):
-    @staticmethod
-    def hash_password(password: str) -> bytes: ...
+    async def hash_password(self, password: str) -> bytes: ...
 
-    @staticmethod
-    def verify_password(password: str, hash_password: bytes) -> bool: ...
+    async def verify_password(self, password: str, hash_password: bytes) -> bool: ...
+
+    def needs_rehash(self, hash_password: bytes) -> bool: ...
 
     @staticmethod
     def get_random_num(length: int = 6) -> str: ...
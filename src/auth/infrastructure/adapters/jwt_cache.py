@@ -0,0 +1,83 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from cryptography.hazmat.primitives.serialization import load_pem_private_key, load_pem_public_key
+
+
+@dataclass(slots=True)
+class _KeyEntry:
+    key: Any
+    mtime_ns: int
+    checked_at: float
+
+
+class PemKeyStore:
+    """Parsed PEM keys, reloaded when key file changes.
+
+    File mtime is checked at most once per `reload_interval` seconds.
+    """
+
+    def __init__(self, reload_interval: float) -> None:
+        self._reload_interval = reload_interval
+        self._keys: dict[Path, _KeyEntry] = {}
+
+    def _get(self, path: Path, loader: Callable[[bytes], Any]) -> Any:  # noqa: ANN401
+        now = time.monotonic()
+        entry = self._keys.get(path)
+        if entry and now - entry.checked_at < self._reload_interval:
+            return entry.key
+
+        mtime_ns = path.stat().st_mtime_ns
+        if entry and entry.mtime_ns == mtime_ns:
+            entry.checked_at = now
+            return entry.key
+
+        key = loader(path.read_bytes())
+        self._keys[path] = _KeyEntry(key=key, mtime_ns=mtime_ns, checked_at=now)
+        return key
+
+    def get_private_key(self, path: Path) -> Any:  # noqa: ANN401
+        return self._get(path, lambda data: load_pem_private_key(data, password=None))
+
+    def get_public_key(self, path: Path) -> Any:  # noqa: ANN401
+        return self._get(path, load_pem_public_key)
+
+    def get_secret(self, path: Path) -> Any:  # noqa: ANN401
+        return self._get(path, bytes)
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of verified token payloads, entry lives until `exp` of token or `max_ttl`."""
+
+    def __init__(self, maxsize: int, max_ttl: float) -> None:
+        self._maxsize = maxsize
+        self._max_ttl = max_ttl
+        self._data: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        if not (item := self._data.get(token)):
+            return None
+        expire_at, payload = item
+        if expire_at <= time.time():
+            self._data.pop(token, None)
+            return None
+        self._data.move_to_end(token)
+        return payload
+
+    def set(self, token: str, payload: dict[str, Any]) -> None:
+        if self._maxsize <= 0:
+            return
+        expire_at = time.time() + self._max_ttl
+        if (exp := payload.get("exp")) is not None:
+            expire_at = min(expire_at, float(exp))
+        self._data[token] = (expire_at, payload)
+        self._data.move_to_end(token)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
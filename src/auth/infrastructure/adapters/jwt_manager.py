@@ -1,15 +1,30 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from typing import Any
 
 import jwt
 
 from auth.application.ports.jwt import JWTManager
+from auth.infrastructure.adapters.jwt_cache import PemKeyStore, VerifiedTokenCache
 
 
 @dataclass(slots=True)
 class PyJWTManager(JWTManager):
-    def _encode_jwt(self, payload: dict[str, Any], expire_minutes: int, key: str) -> str:
+    key_store: PemKeyStore = field(default_factory=lambda: PemKeyStore(reload_interval=5))
+    token_cache: VerifiedTokenCache = field(default_factory=lambda: VerifiedTokenCache(maxsize=0, max_ttl=0))
+    _access_key: Any = field(default=None, init=False)
+
+    def _is_symmetric(self) -> bool:
+        return self.jwt_alg.startswith("HS")
+
+    def _get_signing_key(self, path: Path) -> Any:  # noqa: ANN401
+        return self.key_store.get_secret(path) if self._is_symmetric() else self.key_store.get_private_key(path)
+
+    def _get_verifying_key(self, path: Path) -> Any:  # noqa: ANN401
+        return self.key_store.get_secret(path) if self._is_symmetric() else self.key_store.get_public_key(path)
+
+    def _encode_jwt(self, payload: dict[str, Any], expire_minutes: int, key: Any) -> str:  # noqa: ANN401
         to_encode = payload.copy()
         now = datetime.now(tz=UTC)
         expire = now + timedelta(minutes=expire_minutes)
@@ -19,5 +34,17 @@ class PyJWTManager(JWTManager):
         )
         return jwt.encode(payload=to_encode, key=key, algorithm=self.jwt_alg)
 
-    def _decode_jwt(self, token: str, key: str) -> dict[str, Any]:
+    def _decode_jwt(self, token: str, key: Any) -> dict[str, Any]:  # noqa: ANN401
         return jwt.decode(jwt=token, key=key, algorithms=[self.jwt_alg])
+
+    def decode_access(self, access_token: str) -> dict[str, Any]:
+        key = self._get_verifying_key(self.access_public_path)
+        if key is not self._access_key:
+            # tokens verified by previous key must be verified again
+            self.token_cache.clear()
+            self._access_key = key
+
+        if (payload := self.token_cache.get(access_token)) is None:
+            payload = self._decode_jwt(token=access_token, key=key)
+            self.token_cache.set(access_token, payload)
+        return payload.copy()
@@ -1,5 +1,9 @@
+import asyncio
 import random
 import string
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 import bcrypt
 
@@ -8,17 +12,74 @@ from auth.application.ports import pwd_manager
 NUM = string.digits
 
 
+@dataclass(frozen=True, slots=True)
+class PasswordHasherStats:
+    workers: int
+    in_flight: int
+    queue_depth: int
+    max_queue_depth: int
+    completed: int
+
+
 class PasswordManager(pwd_manager.IPasswordManager):
-    @staticmethod
-    def hash_password(password: str) -> bytes:
-        salt = bcrypt.gensalt()
-        password_b: bytes = password.encode()
-        return bcrypt.hashpw(password_b, salt)
+    """Bcrypt password manager.
 
-    @staticmethod
-    def verify_password(password: str, hash_password: bytes) -> bool:
-        return bcrypt.checkpw(password=password.encode(), hashed_password=hash_password)
+    Hashing runs in a dedicated thread pool (bcrypt releases the GIL), so it doesn't block the event loop.
+    At most `max_workers` hashes run at once, the rest wait in the queue.
+    """
+
+    def __init__(self, rounds: int = 12, max_workers: int = 4) -> None:
+        self._rounds = rounds
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._semaphore = asyncio.Semaphore(max_workers)
+        self._in_flight = 0
+        self._queue_depth = 0
+        self._max_queue_depth = 0
+        self._completed = 0
+
+    async def _run[T](self, func: Callable[..., T], *args: object) -> T:
+        self._queue_depth += 1
+        self._max_queue_depth = max(self._max_queue_depth, self._queue_depth)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queue_depth -= 1
+
+        self._in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+            self._semaphore.release()
+
+    async def hash_password(self, password: str) -> bytes:
+        return await self._run(bcrypt.hashpw, password.encode(), bcrypt.gensalt(rounds=self._rounds))
+
+    async def verify_password(self, password: str, hash_password: bytes) -> bool:
+        return await self._run(bcrypt.checkpw, password.encode(), hash_password)
+
+    def needs_rehash(self, hash_password: bytes) -> bool:
+        # bcrypt hash layout: $2b$<cost>$<salt+hash>
+        try:
+            return int(hash_password.split(b"$")[2]) != self._rounds
+        except (IndexError, ValueError):
+            return True
 
     @staticmethod
     def get_random_num(length: int = 6) -> str:
         return "".join(random.choices(NUM, k=length))  # noqa: S311
+
+    @property
+    def stats(self) -> PasswordHasherStats:
+        return PasswordHasherStats(
+            workers=self._max_workers,
+            in_flight=self._in_flight,
+            queue_depth=self._queue_depth,
+            max_queue_depth=self._max_queue_depth,
+            completed=self._completed,
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
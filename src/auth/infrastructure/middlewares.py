@@ -23,9 +23,8 @@ class JWTAuthMiddleware(AbstractAuthenticationMiddleware):
         token = auth_header.split(" ")[-1]
 
         try:
-            async with container() as request_container:
-                jwt_manager = await request_container.get(JWTManager)
-                payload = jwt_manager.decode_access(token)
+            jwt_manager = await container.get(JWTManager)
+            payload = jwt_manager.decode_access(token)
 
             user = JWTUserPayload(sub=payload["sub"], email=payload["email"])
         except KeyError as e:
@@ -4,6 +4,7 @@ from typing import Any
 from litestar import Request, Response, status_codes
 
 from auth.application.exceptions import UnAuthorizedError
+from common.application.exceptions import InvalidCursorError
 from common.domain.exceptions import AppError, UnexpectedError, ValueObjectError
 
 
@@ -21,4 +22,5 @@ exception_handler: dict[type[AppError], Callable[[Request[Any, Any, Any], AppErr
     ValueObjectError: error_handler(status_codes.HTTP_422_UNPROCESSABLE_ENTITY),
     UnexpectedError: error_handler(status_codes.HTTP_500_INTERNAL_SERVER_ERROR),
     UnAuthorizedError: error_handler(status_codes.HTTP_401_UNAUTHORIZED),
+    InvalidCursorError: error_handler(status_codes.HTTP_400_BAD_REQUEST),
 }
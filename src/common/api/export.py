@@ -0,0 +1,98 @@
+import csv
+import dataclasses
+import io
+import types
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from enum import Enum
+from typing import Any, get_args, get_type_hints
+
+import msgspec
+from litestar.response import Stream
+
+from common.application.dto import DTO
+
+CSV_LIST_SEPARATOR = ";"
+
+
+class ExportFormat(str, Enum):
+    JSONL = "jsonl"
+    CSV = "csv"
+
+
+_MEDIA_TYPES = {
+    ExportFormat.JSONL: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def _get_nested_dto(annotation: object) -> type[DTO] | None:
+    """Dataclass of `X` or `X | None` annotation."""
+    if isinstance(annotation, types.UnionType):
+        return next((arg for arg in get_args(annotation) if dataclasses.is_dataclass(arg)), None)
+    return annotation if dataclasses.is_dataclass(annotation) else None
+
+
+def _get_columns(dto_type: type[DTO]) -> list[tuple[str, ...]]:
+    """Paths to values of DTO fields, nested DTOs are flattened into their fields."""
+    hints = get_type_hints(dto_type)
+    columns: list[tuple[str, ...]] = []
+    for field in dataclasses.fields(dto_type):
+        if (nested := _get_nested_dto(hints[field.name])) is not None:
+            columns.extend((field.name, *path) for path in _get_columns(nested))
+        else:
+            columns.append((field.name,))
+    return columns
+
+
+def _get_csv_value(row: dict[str, Any], path: tuple[str, ...]) -> object:
+    value: Any = row
+    for key in path:
+        if value is None:
+            return None
+        value = value[key]
+    if isinstance(value, list) and all(not isinstance(item, dict | list) for item in value):
+        return CSV_LIST_SEPARATOR.join(str(item) for item in value)
+    if isinstance(value, dict | list):
+        return msgspec.json.encode(value).decode()
+    return value
+
+
+async def _encode_jsonl(batches: AsyncIterable[Sequence[DTO]]) -> AsyncIterator[bytes]:
+    encoder = msgspec.json.Encoder()
+    async for batch in batches:
+        yield encoder.encode_lines(batch)
+
+
+async def _encode_csv(batches: AsyncIterable[Sequence[DTO]], dto_type: type[DTO]) -> AsyncIterator[bytes]:
+    columns = _get_columns(dto_type)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # trailing underscore of `from_` like fields is dropped from column names, e.g. `salary_from`
+    writer.writerow("_".join(path).rstrip("_") for path in columns)
+    async for batch in batches:
+        for item in batch:
+            row = msgspec.to_builtins(item)
+            writer.writerow(_get_csv_value(row, path) for path in columns)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def export_response(
+    batches: AsyncIterable[Sequence[DTO]],
+    dto_type: type[DTO],
+    file_format: ExportFormat,
+    filename: str,
+) -> Stream:
+    """Stream DTO batches as JSON lines or CSV, each batch is encoded and sent as soon as it is read.
+
+    CSV columns are DTO fields with nested DTOs flattened into `<field>_<nested field>` columns,
+    lists of scalars are joined by `CSV_LIST_SEPARATOR`, other lists are written as JSON.
+    Exported files aren't meant to be imported back, e.g. dictionaries are written by name, not by id.
+    """
+    content = _encode_jsonl(batches) if file_format is ExportFormat.JSONL else _encode_csv(batches, dto_type)
+    return Stream(
+        content,
+        media_type=_MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{file_format.value}"'},
+    )
@@ -0,0 +1,15 @@
+from collections.abc import AsyncIterator
+
+from litestar.datastructures import UploadFile
+
+from config import get_settings
+
+UPLOAD_READ_CHUNK_SIZE = 1024 * 1024
+# file size is checked while uploading, body limit only leaves room for multipart headers and other fields
+MAX_UPLOAD_BODY_SIZE = get_settings().s3.S3_MAX_UPLOAD_SIZE + 64 * 1024
+
+
+async def iter_upload_file(file: UploadFile, chunk_size: int = UPLOAD_READ_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Read uploaded file by chunks, litestar spools multipart files to disk so it is never kept in memory."""
+    while chunk := await file.read(chunk_size):
+        yield chunk
@@ -4,6 +4,13 @@ from common.application.query import PaginationParams
 
 
 async def pagination_query_params(
-    page: int = Parameter(query="page"), per_page: int = Parameter(query="per_page")
+    page: int = Parameter(query="page", default=1),
+    per_page: int = Parameter(query="per_page"),
+    cursor: str | None = Parameter(
+        query="cursor",
+        default=None,
+        description="Opaque `next_cursor` of previous page, switches list to keyset pagination",
+    ),
+    with_count: bool = Parameter(query="with_count", default=True),  # noqa: FBT001
 ) -> PaginationParams:
-    return PaginationParams(page=page, per_page=per_page)
+    return PaginationParams(page=page, per_page=per_page, cursor=cursor, with_count=with_count)
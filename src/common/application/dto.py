@@ -15,14 +15,15 @@ class DTO:
 
 @dataclass
 class PaginatedDTO[T: DTO]:
-    count: int
+    count: int | None
     page: int
     next: int | None = field(default=None)
     prev: int | None = field(default=None)
     results: list[T] = field(default_factory=list)
+    next_cursor: str | None = field(default=None)
 
     def __post_init__(self) -> None:
-        if self.page < self.count:
+        if self.count is not None and self.page < self.count:
             self.next = self.page + 1
         if self.page > 1:
             self.prev = self.page - 1
@@ -8,3 +8,12 @@ class ApplicationError(AppError):
     @property
     def message(self) -> str:
         return "An application error occurred"
+
+
+@dataclass(slots=True, eq=False)
+class InvalidCursorError(ApplicationError):
+    cursor: str
+
+    @property
+    def message(self) -> str:
+        return f"Invalid pagination cursor: {self.cursor}"
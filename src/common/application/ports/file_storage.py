@@ -1,11 +1,36 @@
-from collections.abc import Iterable
-from io import BytesIO
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from dataclasses import dataclass
 from typing import Protocol
 
 
+@dataclass(frozen=True, slots=True)
+class FileStream:
+    body: AsyncIterator[bytes]
+    content_length: int
+    etag: str | None = None
+    content_range: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class PresignedUpload:
+    url: str
+    fields: dict[str, str]
+
+
 class FileStorage(Protocol):
-    async def upload_file(self, file: BytesIO, file_name: str) -> None: ...
+    async def upload_file(self, file: AsyncIterable[bytes], file_name: str) -> None: ...
 
-    async def download_file(self, file_name: str) -> BytesIO: ...
+    async def download_file(
+        self,
+        file_name: str,
+        byte_range: str | None = None,
+        if_none_match: str | None = None,
+    ) -> FileStream: ...
 
     async def delete_files(self, files: Iterable[str]) -> None: ...
+
+    async def get_file_size(self, file_name: str) -> int | None: ...
+
+    async def get_upload_url(self, file_name: str) -> PresignedUpload: ...
+
+    async def get_download_url(self, file_name: str) -> str: ...
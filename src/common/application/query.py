@@ -23,3 +23,8 @@ class QueryHandler(ABC, Generic[Q, QRes]):
 class PaginationParams:
     page: int
     per_page: int = field(default=5)
+    cursor: str | None = field(default=None)
+    with_count: bool = field(default=True)
+
+
+EXPORT_BATCH_SIZE = 1000
@@ -0,0 +1,216 @@
+import asyncio
+import itertools
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, replace
+from uuid import UUID
+
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import BigInteger, Table, Uuid, column, event, update, values
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from common.application.dto import DTO
+
+logger = structlog.get_logger(__name__)
+
+_SESSION_KEY = "counter_buffer"
+_LISTENING_KEY = "counter_buffer_listening"
+_FLUSH_BATCH_SIZE = 1000
+
+# subtract flushed deltas and drop fields, which reached zero
+_SUBTRACT_SCRIPT = """
+for i = 1, #ARGV, 2 do
+    if redis.call('HINCRBY', KEYS[1], ARGV[i], -tonumber(ARGV[i + 1])) == 0 then
+        redis.call('HDEL', KEYS[1], ARGV[i])
+    end
+end
+"""
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CounterTable:
+    """Table with counter columns.
+
+    `fields` maps counter column to the DTO field, which shows it. `mirrors` are read models with the same
+    `id` and counter columns, flushed deltas are added to them too.
+    """
+
+    name: str
+    table: Table
+    fields: dict[str, str]
+    mirrors: tuple[Table, ...] = ()
+
+
+type Deltas = dict[tuple[CounterTable, UUID, str], int]
+
+
+class RedisCounterBuffer:
+    """Write-behind buffer of counter increments.
+
+    Increments are registered on the session and pushed into a Redis hash after commit, so rolled back
+    transactions don't change counters. `flush` moves accumulated deltas into the database with one
+    `UPDATE ... FROM (VALUES ...)` per table, so writers of a popular row don't wait on its row lock.
+    Readers add pending deltas to values read from the database with `merge`.
+    """
+
+    def __init__(self, redis: Redis, prefix: str, tables: Iterable[CounterTable]) -> None:
+        self._redis = redis
+        self._prefix = prefix
+        self._tables = tuple(tables)
+        self._subtract = redis.register_script(_SUBTRACT_SCRIPT)
+        self._push_tasks: set[asyncio.Task[None]] = set()
+        self._flush_task: asyncio.Task[None] | None = None
+
+    def _key(self, counter: CounterTable) -> str:
+        return f"{self._prefix}:counters:{counter.name}"
+
+    @staticmethod
+    def _field(id_: UUID, column_name: str) -> str:
+        return f"{id_}:{column_name}"
+
+    def incr(self, session: AsyncSession, counter: CounterTable, id_: UUID, column_name: str, delta: int = 1) -> None:
+        """Register increment, which is applied when the session commits."""
+        if not session.info.get(_LISTENING_KEY):
+            event.listen(session.sync_session, "after_commit", self._on_commit)
+            event.listen(session.sync_session, "after_rollback", self._on_rollback)
+            session.info[_LISTENING_KEY] = True
+        deltas: Deltas = session.info.setdefault(_SESSION_KEY, defaultdict(int))
+        deltas[counter, id_, column_name] += delta
+
+    def _on_commit(self, session: Session) -> None:
+        if not (deltas := session.info.pop(_SESSION_KEY, None)):
+            return
+        task = asyncio.get_running_loop().create_task(self._push(deltas))
+        self._push_tasks.add(task)
+        task.add_done_callback(self._push_tasks.discard)
+
+    @staticmethod
+    def _on_rollback(session: Session) -> None:
+        session.info.pop(_SESSION_KEY, None)
+
+    async def _push(self, deltas: Deltas) -> None:
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for (counter, id_, column_name), delta in deltas.items():
+                    if delta:
+                        pipe.hincrby(self._key(counter), self._field(id_, column_name), delta)
+                await pipe.execute()
+        except RedisError:
+            logger.exception("failed to push counter increments", deltas=len(deltas))
+
+    async def get_pending(self, counter: CounterTable, ids: Sequence[UUID]) -> dict[UUID, dict[str, int]]:
+        if not ids:
+            return {}
+        keys = [(id_, column_name) for id_ in ids for column_name in counter.fields]
+        try:
+            raw = await self._redis.hmget(self._key(counter), [self._field(*key) for key in keys])
+        except RedisError:
+            logger.exception("failed to read pending counters", counter=counter.name)
+            return {}
+        pending: dict[UUID, dict[str, int]] = defaultdict(dict)
+        for (id_, column_name), value in zip(keys, raw, strict=True):
+            if value is not None:
+                pending[id_][column_name] = int(value)
+        return pending
+
+    async def get_values(
+        self,
+        counter: CounterTable,
+        id_: UUID,
+        stored: Mapping[str, int],
+        session: AsyncSession | None = None,
+    ) -> dict[str, int]:
+        """Return counters of row by DTO fields, with pending and not yet committed increments of session."""
+        pending = (await self.get_pending(counter, [id_])).get(id_, {})
+        uncommitted: Deltas = session.info.get(_SESSION_KEY, {}) if session is not None else {}
+        return {
+            field: stored[column_name] + pending.get(column_name, 0) + uncommitted.get((counter, id_, column_name), 0)
+            for column_name, field in counter.fields.items()
+        }
+
+    async def merge[T: DTO](self, counter: CounterTable, items: list[T]) -> list[T]:
+        """Add pending increments to counters of DTOs."""
+        pending = await self.get_pending(counter, [item.id for item in items])  # type: ignore[attr-defined]
+        if not pending:
+            return items
+        return [
+            replace(
+                item,
+                **{
+                    field: getattr(item, field) + pending[item.id].get(column_name, 0)  # type: ignore[attr-defined]
+                    for column_name, field in counter.fields.items()
+                },
+            )
+            if item.id in pending  # type: ignore[attr-defined]
+            else item
+            for item in items
+        ]
+
+    async def _flush_table(self, counter: CounterTable, session_maker: async_sessionmaker[AsyncSession]) -> None:
+        key = self._key(counter)
+        raw: dict[bytes, bytes] = await self._redis.hgetall(key)
+        if not raw:
+            return
+
+        columns = tuple(counter.fields)
+        deltas: dict[UUID, dict[str, int]] = defaultdict(lambda: dict.fromkeys(columns, 0))
+        for field, value in raw.items():
+            id_, column_name = field.decode().split(":")
+            if column_name in deltas[UUID(id_)]:
+                deltas[UUID(id_)][column_name] = int(value)
+
+        rows = [(id_, *(delta[c] for c in columns)) for id_, delta in deltas.items()]
+        async with session_maker() as session:
+            for batch in itertools.batched(rows, _FLUSH_BATCH_SIZE, strict=False):
+                delta_values = values(
+                    column("id", Uuid),
+                    *(column(c, BigInteger) for c in columns),
+                    name="delta",
+                ).data(list(batch))
+                for table in (counter.table, *counter.mirrors):
+                    await session.execute(
+                        update(table)
+                        .where(table.c.id == delta_values.c.id)
+                        .values({c: table.c[c] + delta_values.c[c] for c in columns}),
+                    )
+            await session.commit()
+
+        # readers may see the flushed deltas twice until they are subtracted right below
+        await self._subtract(keys=[key], args=list(itertools.chain.from_iterable(raw.items())))
+
+    async def flush(self, session_maker: async_sessionmaker[AsyncSession]) -> None:
+        """Move pending deltas into the database, only one instance flushes at a time."""
+        lock = self._redis.lock(f"{self._prefix}:counters:lock", timeout=60)
+        if not await lock.acquire(blocking=False):
+            return
+        try:
+            for counter in self._tables:
+                await self._flush_table(counter, session_maker)
+        finally:
+            await lock.release()
+
+    async def _run(self, session_maker: async_sessionmaker[AsyncSession], interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush(session_maker)
+            except Exception:
+                logger.exception("counters flush failed")
+
+    def start(self, session_maker: async_sessionmaker[AsyncSession], interval: float) -> None:
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._run(session_maker, interval), name="counters-flush")
+
+    async def stop(self, session_maker: async_sessionmaker[AsyncSession]) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await asyncio.gather(*self._push_tasks, return_exceptions=True)
+        try:
+            await self.flush(session_maker)
+        except Exception:
+            logger.exception("counters flush failed")
@@ -1,38 +1,227 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from smtplib import SMTP
+from smtplib import SMTP, SMTPException, SMTPServerDisconnected
 from ssl import create_default_context
 from typing import Any
 
+import structlog
+from jinja2 import Template, TemplateError
+
 from common.application.ports.email_sender import IEmailSender
 from common.infrastructure.adapters import render
-from config import get_settings
+from config import EmailSettings
 
-settings = get_settings().email
+logger = structlog.get_logger(__name__)
 
+EMAIL_SUBJECT = "Empath notification"
 
-class EmailSender(IEmailSender):
-    def send_email_template(self, emails: list[str], template_name: str, **data: Any) -> str | dict[str, Any]:  # noqa: ANN401
-        template = render.render_template(template_name, **data)
-
-        message = MIMEMultipart("alternative")
-        message["From"] = settings.MAIL_USERNAME
-        message["To"] = ",".join(emails)
-        message["Subject"] = "Empath notification"
-        message.attach(MIMEText(template, "html"))
-        ctx = create_default_context()
+
+@dataclass(slots=True)
+class EmailMessage:
+    emails: list[str]
+    template_name: str
+    data: dict[str, Any] = field(default_factory=dict)
+    attempt: int = 0
+
+
+class SMTPConnection:
+    """Persistent authenticated SMTP connection.
+
+    Not thread-safe, every connection must be used from a single worker thread.
+    Reconnects when the server dropped connection or it was idle longer than `MAIL_IDLE_TIMEOUT`.
+    """
+
+    def __init__(self, config: EmailSettings) -> None:
+        self._config = config
+        self._server: SMTP | None = None
+        self._last_used = 0.0
+
+    def _connect(self) -> SMTP:
+        server = SMTP(self._config.MAIL_HOST, self._config.MAIL_PORT, timeout=self._config.MAIL_TIMEOUT)
         try:
-            with SMTP(settings.MAIL_HOST, settings.MAIL_PORT) as server:
-                server.ehlo()
-                server.starttls(context=ctx)
+            server.ehlo()
+            if self._config.MAIL_USE_TLS:
+                server.starttls(context=create_default_context())
                 server.ehlo()
-                server.login(settings.MAIL_USERNAME, settings.MAIL_PASSWORD)
-                server.sendmail(
-                    from_addr=message["From"],
-                    to_addrs=message["To"],
-                    msg=message.as_string(),
+            if self._config.MAIL_USERNAME and self._config.MAIL_PASSWORD:
+                server.login(self._config.MAIL_USERNAME, self._config.MAIL_PASSWORD)
+        except BaseException:
+            server.close()
+            raise
+        return server
+
+    def send(self, message: MIMEMultipart) -> None:
+        if self._server is None or time.monotonic() - self._last_used > self._config.MAIL_IDLE_TIMEOUT:
+            self.close()
+            self._server = self._connect()
+        try:
+            self._server.send_message(message)
+        except SMTPServerDisconnected:
+            self._server = self._connect()
+            self._server.send_message(message)
+        self._last_used = time.monotonic()
+
+    def close(self) -> None:
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (SMTPException, OSError):
+            self._server.close()
+        finally:
+            self._server = None
+
+
+class EmailDeliveryWorker:
+    """Background email delivery from a bounded in-process queue.
+
+    Each of `MAIL_WORKERS` tasks owns one SMTP connection and one thread, so blocking smtplib calls
+    never run on the event loop. A worker takes up to `MAIL_BATCH_SIZE` queued messages at once and sends
+    them over the same connection. Failed messages are re-queued with exponential backoff.
+    Enqueue never waits, messages are dropped while the queue is full.
+    """
+
+    def __init__(self, config: EmailSettings, templates: dict[str, Template] | None = None) -> None:
+        self._config = config
+        self._templates = render.compile_templates() if templates is None else templates
+        self._queue: asyncio.Queue[EmailMessage] = asyncio.Queue(maxsize=config.MAIL_QUEUE_SIZE)
+        self._tasks: list[asyncio.Task[None]] = []
+        self._retries: dict[asyncio.Task[None], EmailMessage] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._config.MAIL_HOST)
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        if not self.enabled or self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"email-worker-{i}") for i in range(self._config.MAIL_WORKERS)
+        ]
+
+    async def stop(self, timeout: float = 10) -> None:  # noqa: ASYNC109
+        """Wait until queued messages and messages waiting for retry are sent, then stop workers.
+
+        Messages waiting for retry are queued again without the rest of their backoff.
+        """
+        if self._tasks:
+            try:
+                async with asyncio.timeout(timeout):
+                    while True:
+                        await self._flush_retries()
+                        await self._queue.join()
+                        if not self._retries:
+                            break
+            except TimeoutError:
+                logger.warning(
+                    "email queue not drained on shutdown",
+                    pending=self._queue.qsize() + len(self._retries),
                 )
-                server.quit()
-            return message.as_string()
-        except Exception as e:  # noqa: BLE001
-            return {"error": e}
+        tasks = [*self._tasks, *self._retries]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+        self._retries.clear()
+
+    async def enqueue(self, message: EmailMessage) -> None:
+        if not self.enabled:
+            logger.warning("email delivery is not configured, message dropped", template=message.template_name)
+            return
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning(
+                "email queue is full, message dropped",
+                emails=message.emails,
+                template=message.template_name,
+            )
+
+    async def _work(self) -> None:
+        loop = asyncio.get_running_loop()
+        connection = SMTPConnection(self._config)
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="smtp")
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                while len(batch) < self._config.MAIL_BATCH_SIZE and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                try:
+                    failed = await loop.run_in_executor(executor, self._deliver, connection, batch)
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+                for message, error in failed:
+                    self._retry(message, error)
+        finally:
+            await loop.run_in_executor(executor, connection.close)
+            executor.shutdown(wait=False)
+
+    def _build_message(self, message: EmailMessage) -> MIMEMultipart:
+        html = self._templates[message.template_name].render(**message.data)
+        mime = MIMEMultipart("alternative")
+        mime["From"] = self._config.MAIL_USERNAME
+        mime["To"] = ",".join(message.emails)
+        mime["Subject"] = EMAIL_SUBJECT
+        mime.attach(MIMEText(html, "html"))
+        return mime
+
+    def _deliver(
+        self,
+        connection: SMTPConnection,
+        batch: list[EmailMessage],
+    ) -> list[tuple[EmailMessage, Exception]]:
+        failed: list[tuple[EmailMessage, Exception]] = []
+        for message in batch:
+            try:
+                mime = self._build_message(message)
+            except (KeyError, TemplateError):
+                logger.exception("email template rendering failed", template=message.template_name)
+                continue
+            try:
+                connection.send(mime)
+            except (SMTPException, OSError) as e:
+                connection.close()
+                failed.append((message, e))
+        return failed
+
+    def _retry(self, message: EmailMessage, error: Exception) -> None:
+        if message.attempt >= self._config.MAIL_MAX_RETRIES:
+            logger.error("email delivery failed", emails=message.emails, attempts=message.attempt + 1, error=error)
+            return
+        delay = self._config.MAIL_RETRY_BACKOFF * 2**message.attempt
+        message.attempt += 1
+        task = asyncio.create_task(self._requeue(message, delay))
+        self._retries[task] = message
+        task.add_done_callback(lambda done: self._retries.pop(done, None))
+
+    async def _requeue(self, message: EmailMessage, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self._queue.put(message)
+
+    async def _flush_retries(self) -> None:
+        """Queue messages waiting for retry right away."""
+        retries = list(self._retries.items())
+        self._retries.clear()
+        for task, _ in retries:
+            task.cancel()
+        await asyncio.gather(*(task for task, _ in retries), return_exceptions=True)
+        for task, message in retries:
+            if task.cancelled():
+                await self._queue.put(message)
+
+
+class EmailSender(IEmailSender):
+    def __init__(self, worker: EmailDeliveryWorker) -> None:
+        self._worker = worker
+
+    async def send_email_template(self, emails: list[str], template_name: str, **data: Any) -> None:  # noqa: ANN401
+        await self._worker.enqueue(EmailMessage(emails=emails, template_name=template_name, data=data))
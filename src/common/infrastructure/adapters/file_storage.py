@@ -1,18 +1,86 @@
-from collections.abc import Iterable
-from io import BytesIO
-from typing import Protocol
+import asyncio
+import contextlib
+import hashlib
+from base64 import b64encode
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Any, Protocol, Self
 
 from botocore.exceptions import ClientError  # type: ignore  # noqa: PGH003
 
-from common.application.ports.file_storage import FileStorage
+from common.application.ports.file_storage import FileStorage, FileStream, PresignedUpload
 from config import Settings
-from file_storage.application.exceptions import FileNotExistError, FileUploadError
+from file_storage.application.exceptions import (
+    FileNotExistError,
+    FileNotModifiedError,
+    FileTooLargeError,
+    FileUploadError,
+    InvalidRangeError,
+)
+
+
+class S3StreamingBody(Protocol):
+    async def __aenter__(self) -> Self: ...
+    async def __aexit__(self, *args: object) -> None: ...
+    def iter_chunks(self, chunk_size: int) -> AsyncIterator[bytes]: ...
 
 
 class S3Client(Protocol):
-    async def upload_fileobj(self, Fileobj: BytesIO, Bucket: str, Key: str) -> None: ...  # noqa: N803
-    async def download_fileobj(self, Bucket: str, Key: str, Fileobj: BytesIO) -> None: ...  # noqa: N803
+    async def put_object(self, Bucket: str, Key: str, **kwargs: object) -> dict[str, Any]: ...  # noqa: N803
+    async def create_multipart_upload(self, Bucket: str, Key: str) -> dict[str, Any]: ...  # noqa: N803
+    async def upload_part(self, Bucket: str, Key: str, UploadId: str, **kwargs: object) -> dict[str, Any]: ...  # noqa: N803
+    async def complete_multipart_upload(self, Bucket: str, Key: str, UploadId: str, **kwargs: object) -> None: ...  # noqa: N803
+    async def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str) -> None: ...  # noqa: N803
+    async def get_object(self, Bucket: str, Key: str, **kwargs: str) -> dict[str, Any]: ...  # noqa: N803
+    async def head_object(self, Bucket: str, Key: str) -> dict[str, Any]: ...  # noqa: N803
     async def delete_object(self, Bucket: str, Key: str) -> None: ...  # noqa: N803
+    async def generate_presigned_url(self, ClientMethod: str, Params: dict[str, str], ExpiresIn: int) -> str: ...  # noqa: N803
+    async def generate_presigned_post(
+        self,
+        Bucket: str,  # noqa: N803
+        Key: str,  # noqa: N803
+        Conditions: list[Any],  # noqa: N803
+        ExpiresIn: int,  # noqa: N803
+    ) -> dict[str, Any]: ...
+
+
+@dataclass(frozen=True, slots=True)
+class S3PoolStats:
+    max_connections: int
+    in_use: int
+    idle: int
+
+
+def get_s3_pool_stats(client: S3Client, max_connections: int) -> S3PoolStats:
+    """Connections of aiohttp pools behind aiobotocore client, aiohttp exposes no public counters for them."""
+    http_session = getattr(getattr(client, "_endpoint", None), "http_session", None)
+    connectors = [session.connector for session in getattr(http_session, "_sessions", {}).values()]
+    return S3PoolStats(
+        max_connections=max_connections,
+        in_use=sum(len(getattr(connector, "_acquired", ())) for connector in connectors),
+        idle=sum(len(conns) for connector in connectors for conns in getattr(connector, "_conns", {}).values()),
+    )
+
+
+async def _iter_parts(chunks: AsyncIterable[bytes], part_size: int, max_size: int) -> AsyncIterator[bytes]:
+    """Regroup chunks into parts of `part_size`, only the last part may be shorter."""
+    buffer = bytearray()
+    size = 0
+    async for chunk in chunks:
+        size += len(chunk)
+        if size > max_size:
+            raise FileTooLargeError(max_size)
+        buffer += chunk
+        while len(buffer) >= part_size:
+            yield bytes(buffer[:part_size])
+            del buffer[:part_size]
+    if buffer or not size:
+        yield bytes(buffer)
+
+
+def _content_md5(data: bytes) -> str:
+    return b64encode(hashlib.md5(data, usedforsecurity=False).digest()).decode()
 
 
 class S3FileStorage(FileStorage):
@@ -20,28 +88,120 @@ class S3FileStorage(FileStorage):
         self._client = client
         self._config = config.s3
 
-    async def download_file(self, file_name: str) -> BytesIO:
-        file = BytesIO()
+    async def download_file(
+        self,
+        file_name: str,
+        byte_range: str | None = None,
+        if_none_match: str | None = None,
+    ) -> FileStream:
+        """Open object for streaming, body is read from S3 while it is iterated."""
+        conditions: dict[str, str] = {}
+        if byte_range:
+            conditions["Range"] = byte_range
+        if if_none_match:
+            conditions["IfNoneMatch"] = if_none_match
         try:
-            await self._client.download_fileobj(
+            response = await self._client.get_object(
                 Bucket=self._config.S3_PRIVATE_BUCKET_NAME,
                 Key=file_name,
-                Fileobj=file,
+                **conditions,
             )
         except ClientError as e:
+            metadata = e.response.get("ResponseMetadata", {})
+            match metadata.get("HTTPStatusCode"):
+                case HTTPStatus.NOT_MODIFIED:
+                    raise FileNotModifiedError(etag=metadata.get("HTTPHeaders", {}).get("etag")) from e
+                case HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+                    raise InvalidRangeError from e
             raise FileNotExistError from e
-        file.seek(0)
-        return file
 
-    async def upload_file(self, file: BytesIO, file_name: str) -> None:
+        return FileStream(
+            body=self._iter_body(response["Body"]),
+            content_length=response["ContentLength"],
+            etag=response.get("ETag"),
+            content_range=response.get("ContentRange"),
+        )
+
+    async def _iter_body(self, body: S3StreamingBody) -> AsyncIterator[bytes]:
+        async with body as stream:
+            async for chunk in stream.iter_chunks(self._config.S3_DOWNLOAD_CHUNK_SIZE):
+                yield chunk
+
+    async def upload_file(self, file: AsyncIterable[bytes], file_name: str) -> None:
+        """Upload file while it is read, as S3 multipart upload with concurrently uploaded parts.
+
+        At most `S3_UPLOAD_CONCURRENCY` parts are kept in memory, every part is checked by S3 against its MD5.
+        Files that fit in a single part are uploaded with one `put_object`.
+        """
+        part_size = self._config.S3_UPLOAD_PART_SIZE
+        parts = _iter_parts(file, part_size, self._config.S3_MAX_UPLOAD_SIZE)
+        first = await anext(parts)
+        if len(first) < part_size:
+            try:
+                await self._client.put_object(
+                    Bucket=self._config.S3_PRIVATE_BUCKET_NAME,
+                    Key=file_name,
+                    Body=first,
+                    ContentMD5=_content_md5(first),
+                )
+            except Exception as e:
+                raise FileUploadError from e
+            return
+
         try:
-            await self._client.upload_fileobj(
-                Fileobj=file,
+            upload = await self._client.create_multipart_upload(
                 Bucket=self._config.S3_PRIVATE_BUCKET_NAME,
                 Key=file_name,
             )
         except Exception as e:
             raise FileUploadError from e
+        upload_id = upload["UploadId"]
+
+        semaphore = asyncio.Semaphore(self._config.S3_UPLOAD_CONCURRENCY)
+        tasks: list[asyncio.Task[dict[str, Any]]] = []
+        try:
+            number, part = 1, first
+            while part is not None:
+                await semaphore.acquire()
+                for running in tasks:
+                    if running.done():
+                        running.result()  # stop reading as soon as any part failed
+                task = asyncio.create_task(self._upload_part(file_name, upload_id, number, part))
+                task.add_done_callback(lambda _: semaphore.release())
+                tasks.append(task)
+                number, part = number + 1, await anext(parts, None)
+
+            uploaded = await asyncio.gather(*tasks)
+            await self._client.complete_multipart_upload(
+                Bucket=self._config.S3_PRIVATE_BUCKET_NAME,
+                Key=file_name,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": uploaded},
+            )
+        except BaseException as e:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            with contextlib.suppress(Exception):
+                await self._client.abort_multipart_upload(
+                    Bucket=self._config.S3_PRIVATE_BUCKET_NAME,
+                    Key=file_name,
+                    UploadId=upload_id,
+                )
+            if isinstance(e, Exception) and not isinstance(e, FileTooLargeError):
+                raise FileUploadError from e
+            raise
+
+    async def _upload_part(self, file_name: str, upload_id: str, number: int, part: bytes) -> dict[str, Any]:
+        response = await self._client.upload_part(
+            Bucket=self._config.S3_PRIVATE_BUCKET_NAME,
+            Key=file_name,
+            UploadId=upload_id,
+            PartNumber=number,
+            Body=part,
+            ContentMD5=_content_md5(part),
+        )
+        return {"ETag": response["ETag"], "PartNumber": number}
 
     async def delete_files(self, files: Iterable[str]) -> None:
         for file in files:
@@ -52,3 +212,27 @@ class S3FileStorage(FileStorage):
                 )
             except ClientError:
                 continue
+
+    async def get_file_size(self, file_name: str) -> int | None:
+        try:
+            response = await self._client.head_object(Bucket=self._config.S3_PRIVATE_BUCKET_NAME, Key=file_name)
+        except ClientError:
+            return None
+        return response["ContentLength"]
+
+    async def get_upload_url(self, file_name: str) -> PresignedUpload:
+        """Presigned POST for uploading file directly to S3, S3 rejects files over `S3_MAX_UPLOAD_SIZE`."""
+        response = await self._client.generate_presigned_post(
+            Bucket=self._config.S3_PRIVATE_BUCKET_NAME,
+            Key=file_name,
+            Conditions=[["content-length-range", 0, self._config.S3_MAX_UPLOAD_SIZE]],
+            ExpiresIn=self._config.S3_PRESIGNED_URL_TTL,
+        )
+        return PresignedUpload(url=response["url"], fields=response["fields"])
+
+    async def get_download_url(self, file_name: str) -> str:
+        return await self._client.generate_presigned_url(
+            ClientMethod="get_object",
+            Params={"Bucket": self._config.S3_PRIVATE_BUCKET_NAME, "Key": file_name},
+            ExpiresIn=self._config.S3_PRESIGNED_URL_TTL,
+        )
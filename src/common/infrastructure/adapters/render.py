@@ -1,6 +1,6 @@
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 
 from config import get_settings
 
@@ -18,3 +18,8 @@ template_env = Environment(
 def render_template(template_name: str, **data: Any) -> str:  # noqa: ANN401
     template = template_env.get_template(template_name)
     return template.render(**data)
+
+
+def compile_templates(extensions: tuple[str, ...] = ("html",)) -> dict[str, Template]:
+    """Load and compile all templates up front, so rendering doesn't touch the filesystem."""
+    return {name: template_env.get_template(name) for name in template_env.list_templates(extensions=extensions)}
@@ -1,9 +1,25 @@
 from abc import ABC
-from collections.abc import Sequence
-from typing import Any
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import asynccontextmanager
+from typing import Any, ClassVar
 
-from sqlalchemy import Delete, Insert, RowMapping, Select, Update
-from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+from sqlalchemy import Delete, Executable, Insert, Result, RowMapping, Select, Update, exc
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+
+from common.infrastructure.repositories.batch import BATCH_KEY, execute_batch
+from common.infrastructure.repositories.count import (
+    CountCache,
+    get_count_cache_key,
+    get_count_qs,
+    get_estimable_table,
+    get_estimate_qs,
+)
+from common.infrastructure.repositories.replica import ReadSession, primary_session, replica_fallback
+from config import get_settings
+
+db_settings = get_settings().db
+logger = structlog.get_logger(__name__)
 
 
 class AlchemyRepo(ABC):
@@ -13,26 +29,121 @@ class AlchemyRepo(ABC):
         self.session = session
 
     async def execute(self, query: Insert | Update | Delete) -> None:
+        if (batch := self.session.info.get(BATCH_KEY)) is not None:
+            batch.append(query)
+            return
         await self.session.execute(query)
 
+    async def _flush_batch(self) -> None:
+        if batch := self.session.info.get(BATCH_KEY):
+            statements = batch.copy()
+            batch.clear()
+            await execute_batch(self.session, statements)
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Collect statements passed to `execute` of repos of the session and send them on exit.
+
+        Independent consecutive statements are sent as one, see `execute_batch`. Statements keep their
+        order, so a statement sees changes of the previous ones. `fetch_one` sends
+        collected statements first, readers don't see them until the batch is sent. Nested batches join
+        the outer one.
+        """
+        if BATCH_KEY in self.session.info:
+            yield
+            return
+        statements: list[Insert | Update | Delete] = []
+        self.session.info[BATCH_KEY] = statements
+        try:
+            yield
+        finally:
+            del self.session.info[BATCH_KEY]
+        await execute_batch(self.session, statements)
+
+    async def fetch_one(self, query: Executable) -> RowMapping | None:
+        """Execute data-modifying query and return its single result row."""
+        await self._flush_batch()
+        result = await self.session.execute(query)
+        return result.mappings().one_or_none()
+
 
 class AlchemyReader(ABC):
     """Base Alchemy Reader for inheritance."""
 
-    def __init__(self, session: AsyncSession) -> None:
-        self.session = session
+    _count_cache: ClassVar[CountCache] = CountCache(
+        ttl=db_settings.COUNT_CACHE_TTL,
+        maxsize=db_settings.COUNT_CACHE_SIZE,
+    )
+
+    def __init__(self, session: ReadSession) -> None:
+        self.session: AsyncSession = session
+
+    @property
+    def on_replica(self) -> bool:
+        """Reads go to the replica, their results may lag behind and mustn't fill shared caches."""
+        return primary_session(self.session) is not self.session
 
-    async def count(self, query: Select[Any]) -> int:
-        return len(await self.fetch_all(query))
+    def primary(self) -> "AlchemyReader":
+        """Reader of the primary, for reads which fill shared caches."""
+        return AlchemyReader(ReadSession(primary_session(self.session))) if self.on_replica else self
+
+    async def _run[R](self, call: Callable[[AsyncSession], Awaitable[R]]) -> R:
+        try:
+            return await call(self.session)
+        except (exc.OperationalError, exc.InterfaceError, OSError):
+            if (primary := replica_fallback(self.session)) is None:
+                raise
+            logger.exception("replica read failed, falling back to primary")
+            self.session = primary
+            return await call(self.session)
+
+    async def _execute(self, query: Executable) -> Result[Any]:
+        return await self._run(lambda session: session.execute(query))
+
+    async def count(self, query: Select[Any], *, use_cache: bool = True) -> int:
+        """Count rows of query on the database side.
+
+        Unfiltered queries over a single table larger than `COUNT_ESTIMATE_THRESHOLD`
+        are answered with the planner estimate instead of a full scan.
+        """
+        count_qs = get_count_qs(query)
+        cache_key = get_count_cache_key(count_qs)
+        if use_cache and (cached := self._count_cache.get(cache_key)) is not None:
+            return cached
+
+        value_count: int | None = None
+        if (table := get_estimable_table(query)) is not None:
+            estimate = (await self._execute(get_estimate_qs(table))).scalar_one_or_none()
+            if estimate is not None and estimate >= db_settings.COUNT_ESTIMATE_THRESHOLD:
+                value_count = estimate
+        if value_count is None:
+            value_count = (await self._execute(count_qs)).scalar_one()
+
+        self._count_cache.set(cache_key, value_count)
+        return value_count
 
     async def fetch_one(self, query: Select[Any]) -> RowMapping | None:
-        result = await self.session.execute(query)
+        result = await self._execute(query)
         return result.mappings().one_or_none()
 
     async def fetch_all(self, query: Select[Any]) -> Sequence[RowMapping]:
-        result = await self.session.execute(query)
+        result = await self._execute(query)
         return result.mappings().all()
 
     async def fetch_sequence[T](self, query: Select[tuple[T]]) -> Sequence[T]:
-        result = await self.session.execute(query)
+        result = await self._execute(query)
         return result.scalars().all()
+
+    async def stream(self, query: Select[Any], batch_size: int) -> AsyncIterator[Sequence[RowMapping]]:
+        """Read query through a server-side cursor, yielding rows in batches of `batch_size`.
+
+        Only one batch is held in memory, the cursor lives until the iterator is exhausted or closed.
+        """
+        result: AsyncResult[Any] = await self._run(
+            lambda session: session.stream(query.execution_options(yield_per=batch_size)),
+        )
+        try:
+            async for rows in result.mappings().partitions():
+                yield rows
+        finally:
+            await result.close()
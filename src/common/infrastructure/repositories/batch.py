@@ -0,0 +1,125 @@
+from collections.abc import Iterable, Sequence
+from functools import cache
+
+import asyncpg
+from sqlalchemy import Table, exc
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.sql import visitors
+from sqlalchemy.sql.dml import Delete, UpdateBase
+from sqlalchemy.sql.util import find_tables
+
+BATCH_KEY = "write_batch"
+
+_CASCADE_ACTIONS = frozenset(("CASCADE", "SET NULL", "SET DEFAULT"))
+
+
+async def _get_driver_connection(connection: AsyncConnection) -> asyncpg.Connection:
+    raw = await connection.get_raw_connection()
+    return raw.driver_connection  # type: ignore[return-value]
+
+
+@cache
+def _get_cascaded_tables(table: Table) -> frozenset[Table]:
+    """Tables changed by foreign key actions when rows of table are deleted."""
+    cascaded: set[Table] = set()
+    pending = [table]
+    while pending:
+        current = pending.pop()
+        for other in current.metadata.tables.values():
+            if other in cascaded:
+                continue
+            if any(fk.references(current) and fk.ondelete in _CASCADE_ACTIONS for fk in other.foreign_keys):
+                cascaded.add(other)
+                pending.append(other)
+    return frozenset(cascaded)
+
+
+def _get_written_tables(statement: UpdateBase) -> set[Table]:
+    """Tables written by statement and data-modifying CTEs inside it."""
+    written: set[Table] = set()
+    for element in visitors.iterate(statement):
+        if isinstance(element, UpdateBase) and isinstance(element.table, Table):
+            written.add(element.table)
+            if isinstance(element, Delete):
+                written |= _get_cascaded_tables(element.table)
+    return written
+
+
+def _get_touched_tables(statement: UpdateBase) -> set[Table]:
+    tables = find_tables(statement, check_columns=True, include_crud=True)
+    return {table for table in tables if isinstance(table, Table)} | _get_written_tables(statement)
+
+
+def group_statements(statements: Sequence[UpdateBase]) -> list[list[UpdateBase]]:
+    """Split statements into consecutive groups, which may run as one statement.
+
+    Sub-statements of a data-modifying `WITH` see the same snapshot and run in no particular order,
+    so a statement starts a new group when it reads or writes a table written earlier in the group.
+    Reading a table before it is written in the group sees the same rows as sequential execution.
+    """
+    groups: list[list[UpdateBase]] = []
+    written: set[Table] = set()
+    for statement in statements:
+        if not groups or not written.isdisjoint(_get_touched_tables(statement)):
+            groups.append([])
+            written = set()
+        groups[-1].append(statement)
+        written |= _get_written_tables(statement)
+    return groups
+
+
+def combine_statements(statements: Sequence[UpdateBase]) -> UpdateBase:
+    """One statement running the last of statements with others as data-modifying CTEs."""
+    *others, last = statements
+    return last.add_cte(*(statement.cte(f"batch_{i}") for i, statement in enumerate(others)))
+
+
+async def execute_batch(session: AsyncSession, statements: Sequence[UpdateBase]) -> None:
+    """Execute statements in order, sending independent consecutive ones to the database as one statement.
+
+    On PostgreSQL each group of `group_statements` is combined into a single statement with
+    data-modifying CTEs. Values stay bind parameters, so the combined statement of a repo method has
+    the same SQL text on every call and is cached like any other. Other dialects and groups which can't
+    be combined, e.g. with CTEs of the same name, are executed one by one.
+    """
+    if not statements:
+        return
+    connection = await session.connection()
+    if connection.dialect.name != "postgresql":
+        for statement in statements:
+            await session.execute(statement)
+        return
+
+    for group in group_statements(statements):
+        if len(group) > 1 and await _execute_combined(session, group):
+            continue
+        for statement in group:
+            await session.execute(statement)
+
+
+async def _execute_combined(session: AsyncSession, statements: Sequence[UpdateBase]) -> bool:
+    try:
+        await session.execute(combine_statements(statements))
+    except exc.CompileError:
+        # raised before anything is sent, statements run one by one instead
+        return False
+    return True
+
+
+async def copy_records(session: AsyncSession, table: Table, records: Iterable[Sequence[object]]) -> None:
+    """Load records into table with `COPY`, values of each record go in order of table columns.
+
+    Requires asyncpg, records are written in the session transaction, so it must be opened by a statement
+    executed through the session before.
+    """
+    driver = await _get_driver_connection(await session.connection())
+    statement = f"COPY {table.name}"
+    try:
+        await driver.copy_records_to_table(
+            table.name,
+            records=records,
+            columns=[column.name for column in table.columns],
+            schema_name=table.schema,
+        )
+    except asyncpg.PostgresError as error:
+        raise exc.DBAPIError.instance(statement, None, error, asyncpg.PostgresError) from error
@@ -0,0 +1,77 @@
+import time
+from collections import OrderedDict
+from typing import Any
+
+from sqlalchemy import Select, Table, TextClause, func, literal_column, select, text
+from sqlalchemy.dialects import postgresql
+
+_dialect = postgresql.dialect()  # type: ignore  # noqa: PGH003
+
+
+def get_count_qs(query: Select[Any]) -> Select[tuple[int]]:
+    """Wrap query into `SELECT count(*)` without ordering, pagination and selected columns.
+
+    Columns are replaced by a constant, so correlated column subqueries (`is_liked`, `is_viewed`, ...)
+    are not evaluated for every row. Grouped and distinct queries keep their columns,
+    because the columns define the result rows there.
+    """
+    stripped = query.order_by(None).limit(None).offset(None)
+    if not stripped._distinct and not stripped._group_by_clauses:  # noqa: SLF001
+        stripped = stripped.with_only_columns(literal_column("1"), maintain_column_froms=True)
+    return select(func.count()).select_from(stripped.subquery())
+
+
+def get_estimable_table(query: Select[Any]) -> Table | None:
+    """Return table for planner-estimate count if query selects a whole table without any filters."""
+    if (
+        query.whereclause is not None
+        or query._having_criteria  # noqa: SLF001
+        or query._group_by_clauses  # noqa: SLF001
+        or query._distinct  # noqa: SLF001
+    ):
+        return None
+    froms = query.get_final_froms()
+    if len(froms) == 1 and isinstance(froms[0], Table):
+        return froms[0]
+    return None
+
+
+def get_estimate_qs(table: Table) -> TextClause:
+    name = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+    return text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)").bindparams(name=name)
+
+
+def get_count_cache_key(query: Select[Any]) -> tuple[str, str]:
+    """Build cache key from count query, so params of dropped column subqueries do not split the cache."""
+    compiled = query.compile(dialect=_dialect)
+    return str(compiled), repr(sorted(compiled.params.items()))
+
+
+class CountCache:
+    """Short-lived in-process cache of counts, keyed by compiled query and its params."""
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._data: OrderedDict[tuple[str, str], tuple[float, int]] = OrderedDict()
+
+    def get(self, key: tuple[str, str]) -> int | None:
+        if not (item := self._data.get(key)):
+            return None
+        expire_at, value = item
+        if expire_at < time.monotonic():
+            self._data.pop(key, None)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: tuple[str, str], value: int) -> None:
+        if self._ttl <= 0:
+            return
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -0,0 +1,101 @@
+import asyncio
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Table, event, select
+from sqlalchemy.orm import Mapper, Session, object_session
+
+from common.infrastructure.repositories.base import AlchemyReader
+
+_SESSION_KEY = "dictionary_cache_invalidate"
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    names: dict[UUID, str]
+    expire_at: float
+
+
+class DictionaryCache:
+    """In-process cache of small reference tables with `id` and `name` columns.
+
+    Entries live `ttl` seconds. Tables registered with `watch` are also dropped after commit of a session,
+    which inserted, updated or deleted their rows through ORM, other changes are visible after TTL
+    or explicit `invalidate`.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._entries: dict[str, _Entry] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._watched: list[type[Any]] = []
+
+    def _get_fresh(self, key: str, required: set[UUID]) -> dict[UUID, str] | None:
+        entry = self._entries.get(key)
+        if entry is None or entry.expire_at <= time.monotonic() or not required.issubset(entry.names):
+            return None
+        return entry.names
+
+    async def get(self, table: Table, reader: AlchemyReader, required: Iterable[UUID] = ()) -> dict[UUID, str]:
+        """Return names of table rows by id, loading them with reader on miss.
+
+        Cached table is reloaded if some of `required` ids are missing in it, e.g. added by other process.
+        Tables are loaded from the primary, so a lagging replica can't put stale names into the cache.
+        """
+        key = table.fullname
+        required_ids = set(required)
+        if (names := self._get_fresh(key, required_ids)) is not None:
+            return names
+
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            # other request could load the table while this one waited for the lock
+            if (names := self._get_fresh(key, required_ids)) is not None:
+                return names
+            rows = await reader.primary().fetch_all(select(table.c.id, table.c.name))
+            names = {row.id: row.name for row in rows}
+            if self._ttl > 0:
+                self._entries[key] = _Entry(names=names, expire_at=time.monotonic() + self._ttl)
+            return names
+
+    def invalidate(self, *tables: Table) -> None:
+        """Drop given tables from cache, or the whole cache if no table is given."""
+        if not tables:
+            self._entries.clear()
+            return
+        for table in tables:
+            self._entries.pop(table.fullname, None)
+
+    def watch(self, models: Iterable[type[Any]]) -> None:
+        """Invalidate tables of models after commit of sessions which changed them."""
+        for model in models:
+            for identifier in ("after_insert", "after_update", "after_delete"):
+                event.listen(model, identifier, self._on_change)
+            self._watched.append(model)
+        if not event.contains(Session, "after_commit", self._on_commit):
+            event.listen(Session, "after_commit", self._on_commit)
+            event.listen(Session, "after_rollback", self._on_rollback)
+
+    def unwatch(self) -> None:
+        for model in self._watched:
+            for identifier in ("after_insert", "after_update", "after_delete"):
+                event.remove(model, identifier, self._on_change)
+        self._watched.clear()
+        if event.contains(Session, "after_commit", self._on_commit):
+            event.remove(Session, "after_commit", self._on_commit)
+            event.remove(Session, "after_rollback", self._on_rollback)
+
+    @staticmethod
+    def _on_change(mapper: Mapper[Any], _connection: Any, target: Any) -> None:  # noqa: ANN401
+        if (session := object_session(target)) is not None:
+            session.info.setdefault(_SESSION_KEY, set()).add(mapper.local_table)
+
+    def _on_commit(self, session: Session) -> None:
+        if tables := session.info.pop(_SESSION_KEY, None):
+            self.invalidate(*tables)
+
+    @staticmethod
+    def _on_rollback(session: Session) -> None:
+        session.info.pop(_SESSION_KEY, None)
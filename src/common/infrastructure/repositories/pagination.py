@@ -1,7 +1,16 @@
+import base64
+import binascii
 import math
+from collections.abc import Sequence
+from datetime import datetime
 from typing import Any
+from uuid import UUID
 
-from sqlalchemy import Select
+import msgspec
+from sqlalchemy import ColumnElement, RowMapping, Select, tuple_
+
+from common.application.exceptions import InvalidCursorError
+from common.application.query import PaginationParams
 
 
 class AlchemyPaginator:
@@ -15,5 +24,40 @@ class AlchemyPaginator:
         return query.offset(offset).limit(per_page)
 
     @staticmethod
-    def get_page_count(value_count: int, per_page: int) -> int:
+    def get_page_count(value_count: int | None, per_page: int) -> int | None:
+        if value_count is None:
+            return None
         return math.ceil(value_count / per_page)
+
+    @staticmethod
+    def encode_cursor(created_at: datetime, id_: UUID) -> str:
+        return base64.urlsafe_b64encode(msgspec.json.encode((created_at, id_))).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            return msgspec.json.decode(raw, type=tuple[datetime, UUID])
+        except (binascii.Error, ValueError, msgspec.DecodeError) as e:
+            raise InvalidCursorError(cursor) from e
+
+    @classmethod
+    def paginate_keyset(
+        cls,
+        query: Select[Any],
+        pagination: PaginationParams,
+        created_at: ColumnElement[datetime],
+        id_: ColumnElement[UUID],
+    ) -> Select[Any]:
+        """Order query by `(created_at, id)` desc and paginate it by cursor, or by page if cursor not passed."""
+        query = query.order_by(None).order_by(created_at.desc(), id_.desc())
+        if pagination.cursor is None:
+            return cls.paginate(query, pagination.page, pagination.per_page)
+        cursor_created_at, cursor_id = cls.decode_cursor(pagination.cursor)
+        return query.where(tuple_(created_at, id_) < tuple_(cursor_created_at, cursor_id)).limit(pagination.per_page)
+
+    @classmethod
+    def get_next_cursor(cls, rows: Sequence[RowMapping], per_page: int) -> str | None:
+        if len(rows) < per_page or not rows:
+            return None
+        return cls.encode_cursor(rows[-1].created_at, rows[-1].id)
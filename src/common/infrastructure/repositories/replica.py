@@ -0,0 +1,190 @@
+import asyncio
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, NewType
+
+import structlog
+from litestar.enums import ScopeType
+from litestar.types import ASGIApp, Message, Receive, Scope, Send
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = structlog.get_logger(__name__)
+
+ReadSession = NewType("ReadSession", AsyncSession)
+
+SAFE_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+_PRIMARY_SESSION_KEY = "replica_primary_session"
+_ROUTER_KEY = "replica_router"
+
+# zero while replica has replayed everything it received, so an idle primary doesn't look like lag
+REPLICA_LAG_QS = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE coalesce(extract(epoch FROM now() - pg_last_xact_replay_timestamp()), 0) END",
+)
+
+
+@dataclass(slots=True)
+class ReadContext:
+    read_only: bool
+    user_id: str | None
+    committed: bool = False
+
+
+_read_context: ContextVar[ReadContext | None] = ContextVar("db_read_context", default=None)
+
+
+class ReplicaRouter:
+    """Decide whether reads of current request may go to the replica.
+
+    Only requests with safe methods read from the replica, mutating requests keep readers on the primary
+    so read-modify-write handlers see their own transaction. After a user commits, the user stays
+    on the primary for `sticky_window` seconds, the mark is kept in Redis to be shared by all workers.
+    Replica lag is checked every `check_interval` seconds by a background task started with `start`,
+    requests only read its last result. The primary is used until the first check passes, while the replica
+    lags behind more than `max_lag` seconds, and after a failed read until the next check.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        session_maker: async_sessionmaker[AsyncSession] | None,
+        redis: Redis,
+        *,
+        prefix: str,
+        max_lag: float,
+        check_interval: float,
+        sticky_window: float,
+    ) -> None:
+        self._session_maker = session_maker
+        self._redis = redis
+        self._prefix = prefix
+        self._max_lag = max_lag
+        self._check_interval = check_interval
+        self._sticky_window = sticky_window
+        self._healthy = False
+        self._check_task: asyncio.Task[None] | None = None
+
+    def _key(self, user_id: str) -> str:
+        return f"{self._prefix}:read-primary:{user_id}"
+
+    async def use_replica(self) -> bool:
+        if self._session_maker is None:
+            return False
+        context = _read_context.get()
+        if context is None or not context.read_only:
+            return False
+        if not self._healthy:
+            return False
+        return not (context.user_id and await self._is_sticky(context.user_id))
+
+    def start(self) -> None:
+        if self._session_maker is not None and self._check_task is None:
+            self._check_task = asyncio.create_task(self._run_checks(), name="replica-lag-check")
+
+    async def _run_checks(self) -> None:
+        while True:
+            await self._check_lag()
+            await asyncio.sleep(self._check_interval)
+
+    async def _check_lag(self) -> None:
+        try:
+            async with asyncio.timeout(self._check_interval), self._session_maker() as session:  # type: ignore[misc]
+                lag = (await session.execute(REPLICA_LAG_QS)).scalar_one()
+        except Exception:
+            logger.exception("replica lag check failed")
+            self._healthy = False
+        else:
+            self._healthy = lag <= self._max_lag
+            if not self._healthy:
+                logger.warning("replica lags behind primary", lag=lag)
+
+    def mark_failed(self) -> None:
+        self._healthy = False
+
+    async def _is_sticky(self, user_id: str) -> bool:
+        try:
+            return bool(await self._redis.exists(self._key(user_id)))
+        except RedisError:
+            logger.exception("failed to read replica stickiness", user_id=user_id)
+            return True
+
+    async def stick(self, user_id: str) -> None:
+        if self._session_maker is None or self._sticky_window <= 0:
+            return
+        try:
+            await self._redis.set(self._key(user_id), 1, px=int(self._sticky_window * 1000))
+        except RedisError:
+            logger.exception("failed to write replica stickiness", user_id=user_id)
+
+    def session(self, primary: AsyncSession) -> AsyncSession:
+        """Replica session which falls back to `primary` through `replica_fallback`."""
+        session = self._session_maker()  # type: ignore[misc]
+        session.info[_PRIMARY_SESSION_KEY] = primary
+        session.info[_ROUTER_KEY] = self
+        return session
+
+    async def close(self) -> None:
+        if self._check_task is not None:
+            self._check_task.cancel()
+            await asyncio.gather(self._check_task, return_exceptions=True)
+            self._check_task = None
+        if self._session_maker is not None:
+            await self._session_maker.kw["bind"].dispose()
+
+
+def primary_session(session: AsyncSession) -> AsyncSession:
+    """Primary session of a replica session, the session itself otherwise."""
+    return session.info.get(_PRIMARY_SESSION_KEY, session)
+
+
+def replica_fallback(session: AsyncSession) -> AsyncSession | None:
+    """Primary session to retry a failed replica read on, `None` if session is not a replica one."""
+    if (router := session.info.get(_ROUTER_KEY)) is None:
+        return None
+    router.mark_failed()
+    return session.info[_PRIMARY_SESSION_KEY]
+
+
+def track_commits(session: AsyncSession) -> None:
+    """Mark current request as committed, so its user sticks to the primary."""
+    if (context := _read_context.get()) is None:
+        return
+
+    def on_commit(_: Any) -> None:  # noqa: ANN401
+        context.committed = True
+
+    event.listen(session.sync_session, "after_commit", on_commit)
+
+
+class ReadRoutingMiddleware:
+    """Expose method and user of request to `ReplicaRouter`, sticks user to the primary after commit."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != ScopeType.HTTP:
+            await self.app(scope, receive, send)
+            return
+
+        user_id = getattr(scope.get("user"), "sub", None)
+        context = ReadContext(
+            read_only=scope["method"] in SAFE_METHODS,
+            user_id=str(user_id) if user_id is not None else None,
+        )
+        token = _read_context.set(context)
+
+        async def send_wrapper(message: Message) -> None:
+            # before response starts, so the next request of user already reads from the primary
+            if message["type"] == "http.response.start" and context.committed and context.user_id:
+                router = await scope["app"].state.dishka_container.get(ReplicaRouter)
+                await router.stick(context.user_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _read_context.reset(token)
@@ -0,0 +1,15 @@
+from typing import Any
+
+from sqlalchemy import ColumnElement, Float
+
+
+def trgm_match(column: ColumnElement[Any], term: str) -> ColumnElement[bool]:
+    """Substring or fuzzy trigram match, both served by `gin_trgm_ops` index.
+
+    Fuzzy `%` match uses `pg_trgm.similarity_threshold`, see `DBSettings.TRGM_SIMILARITY_THRESHOLD`.
+    """
+    return column.ilike(f"%{term}%") | column.op("%", is_comparison=True)(term)
+
+
+def trgm_distance(column: ColumnElement[Any], term: str) -> ColumnElement[float]:
+    return column.op("<->", return_type=Float)(term)
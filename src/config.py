@@ -21,6 +21,44 @@ class DBSettings:
     DB_PORT: int = field(default_factory=lambda: int(os.environ.get("DB_PORT", default=5432)))
     DB_NAME: str = field(default_factory=lambda: os.environ.get("DB_NAME", "db-name"))
 
+    COUNT_CACHE_TTL: int = field(default_factory=lambda: int(os.environ.get("DB_COUNT_CACHE_TTL", "10")))  # seconds
+    COUNT_CACHE_SIZE: int = field(default_factory=lambda: int(os.environ.get("DB_COUNT_CACHE_SIZE", "1024")))
+    DICTIONARY_CACHE_TTL: int = field(
+        default_factory=lambda: int(os.environ.get("DB_DICTIONARY_CACHE_TTL", "600")),
+    )  # seconds
+    COUNT_ESTIMATE_THRESHOLD: int = field(
+        default_factory=lambda: int(os.environ.get("DB_COUNT_ESTIMATE_THRESHOLD", "1000000")),
+    )
+    TRGM_SIMILARITY_THRESHOLD: float = field(
+        default_factory=lambda: float(os.environ.get("DB_TRGM_SIMILARITY_THRESHOLD", "0.3")),
+    )
+    SKILL_IDF_RECONCILE_INTERVAL: float = field(
+        default_factory=lambda: float(os.environ.get("DB_SKILL_IDF_RECONCILE_INTERVAL", "3600")),
+    )  # seconds
+    VACANCY_INDEX_TTL: float = field(
+        default_factory=lambda: float(os.environ.get("DB_VACANCY_INDEX_TTL", "600")),
+    )  # seconds
+
+    POOL_SIZE: int = field(default_factory=lambda: int(os.environ.get("DB_POOL_SIZE", "10")))
+    POOL_MAX_OVERFLOW: int = field(default_factory=lambda: int(os.environ.get("DB_POOL_MAX_OVERFLOW", "10")))
+    POOL_TIMEOUT: float = field(default_factory=lambda: float(os.environ.get("DB_POOL_TIMEOUT", "30")))  # seconds
+    POOL_RECYCLE: int = field(default_factory=lambda: int(os.environ.get("DB_POOL_RECYCLE", "1800")))  # seconds
+    POOL_PRE_PING: bool = field(default_factory=lambda: os.environ.get("DB_POOL_PRE_PING", "True") in TRUE_VALUES)
+    STATEMENT_CACHE_SIZE: int = field(
+        default_factory=lambda: int(os.environ.get("DB_STATEMENT_CACHE_SIZE", "100")),
+    )  # prepared statements per connection
+    # transaction pooling of PgBouncer can't keep prepared statements between transactions
+    PGBOUNCER: bool = field(default_factory=lambda: os.environ.get("DB_PGBOUNCER", "False") in TRUE_VALUES)
+
+    REPLICA_DATABASE_URL: str = field(default_factory=lambda: os.environ.get("DB_REPLICA_URL", ""))
+    REPLICA_MAX_LAG: float = field(default_factory=lambda: float(os.environ.get("DB_REPLICA_MAX_LAG", "5")))  # seconds
+    REPLICA_CHECK_INTERVAL: float = field(
+        default_factory=lambda: float(os.environ.get("DB_REPLICA_CHECK_INTERVAL", "5")),
+    )  # seconds
+    READ_YOUR_WRITES_WINDOW: float = field(
+        default_factory=lambda: float(os.environ.get("DB_READ_YOUR_WRITES_WINDOW", "10")),
+    )  # seconds
+
     @property
     def ASYNC_DATABASE_URL(self) -> str:
         return os.environ.get(
@@ -50,6 +88,13 @@ class AuthSettings:
 
     VERIFICATION_CODE_EXPIRE: int = 5  # minutes
 
+    BCRYPT_ROUNDS: int = field(default_factory=lambda: int(os.environ.get("BCRYPT_ROUNDS", "12")))
+    PASSWORD_HASH_WORKERS: int = field(default_factory=lambda: int(os.environ.get("PASSWORD_HASH_WORKERS", "4")))
+
+    KEY_RELOAD_INTERVAL: int = 5  # seconds
+    VERIFIED_TOKEN_CACHE_SIZE: int = 10_000
+    VERIFIED_TOKEN_CACHE_TTL: int = 300  # seconds
+
 
 @dataclass
 class RedisSettings:
@@ -66,6 +111,10 @@ class RedisSettings:
     SOCKET_KEEPALIVE: bool = field(
         default_factory=lambda: os.getenv("REDIS_SOCKET_KEEPALIVE", "True") in TRUE_VALUES,
     )
+    COUNTER_FLUSH_INTERVAL: float = field(
+        default_factory=lambda: float(os.getenv("REDIS_COUNTER_FLUSH_INTERVAL", "5")),
+    )  # seconds
+    ARTICLE_CACHE_TTL: int = field(default_factory=lambda: int(os.getenv("REDIS_ARTICLE_CACHE_TTL", "300")))  # seconds
 
 
 @dataclass
@@ -75,6 +124,27 @@ class S3Settings:
     S3_PRIVATE_BUCKET_NAME: str = field(default_factory=lambda: os.environ.get("S3_PRIVATE_BUCKET_NAME", ""))
     S3_PUBLIC_BUCKET_NAME: str = field(default_factory=lambda: os.environ.get("S3_PUBLIC_BUCKET_NAME", ""))
     S3_ENDPOINT_URL: str = field(default_factory=lambda: os.environ.get("S3_ENDPOINT_URL", ""))
+    S3_DOWNLOAD_CHUNK_SIZE: int = field(
+        default_factory=lambda: int(os.environ.get("S3_DOWNLOAD_CHUNK_SIZE", "1048576")),
+    )  # bytes
+    S3_UPLOAD_PART_SIZE: int = field(
+        default_factory=lambda: int(os.environ.get("S3_UPLOAD_PART_SIZE", "8388608")),
+    )  # bytes, S3 requires at least 5 MiB for all parts but the last
+    S3_UPLOAD_CONCURRENCY: int = field(default_factory=lambda: int(os.environ.get("S3_UPLOAD_CONCURRENCY", "4")))
+    S3_MAX_UPLOAD_SIZE: int = field(
+        default_factory=lambda: int(os.environ.get("S3_MAX_UPLOAD_SIZE", "52428800")),
+    )  # bytes
+    S3_PRESIGNED_URL_TTL: int = field(
+        default_factory=lambda: int(os.environ.get("S3_PRESIGNED_URL_TTL", "300")),
+    )  # seconds
+    S3_MAX_POOL_CONNECTIONS: int = field(default_factory=lambda: int(os.environ.get("S3_MAX_POOL_CONNECTIONS", "50")))
+    S3_KEEPALIVE_TIMEOUT: float = field(
+        default_factory=lambda: float(os.environ.get("S3_KEEPALIVE_TIMEOUT", "60")),
+    )  # seconds
+    S3_CONNECT_TIMEOUT: float = field(
+        default_factory=lambda: float(os.environ.get("S3_CONNECT_TIMEOUT", "5")),
+    )  # seconds
+    S3_READ_TIMEOUT: float = field(default_factory=lambda: float(os.environ.get("S3_READ_TIMEOUT", "60")))  # seconds
 
 
 @dataclass(frozen=True, slots=True)
@@ -83,6 +153,15 @@ class EmailSettings:
     MAIL_USERNAME: str = os.environ.get("MAIL_USERNAME", "")
     MAIL_PASSWORD: str = os.environ.get("MAIL_PASSWORD", "")
     MAIL_PORT: int = int(os.environ.get("MAIL_PORT", 587))
+    MAIL_USE_TLS: bool = os.environ.get("MAIL_USE_TLS", "True") in TRUE_VALUES
+    MAIL_TIMEOUT: float = float(os.environ.get("MAIL_TIMEOUT", "10"))  # seconds
+
+    MAIL_QUEUE_SIZE: int = int(os.environ.get("MAIL_QUEUE_SIZE", "1000"))
+    MAIL_WORKERS: int = int(os.environ.get("MAIL_WORKERS", "2"))
+    MAIL_BATCH_SIZE: int = int(os.environ.get("MAIL_BATCH_SIZE", "20"))  # messages per connection round
+    MAIL_IDLE_TIMEOUT: float = float(os.environ.get("MAIL_IDLE_TIMEOUT", "60"))  # seconds
+    MAIL_MAX_RETRIES: int = int(os.environ.get("MAIL_MAX_RETRIES", "5"))
+    MAIL_RETRY_BACKOFF: float = float(os.environ.get("MAIL_RETRY_BACKOFF", "1"))  # seconds, doubled per attempt
 
 
 @dataclass(frozen=True, slots=True)
@@ -92,6 +171,8 @@ class AppSettings:
     API_V1_PREFIX: str = "/v1"
     TEMPLATE_PATH = BASE_DIR / "src" / "templates"
     ENVIRONMENT: str = field(default_factory=lambda: os.environ.get("ENVIRONMENT", "PROD"))
+    # comma separated networks of clients allowed to internal endpoints, e.g. metrics scraper
+    INTERNAL_NETWORKS: str = field(default_factory=lambda: os.environ.get("INTERNAL_NETWORKS", "127.0.0.0/8,::1/128"))
     auth: AuthSettings = field(default_factory=AuthSettings)
 
 
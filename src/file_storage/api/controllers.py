@@ -1,37 +1,46 @@
 import mimetypes
-from collections.abc import AsyncIterable, Mapping
-from io import BytesIO
-from typing import Annotated, ClassVar
+from collections.abc import Mapping
+from typing import Annotated, Any, ClassVar
 
 from dishka.integrations.litestar import FromDishka as Depends
 from dishka.integrations.litestar import inject
-from litestar import get, post, status_codes
+from litestar import Request, Response, get, post, status_codes
 from litestar.controller import Controller
 from litestar.datastructures import UploadFile as LitestarUploadFile
 from litestar.enums import RequestEncodingType
-from litestar.params import Body
-from litestar.response import Stream
+from litestar.params import Body, Parameter
+from litestar.response import Redirect, Stream
 
 from common.api.exception_handlers import error_handler
-from file_storage.api.schema import FileStorageResponse
+from common.api.files import MAX_UPLOAD_BODY_SIZE, iter_upload_file
+from file_storage.api.schema import CompleteUploadSchema, FileStorageResponse, PresignedUploadResponse
+from file_storage.application.commands.complete_upload import CompleteUpload, CompleteUploadHandler
+from file_storage.application.commands.create_upload_url import CreateUploadUrl, CreateUploadUrlHandler
 from file_storage.application.commands.upload_file import FileType, StorageNames, UploadFile, UploadFileHandler
-from file_storage.application.exceptions import FileNotExistError
+from file_storage.application.exceptions import (
+    FileNotExistError,
+    FileNotModifiedError,
+    FileTooLargeError,
+    InvalidRangeError,
+)
 from file_storage.application.queries.download_file import (
     DownloadFile,
     DownloadFileHandler,
 )
+from file_storage.application.queries.get_download_url import GetDownloadUrl, GetDownloadUrlHandler
 
 
-async def bytes_io_generator(bytes_io: BytesIO, chunk_size: int = 1024) -> AsyncIterable[bytes]:
-    bytes_io.seek(0)
-
-    while chunk := bytes_io.read(chunk_size):
-        yield chunk
+def not_modified_handler(_: Request[Any, Any, Any], exc: FileNotModifiedError) -> Response[None]:
+    headers = {"ETag": exc.etag} if exc.etag else None
+    return Response(content=None, status_code=status_codes.HTTP_304_NOT_MODIFIED, headers=headers)
 
 
 class FileStorageController(Controller):
     exception_handlers: ClassVar[Mapping] = {  # type: ignore  # noqa: PGH003
         FileNotExistError: error_handler(status_codes.HTTP_400_BAD_REQUEST),
+        FileNotModifiedError: not_modified_handler,
+        InvalidRangeError: error_handler(status_codes.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE),
+        FileTooLargeError: error_handler(status_codes.HTTP_413_REQUEST_ENTITY_TOO_LARGE),
     }
 
     @get(
@@ -39,15 +48,36 @@ class FileStorageController(Controller):
         status_code=status_codes.HTTP_200_OK,
     )
     @inject
-    async def download_file(self, filepath: str, download_file: Depends[DownloadFileHandler]) -> Stream:
-        query = DownloadFile(filepath=filepath)
-        file_bytes = await download_file(query)
+    async def download_file(
+        self,
+        filepath: str,
+        download_file: Depends[DownloadFileHandler],
+        byte_range: Annotated[str | None, Parameter(header="range")] = None,
+        if_none_match: Annotated[str | None, Parameter(header="if-none-match")] = None,
+    ) -> Stream:
+        # only single `bytes` ranges are supported by S3, other units are ignored as RFC 9110 allows
+        if byte_range and not byte_range.startswith("bytes="):
+            byte_range = None
+        query = DownloadFile(filepath=filepath, byte_range=byte_range, if_none_match=if_none_match)
+        file = await download_file(query)
+
+        headers = {"Content-Length": str(file.content_length), "Accept-Ranges": "bytes"}
+        if file.etag:
+            headers["ETag"] = file.etag
+        if file.content_range:
+            headers["Content-Range"] = file.content_range
         media_type, _ = mimetypes.guess_type(filepath)
-        return Stream(bytes_io_generator(file_bytes), media_type=media_type)
+        return Stream(
+            file.body,
+            media_type=media_type,
+            headers=headers,
+            status_code=status_codes.HTTP_206_PARTIAL_CONTENT if file.content_range else status_codes.HTTP_200_OK,
+        )
 
     @post(
         path="",
         status_code=status_codes.HTTP_200_OK,
+        request_max_body_size=MAX_UPLOAD_BODY_SIZE,
     )
     @inject
     async def upload_file(
@@ -57,12 +87,50 @@ class FileStorageController(Controller):
         data: Annotated[LitestarUploadFile, Body(media_type=RequestEncodingType.MULTI_PART)],
         upload_file: Depends[UploadFileHandler],
     ) -> FileStorageResponse:
-        content = await data.read()
         command = UploadFile(
             file_type=file_type,
             storage_name=storage_name,
-            file=BytesIO(content),
+            file=iter_upload_file(data),
             filename=data.filename,
         )
         new_url = await upload_file(command)
         return FileStorageResponse(url=new_url)
+
+    @post(
+        path="/presigned",
+        status_code=status_codes.HTTP_200_OK,
+    )
+    @inject
+    async def create_upload_url(
+        self,
+        file_type: FileType,
+        storage_name: StorageNames,
+        filename: str,
+        create_upload_url: Depends[CreateUploadUrlHandler],
+    ) -> PresignedUploadResponse:
+        """Issue presigned POST, file is sent straight to storage and then confirmed with `/presigned/complete`."""
+        command = CreateUploadUrl(file_type=file_type, storage_name=storage_name, filename=filename)
+        file_name, upload = await create_upload_url(command)
+        return PresignedUploadResponse(file_name=file_name, url=upload.url, fields=upload.fields)
+
+    @post(
+        path="/presigned/complete",
+        status_code=status_codes.HTTP_200_OK,
+    )
+    @inject
+    async def complete_upload(
+        self,
+        data: CompleteUploadSchema,
+        complete_upload: Depends[CompleteUploadHandler],
+    ) -> FileStorageResponse:
+        url = await complete_upload(CompleteUpload(file_name=data.file_name))
+        return FileStorageResponse(url=url)
+
+    @get(
+        path="/presigned/{filepath:path}",
+        status_code=status_codes.HTTP_307_TEMPORARY_REDIRECT,
+    )
+    @inject
+    async def get_download_url(self, filepath: str, get_download_url: Depends[GetDownloadUrlHandler]) -> Redirect:
+        url = await get_download_url(GetDownloadUrl(filepath=filepath))
+        return Redirect(path=url, status_code=status_codes.HTTP_307_TEMPORARY_REDIRECT)
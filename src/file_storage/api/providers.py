@@ -3,8 +3,11 @@ from dishka import Provider, Scope, from_context, provide  # type: ignore  # noq
 from common.application.ports.file_storage import FileStorage
 from common.infrastructure.adapters.file_storage import S3FileStorage
 from config import Settings
+from file_storage.application.commands.complete_upload import CompleteUploadHandler
+from file_storage.application.commands.create_upload_url import CreateUploadUrlHandler
 from file_storage.application.commands.upload_file import UploadFileHandler
 from file_storage.application.queries.download_file import DownloadFileHandler
+from file_storage.application.queries.get_download_url import GetDownloadUrlHandler
 
 
 class FileStorageProvider(Provider):
@@ -15,3 +18,6 @@ class FileStorageProvider(Provider):
 
     download_file = provide(DownloadFileHandler)
     upload_file = provide(UploadFileHandler)
+    create_upload_url = provide(CreateUploadUrlHandler)
+    complete_upload = provide(CompleteUploadHandler)
+    get_download_url = provide(GetDownloadUrlHandler)
@@ -3,3 +3,13 @@ from common.api.schemas import CamelizedBaseStruct
 
 class FileStorageResponse(CamelizedBaseStruct):
     url: str
+
+
+class PresignedUploadResponse(CamelizedBaseStruct):
+    file_name: str
+    url: str
+    fields: dict[str, str]
+
+
+class CompleteUploadSchema(CamelizedBaseStruct):
+    file_name: str
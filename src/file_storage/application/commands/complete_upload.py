@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+from common.application.command import Command, CommandHandler
+from common.application.ports.file_storage import FileStorage
+from file_storage.application.commands.upload_file import is_storage_file_name
+from file_storage.application.exceptions import FileNotExistError
+
+
+@dataclass(frozen=True)
+class CompleteUpload(Command[str]):
+    file_name: str
+
+
+@dataclass(slots=True)
+class CompleteUploadHandler(CommandHandler[CompleteUpload, str]):
+    """Confirm that file uploaded by presigned url reached the storage."""
+
+    _file_storage: FileStorage
+
+    async def __call__(self, command: CompleteUpload) -> str:
+        if not is_storage_file_name(command.file_name):
+            raise FileNotExistError
+        if await self._file_storage.get_file_size(command.file_name) is None:
+            raise FileNotExistError
+        return command.file_name
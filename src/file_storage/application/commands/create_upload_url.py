@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+from common.application.command import Command, CommandHandler
+from common.application.ports.file_storage import FileStorage, PresignedUpload
+from file_storage.application.commands.upload_file import FileType, StorageNames, get_file_name
+
+
+@dataclass(frozen=True)
+class CreateUploadUrl(Command[tuple[str, PresignedUpload]]):
+    storage_name: StorageNames
+    file_type: FileType
+    filename: str
+
+
+@dataclass(slots=True)
+class CreateUploadUrlHandler(CommandHandler[CreateUploadUrl, tuple[str, PresignedUpload]]):
+    _file_storage: FileStorage
+
+    async def __call__(self, command: CreateUploadUrl) -> tuple[str, PresignedUpload]:
+        file_name = get_file_name(command.storage_name, command.file_type, command.filename)
+        return file_name, await self._file_storage.get_upload_url(file_name)
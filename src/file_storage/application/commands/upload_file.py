@@ -1,6 +1,6 @@
+from collections.abc import AsyncIterable
 from dataclasses import dataclass
 from enum import Enum
-from io import BytesIO
 from uuid import uuid4
 
 from common.application.command import Command, CommandHandler
@@ -18,11 +18,23 @@ class FileType(str, Enum):
     FILES = "files"
 
 
+def get_file_name(storage_name: StorageNames, file_type: FileType, filename: str) -> str:
+    return f"/{file_type.value}/{storage_name.value}/{uuid4()}_{filename}"
+
+
+def is_storage_file_name(file_name: str) -> bool:
+    """Check that file name follows `get_file_name` layout, so only keys issued for storages are accepted."""
+    prefixes = tuple(
+        f"/{file_type.value}/{storage_name.value}/" for file_type in FileType for storage_name in StorageNames
+    )
+    return file_name.startswith(prefixes) and ".." not in file_name
+
+
 @dataclass(frozen=True)
 class UploadFile(Command[str]):
     storage_name: StorageNames
     file_type: FileType
-    file: BytesIO
+    file: AsyncIterable[bytes]
     filename: str
 
 
@@ -32,7 +44,7 @@ class UploadFileHandler(CommandHandler[UploadFile, str]):
     _uow: UnitOfWork
 
     async def __call__(self, command: UploadFile) -> str:
-        file_name = f"/{command.file_type.value}/{command.storage_name.value}/{uuid4()}_{command.filename}"
+        file_name = get_file_name(command.storage_name, command.file_type, command.filename)
         await self._file_storage.upload_file(file=command.file, file_name=file_name)
         await self._uow.commit()
         return file_name
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from common.application.exceptions import ApplicationError
 
 
@@ -11,3 +13,27 @@ class FileUploadError(ApplicationError):
     @property
     def message(self) -> str:
         return "File upload error"
+
+
+@dataclass(slots=True, eq=False)
+class FileNotModifiedError(ApplicationError):
+    etag: str | None
+
+    @property
+    def message(self) -> str:
+        return "File not modified"
+
+
+class InvalidRangeError(ApplicationError):
+    @property
+    def message(self) -> str:
+        return "Requested range not satisfiable"
+
+
+@dataclass(slots=True, eq=False)
+class FileTooLargeError(ApplicationError):
+    max_size: int
+
+    @property
+    def message(self) -> str:
+        return f"File is larger than {self.max_size} bytes"
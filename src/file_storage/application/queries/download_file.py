@@ -1,18 +1,23 @@
 from dataclasses import dataclass
-from io import BytesIO
 
-from common.application.ports.file_storage import FileStorage
+from common.application.ports.file_storage import FileStorage, FileStream
 from common.application.query import Query, QueryHandler
 
 
 @dataclass(frozen=True)
-class DownloadFile(Query[BytesIO]):
+class DownloadFile(Query[FileStream]):
     filepath: str
+    byte_range: str | None = None
+    if_none_match: str | None = None
 
 
 @dataclass
-class DownloadFileHandler(QueryHandler[DownloadFile, BytesIO]):
+class DownloadFileHandler(QueryHandler[DownloadFile, FileStream]):
     _file_storage: FileStorage
 
-    async def __call__(self, query: DownloadFile) -> BytesIO:
-        return await self._file_storage.download_file(query.filepath)
+    async def __call__(self, query: DownloadFile) -> FileStream:
+        return await self._file_storage.download_file(
+            query.filepath,
+            byte_range=query.byte_range,
+            if_none_match=query.if_none_match,
+        )
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+from common.application.ports.file_storage import FileStorage
+from common.application.query import Query, QueryHandler
+
+
+@dataclass(frozen=True)
+class GetDownloadUrl(Query[str]):
+    filepath: str
+
+
+@dataclass
+class GetDownloadUrlHandler(QueryHandler[GetDownloadUrl, str]):
+    _file_storage: FileStorage
+
+    async def __call__(self, query: GetDownloadUrl) -> str:
+        return await self._file_storage.get_download_url(query.filepath)
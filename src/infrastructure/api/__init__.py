@@ -1,5 +1,6 @@
 from litestar import Router
 
+from .metrics import router as metrics_router
 from .v1 import router as v1_router
 
 router = Router(
@@ -8,3 +9,5 @@ router = Router(
         v1_router,
     ],
 )
+
+internal_router = Router(path="", route_handlers=[metrics_router])
@@ -0,0 +1,26 @@
+from functools import cache
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
+from typing import Any
+
+from litestar.connection import ASGIConnection
+from litestar.exceptions import PermissionDeniedException
+from litestar.handlers import BaseRouteHandler
+
+from config import get_settings
+
+
+@cache
+def _get_internal_networks() -> tuple[IPv4Network | IPv6Network, ...]:
+    networks = get_settings().app.INTERNAL_NETWORKS.split(",")
+    return tuple(ip_network(network.strip()) for network in networks if network.strip())
+
+
+def internal_only_guard(connection: ASGIConnection[Any, Any, Any, Any], _: BaseRouteHandler) -> None:
+    """Allow only clients from `INTERNAL_NETWORKS`."""
+    host = connection.client.host if connection.client else ""
+    try:
+        address = ip_address(host)
+    except ValueError:
+        address = None
+    if address is None or not any(address in network for network in _get_internal_networks()):
+        raise PermissionDeniedException
@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+
+from dishka.integrations.litestar import FromDishka as Depends
+from dishka.integrations.litestar import inject
+from litestar import Controller, Router, get, status_codes
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from auth.infrastructure.adapters.pwd_manager import PasswordHasherStats, PasswordManager
+from common.infrastructure.adapters.file_storage import S3Client, S3PoolStats, get_s3_pool_stats
+from config import Settings
+from infrastructure.api.guards import internal_only_guard
+from infrastructure.db.pool import DBPoolStats, get_db_pool_stats
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsDTO:
+    s3: S3PoolStats
+    db: DBPoolStats | None
+    password_hasher: PasswordHasherStats
+
+
+class MetricsController(Controller):
+    @get("", status_code=status_codes.HTTP_200_OK, exclude_from_auth=True)
+    @inject
+    async def get_metrics(
+        self,
+        config: Depends[Settings],
+        s3_client: Depends[S3Client],
+        session_maker: Depends[async_sessionmaker[AsyncSession]],
+        pwd_manager: Depends[PasswordManager],
+    ) -> MetricsDTO:
+        engine: AsyncEngine = session_maker.kw["bind"]
+        return MetricsDTO(
+            s3=get_s3_pool_stats(s3_client, config.s3.S3_MAX_POOL_CONNECTIONS),
+            db=get_db_pool_stats(engine),
+            password_hasher=pwd_manager.stats,
+        )
+
+
+# internal endpoint, mounted outside of the public API and open only to `INTERNAL_NETWORKS`
+router = Router(
+    path="/internal/metrics",
+    route_handlers=[MetricsController],
+    guards=[internal_only_guard],
+    include_in_schema=False,
+)
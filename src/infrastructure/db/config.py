@@ -1,10 +1,42 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from config import get_settings
+from infrastructure.db.pool import InstrumentedAsyncQueuePool
+
+
+def create_engine(url: str) -> AsyncEngine:
+    db_settings = get_settings().db
+    connect_args: dict[str, Any] = {
+        "server_settings": {"pg_trgm.similarity_threshold": str(db_settings.TRGM_SIMILARITY_THRESHOLD)},
+        "prepared_statement_cache_size": db_settings.STATEMENT_CACHE_SIZE,
+    }
+    if db_settings.PGBOUNCER:
+        # statements can't be reused across server connections, unique names keep them from clashing
+        connect_args["prepared_statement_cache_size"] = 0
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+
+    return create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=db_settings.POOL_SIZE,
+        max_overflow=db_settings.POOL_MAX_OVERFLOW,
+        pool_timeout=db_settings.POOL_TIMEOUT,
+        pool_recycle=db_settings.POOL_RECYCLE,
+        pool_pre_ping=db_settings.POOL_PRE_PING,
+        connect_args=connect_args,
+    )
 
 
 def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
-    settings = get_settings()
-    db_settings = settings.db
-    async_engine = create_async_engine(db_settings.ASYNC_DATABASE_URL)
+    async_engine = create_engine(get_settings().db.ASYNC_DATABASE_URL)
     return async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False, autocommit=False)
+
+
+def get_replica_sessionmaker() -> async_sessionmaker[AsyncSession] | None:
+    if not (url := get_settings().db.REPLICA_DATABASE_URL):
+        return None
+    return async_sessionmaker(create_engine(url), autoflush=False, expire_on_commit=False, autocommit=False)
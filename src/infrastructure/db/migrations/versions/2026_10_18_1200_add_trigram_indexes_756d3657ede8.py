@@ -0,0 +1,53 @@
+"""add trigram indexes
+
+Revision ID: 756d3657ede8
+Revises: b1f6143cb542
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "756d3657ede8"
+down_revision: Union[str, None] = "b1f6143cb542"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRGM_INDEXES = (
+    ("ix_tag_name_trgm", "tag", "article", "name"),
+    ("ix_vacancy_title_trgm", "vacancy", "job", "title"),
+    ("ix_vacancy_responsibility_trgm", "vacancy", "job", "responsibility"),
+    ("ix_vacancy_requirements_trgm", "vacancy", "job", "requirements"),
+    ("ix_vacancy_additional_description_trgm", "vacancy", "job", "additional_description"),
+    ("ix_skill_name_trgm", "skill", "job", "name"),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, schema, column in TRGM_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                [column],
+                schema=schema,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, schema, _ in TRGM_INDEXES:
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                schema=schema,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
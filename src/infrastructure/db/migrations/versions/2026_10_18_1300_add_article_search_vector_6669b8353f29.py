@@ -0,0 +1,65 @@
+"""add article search vector
+
+Revision ID: 6669b8353f29
+Revises: 756d3657ede8
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "6669b8353f29"
+down_revision: Union[str, None] = "756d3657ede8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_SEARCH_VECTOR = """
+UPDATE article.article AS a SET search_vector =
+    setweight(to_tsvector('russian'::regconfig, coalesce(a.title, '')), 'A')
+    || setweight(to_tsvector('russian'::regconfig, coalesce(
+        (SELECT string_agg(s.title, ' ') FROM article.sub_article AS s WHERE s.article_id = a.id), ''
+    )), 'B')
+    || setweight(to_tsvector('russian'::regconfig, coalesce(
+        (
+            SELECT string_agg(t.name, ' ')
+            FROM article.tag AS t JOIN article.rel_article_tag AS r ON r.tag_id = t.id
+            WHERE r.article_id = a.id
+        ), ''
+    )), 'B')
+    || setweight(to_tsvector('russian'::regconfig, coalesce(a.text, '')), 'C')
+    || setweight(to_tsvector('russian'::regconfig, coalesce(
+        (SELECT string_agg(s.text, ' ') FROM article.sub_article AS s WHERE s.article_id = a.id), ''
+    )), 'D')
+"""
+
+
+def upgrade() -> None:
+    op.add_column("article", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True), schema="article")
+    op.execute(BACKFILL_SEARCH_VECTOR)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_article_search_vector",
+            "article",
+            ["search_vector"],
+            schema="article",
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_article_search_vector",
+            table_name="article",
+            schema="article",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("article", "search_vector", schema="article")
@@ -0,0 +1,110 @@
+"""add article feed
+
+Revision ID: b43b89393114
+Revises: 6669b8353f29
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "b43b89393114"
+down_revision: Union[str, None] = "6669b8353f29"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_ARTICLE_FEED = """
+INSERT INTO article.article_feed (
+    id, title, excerpt, is_visible, author_id, author_nickname, author_name, author_lastname, author_patronymic,
+    author_img, specialization_id, specialization_name, tags, imgs, views_cnt, likes_cnt,
+    dislikes_cnt, search_vector, created_at
+)
+SELECT
+    a.id, a.title, left(a.text, 300), a.is_visible, a.author_id, u.nickname, u.name, u.lastname, u.patronymic,
+    u.image, a.specialization_id, s.name,
+    coalesce(
+        (
+            SELECT jsonb_agg(jsonb_build_object('id', t.id, 'name', t.name) ORDER BY t.name)
+            FROM article.tag AS t JOIN article.rel_article_tag AS r ON r.tag_id = t.id
+            WHERE r.article_id = a.id
+        ),
+        '[]'::jsonb
+    ),
+    coalesce(
+        (SELECT array_agg(i.url ORDER BY i.created_at) FROM article.article_img AS i WHERE i.article_id = a.id),
+        '{}'::text[]
+    ),
+    a.views_cnt, a.likes_cnt, a.dislikes_cnt, a.search_vector, a.created_at
+FROM article.article AS a
+JOIN auth.user AS u ON u.id = a.author_id
+LEFT JOIN article.specialization AS s ON s.id = a.specialization_id
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "article_feed",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("title", sa.String(length=500), nullable=False),
+        sa.Column("excerpt", sa.Text(), nullable=False),
+        sa.Column("is_visible", sa.Boolean(), nullable=False),
+        sa.Column("author_id", sa.Uuid(), nullable=False),
+        sa.Column("author_nickname", sa.String(length=20), nullable=False),
+        sa.Column("author_name", sa.String(length=255), nullable=True),
+        sa.Column("author_lastname", sa.String(length=255), nullable=True),
+        sa.Column("author_patronymic", sa.String(length=255), nullable=True),
+        sa.Column("author_img", sa.String(), nullable=True),
+        sa.Column("specialization_id", sa.Uuid(), nullable=True),
+        sa.Column("specialization_name", sa.String(), nullable=True),
+        sa.Column("tags", postgresql.JSONB(astext_type=sa.Text()), server_default="[]", nullable=False),
+        sa.Column("imgs", postgresql.ARRAY(sa.Text()), server_default="{}", nullable=False),
+        sa.Column("views_cnt", sa.BigInteger(), nullable=False),
+        sa.Column("likes_cnt", sa.BigInteger(), nullable=False),
+        sa.Column("dislikes_cnt", sa.BigInteger(), nullable=False),
+        sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["author_id"], ["auth.user.id"], name=op.f("fk_article_feed_author_id_user"), ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["id"], ["article.article.id"], name=op.f("fk_article_feed_id_article"), ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_article_feed")),
+        schema="article",
+    )
+    op.execute(BACKFILL_ARTICLE_FEED)
+    op.create_index(
+        "ix_article_feed_created_at_id", "article_feed", ["created_at", "id"], unique=False, schema="article"
+    )
+    op.create_index(
+        op.f("ix_article_article_feed_author_id"), "article_feed", ["author_id"], unique=False, schema="article"
+    )
+    op.create_index(
+        op.f("ix_article_article_feed_specialization_id"),
+        "article_feed",
+        ["specialization_id"],
+        unique=False,
+        schema="article",
+    )
+    op.create_index(
+        "ix_article_feed_search_vector",
+        "article_feed",
+        ["search_vector"],
+        unique=False,
+        schema="article",
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_article_feed_search_vector", table_name="article_feed", schema="article")
+    op.drop_index(op.f("ix_article_article_feed_specialization_id"), table_name="article_feed", schema="article")
+    op.drop_index(op.f("ix_article_article_feed_author_id"), table_name="article_feed", schema="article")
+    op.drop_index("ix_article_feed_created_at_id", table_name="article_feed", schema="article")
+    op.drop_table("article_feed", schema="article")
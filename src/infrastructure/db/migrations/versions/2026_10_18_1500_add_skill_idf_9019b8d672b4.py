@@ -0,0 +1,43 @@
+"""add skill idf
+
+Revision ID: 9019b8d672b4
+Revises: b43b89393114
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9019b8d672b4"
+down_revision: Union[str, None] = "b43b89393114"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_SKILL_IDF = """
+INSERT INTO job.skill_idf (skill_id, df)
+SELECT skill_id, count(*) FROM job.rel_vacancy_skill GROUP BY skill_id
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "skill_idf",
+        sa.Column("skill_id", sa.UUID(), nullable=False),
+        sa.Column("df", sa.BigInteger(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["skill_id"], ["job.skill.id"], name=op.f("fk_skill_idf_skill_id_skill"), ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("skill_id", name=op.f("pk_skill_idf")),
+        schema="job",
+    )
+    op.execute(BACKFILL_SKILL_IDF)
+
+
+def downgrade() -> None:
+    op.drop_table("skill_idf", schema="job")
@@ -0,0 +1,51 @@
+"""add keyset indexes
+
+Revision ID: 5d8e2a4c7f31
+Revises: 9019b8d672b4
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d8e2a4c7f31"
+down_revision: Union[str, None] = "9019b8d672b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# `(created_at DESC, id DESC)` indexes matching the order of keyset pagination
+KEYSET_INDEXES = (
+    ("ix_vacancy_created_at_id", "vacancy", "job"),
+    ("ix_cv_created_at_id", "cv", "job"),
+    ("ix_article_created_at_id", "article", "article"),
+    ("ix_comment_created_at_id", "comment", "article"),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, schema in KEYSET_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                [sa.text("created_at DESC"), sa.text("id DESC")],
+                schema=schema,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, schema in KEYSET_INDEXES:
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                schema=schema,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
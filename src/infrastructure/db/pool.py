@@ -0,0 +1,80 @@
+import bisect
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+# upper bounds of checkout wait histogram buckets, seconds
+CHECKOUT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass(slots=True)
+class CheckoutWaitHistogram:
+    buckets: tuple[float, ...] = CHECKOUT_WAIT_BUCKETS
+    counts: list[int] = field(default_factory=lambda: [0] * (len(CHECKOUT_WAIT_BUCKETS) + 1))
+    total: float = 0.0
+    count: int = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait for a connection and how many of them time out."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init__(*args, **kwargs)
+        self.checkout_wait = CheckoutWaitHistogram()
+        self.checkout_timeouts = 0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.checkout_timeouts += 1
+            raise
+        finally:
+            self.checkout_wait.observe(time.perf_counter() - start)
+
+
+@dataclass(frozen=True, slots=True)
+class DBPoolStats:
+    size: int
+    max_overflow: int
+    in_use: int
+    idle: int
+    overflow: int
+    checkout_timeouts: int
+    checkout_wait_buckets: dict[str, int]
+    checkout_wait_sum: float
+    checkout_wait_count: int
+
+
+def get_db_pool_stats(engine: AsyncEngine) -> DBPoolStats | None:
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, InstrumentedAsyncQueuePool):
+        return None
+    histogram = pool.checkout_wait
+    # cumulative counts per upper bound, like prometheus histogram buckets
+    cumulative = 0
+    buckets: dict[str, int] = {}
+    for bound, count in zip((*histogram.buckets, float("inf")), histogram.counts, strict=True):
+        cumulative += count
+        buckets[str(bound)] = cumulative
+    return DBPoolStats(
+        size=pool.size(),
+        max_overflow=pool._max_overflow,  # noqa: SLF001
+        in_use=pool.checkedout(),
+        idle=pool.checkedin(),
+        overflow=max(pool.overflow(), 0),
+        checkout_timeouts=pool.checkout_timeouts,
+        checkout_wait_buckets=buckets,
+        checkout_wait_sum=histogram.total,
+        checkout_wait_count=histogram.count,
+    )
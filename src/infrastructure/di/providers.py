@@ -1,14 +1,21 @@
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, Iterable
 from typing import cast
 
 import aioboto3  # type: ignore  # noqa: PGH003
+from aiobotocore.config import AioConfig  # type: ignore  # noqa: PGH003
 from dishka import AnyOf, Provider, Scope, from_context, provide  # type: ignore  # noqa: PGH003
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from articles.infrastructure.models import Specialization
 from common.application.uow import UnitOfWork
 from common.infrastructure.adapters.file_storage import S3Client
+from common.infrastructure.repositories.dictionary import DictionaryCache
+from common.infrastructure.repositories.replica import ReadSession, ReplicaRouter, track_commits
 from config import Settings
+from infrastructure.db.config import get_replica_sessionmaker
+from job.common.infrastructure.models import EmploymentType, WorkFormat, WorkSchedule
+from job.common.infrastructure.vacancy_index import VacancySkillIndex
 
 
 class AppProvider(Provider):
@@ -21,9 +28,32 @@ class AppProvider(Provider):
         session_maker: async_sessionmaker[AsyncSession],
     ) -> AsyncIterable[AnyOf[AsyncSession, UnitOfWork]]:
         async with session_maker() as session:
+            track_commits(session)
             yield session
 
+    @provide(scope=Scope.APP)
+    async def provide_replica_router(self, config: Settings, redis: Redis) -> AsyncIterable[ReplicaRouter]:
+        router = ReplicaRouter(
+            get_replica_sessionmaker(),
+            redis,
+            prefix=config.redis.PREFIX,
+            max_lag=config.db.REPLICA_MAX_LAG,
+            check_interval=config.db.REPLICA_CHECK_INTERVAL,
+            sticky_window=config.db.READ_YOUR_WRITES_WINDOW,
+        )
+        router.start()
+        yield router
+        await router.close()
+
     @provide(scope=Scope.REQUEST)
+    async def provide_read_session(self, router: ReplicaRouter, session: AsyncSession) -> AsyncIterable[ReadSession]:
+        if not await router.use_replica():
+            yield ReadSession(session)
+            return
+        async with router.session(primary=session) as replica_session:
+            yield ReadSession(replica_session)
+
+    @provide(scope=Scope.APP)
     async def provide_s3_client(self, config: Settings) -> AsyncIterable[S3Client]:
         session = aioboto3.Session()
         async with session.client(  # type: ignore  # noqa: PGH003
@@ -31,6 +61,13 @@ class AppProvider(Provider):
             aws_access_key_id=config.s3.S3_ACCESS_KEY,
             aws_secret_access_key=config.s3.S3_SECRET_KEY,
             endpoint_url=config.s3.S3_ENDPOINT_URL,
+            config=AioConfig(
+                max_pool_connections=config.s3.S3_MAX_POOL_CONNECTIONS,
+                connect_timeout=config.s3.S3_CONNECT_TIMEOUT,
+                read_timeout=config.s3.S3_READ_TIMEOUT,
+                tcp_keepalive=True,
+                connector_args={"keepalive_timeout": config.s3.S3_KEEPALIVE_TIMEOUT},
+            ),
         ) as client:  # type: ignore  # noqa: PGH003
             yield cast(S3Client, client)  # noqa: TC006
 
@@ -44,3 +81,20 @@ class AppProvider(Provider):
             socket_keepalive=config.redis.SOCKET_KEEPALIVE,
             health_check_interval=config.redis.HEALTH_CHECK_INTERVAL,
         )
+
+    @provide(scope=Scope.APP)
+    def provide_dictionary_cache(self, config: Settings) -> Iterable[DictionaryCache]:
+        cache = DictionaryCache(ttl=config.db.DICTIONARY_CACHE_TTL)
+        cache.watch((WorkSchedule, EmploymentType, WorkFormat, Specialization))
+        yield cache
+        cache.unwatch()
+
+    @provide(scope=Scope.APP)
+    async def provide_vacancy_index(
+        self,
+        config: Settings,
+        session_maker: async_sessionmaker[AsyncSession],
+    ) -> AsyncIterable[VacancySkillIndex]:
+        index = VacancySkillIndex(session_maker, ttl=config.db.VACANCY_INDEX_TTL)
+        yield index
+        await index.close()
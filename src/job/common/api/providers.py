@@ -1,6 +1,12 @@
+from collections.abc import AsyncIterable
+
 from dishka import Provider, Scope, provide  # type: ignore  # noqa: PGH003
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from config import Settings
 from job.common.application.ports.repo import VacancyReader
+from job.common.application.queries.export_vacancies import ExportVacanciesHandler
+from job.common.application.queries.export_vacancy_responses import ExportVacancyResponsesHandler
 from job.common.application.queries.get_cv_by_id import GetCVByIdHandler
 from job.common.application.queries.get_employment_types import GetEmploymentTypesHandler
 from job.common.application.queries.get_skills import GetSkillsHandler
@@ -12,11 +18,23 @@ from job.common.application.queries.get_work_schedules import GetWorkSchedulesHa
 from job.common.infrastructure.repositories.cv import AlchemyCVReader
 from job.common.infrastructure.repositories.vacancy import AlchemyVacancyReader
 from job.common.infrastructure.repositories.vacancy_responses import AlchemyVacancyResponseReader
+from job.common.infrastructure.skill_weights import SkillWeights
 
 
 class JobProvider(Provider):
     scope = Scope.REQUEST
 
+    @provide(scope=Scope.APP)
+    async def provide_skill_weights(
+        self,
+        config: Settings,
+        session_maker: async_sessionmaker[AsyncSession],
+    ) -> AsyncIterable[SkillWeights]:
+        weights = SkillWeights()
+        weights.start(session_maker, config.db.SKILL_IDF_RECONCILE_INTERVAL)
+        yield weights
+        await weights.stop()
+
     vacancy_reader = provide(AlchemyVacancyReader, provides=VacancyReader)
     cv_reader = provide(AlchemyCVReader)
     vacancy_response_reader = provide(AlchemyVacancyResponseReader)
@@ -29,3 +47,5 @@ class JobProvider(Provider):
     get_work_formats = provide(GetWorkFormatsHandler)
     get_cv_by_id = provide(GetCVByIdHandler)
     get_vacancy_responses = provide(GetVacancyResponsesHandler)
+    export_vacancies = provide(ExportVacanciesHandler)
+    export_vacancy_responses = provide(ExportVacancyResponsesHandler)
@@ -1,4 +1,4 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Mapping, Sequence
 from typing import TYPE_CHECKING, Protocol
 from uuid import UUID
 
@@ -22,6 +22,8 @@ class VacancyReader(Protocol):
         pagination: PaginationParams,
     ) -> PaginatedDTO[VacancyDTO]: ...
 
+    def export_vacancies(self, query: "GetVacanciesQuery", batch_size: int) -> AsyncIterator[list[VacancyDTO]]: ...
+
     async def get_vacancy_by_id(self, vacancy_id: UUID) -> DetailedVacancyDTO: ...
     async def get_skills(self, search: str | None, pagination: PaginationParams) -> PaginatedDTO[SkillDTO]: ...
 
@@ -31,4 +33,9 @@ class VacancyReader(Protocol):
 
     async def get_weights(self, skill_ids: set[UUID]) -> list[SkillWithWeightDTO]: ...
 
-    async def get_cvs(self, include_skills: set[UUID]) -> list[CVDTO]: ...
+    async def get_recommended_cvs(
+        self,
+        weights: Mapping[UUID, float],
+        limit: int,
+        min_score: float | None = None,
+    ) -> list[tuple[CVDTO, float]]: ...
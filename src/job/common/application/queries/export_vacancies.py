@@ -0,0 +1,15 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from common.application.query import EXPORT_BATCH_SIZE
+from job.common.application.ports.repo import VacancyReader
+from job.common.application.queries.get_vacancies import GetVacanciesQuery
+from job.recruitment.application.dto import VacancyDTO
+
+
+@dataclass(frozen=True, slots=True)
+class ExportVacanciesHandler:
+    _reader: VacancyReader
+
+    def __call__(self, query: GetVacanciesQuery) -> AsyncIterator[list[VacancyDTO]]:
+        return self._reader.export_vacancies(query, batch_size=EXPORT_BATCH_SIZE)
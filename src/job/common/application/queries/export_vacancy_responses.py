@@ -0,0 +1,15 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from common.application.query import EXPORT_BATCH_SIZE
+from job.common.application.queries.get_vacancy_responses import GetVacancyResponsesQuery
+from job.common.infrastructure.repositories.vacancy_responses import AlchemyVacancyResponseReader
+from job.employment.application.dto import VacancyResponseDTO
+
+
+@dataclass(frozen=True, slots=True)
+class ExportVacancyResponsesHandler:
+    _reader: AlchemyVacancyResponseReader
+
+    def __call__(self, query: GetVacancyResponsesQuery) -> AsyncIterator[list[VacancyResponseDTO]]:
+        return self._reader.export_vacancy_responses(query, batch_size=EXPORT_BATCH_SIZE)
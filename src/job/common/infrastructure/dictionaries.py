@@ -0,0 +1,36 @@
+import itertools
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import RowMapping
+
+from common.infrastructure.repositories.base import AlchemyReader
+from common.infrastructure.repositories.dictionary import DictionaryCache
+from job.common.infrastructure.models import EmploymentType, WorkFormat, WorkSchedule
+
+
+@dataclass(frozen=True, slots=True)
+class JobDictionaries:
+    """Names of job reference dictionaries by id."""
+
+    work_schedules: dict[UUID, str]
+    employment_types: dict[UUID, str]
+    work_formats: dict[UUID, str]
+
+
+async def get_job_dictionaries(
+    cache: DictionaryCache,
+    reader: AlchemyReader,
+    rows: Sequence[RowMapping] = (),
+) -> JobDictionaries:
+    """Return dictionaries with every id aggregated into rows by `add_vacancy_relations` or `add_cv_relations`."""
+
+    def get_ids(column: str) -> Iterator[UUID]:
+        return itertools.chain.from_iterable(row[column] or () for row in rows)
+
+    return JobDictionaries(
+        work_schedules=await cache.get(WorkSchedule.__table__, reader, get_ids("work_schedule_ids")),
+        employment_types=await cache.get(EmploymentType.__table__, reader, get_ids("employment_type_ids")),
+        work_formats=await cache.get(WorkFormat.__table__, reader, get_ids("work_format_ids")),
+    )
@@ -1,7 +1,7 @@
-from collections import defaultdict
 from collections.abc import Sequence
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import msgspec
 from sqlalchemy import RowMapping
 
 from job.common.application.dto import EmploymentTypeDTO, SalaryDTO, SkillDTO, WorkFormatDTO, WorkScheduleDTO
@@ -15,21 +15,19 @@ from job.recruitment.application.dto import (
 )
 
 if TYPE_CHECKING:
-    from uuid import UUID
+    from job.common.infrastructure.dictionaries import JobDictionaries
 
 
 def convert_db_to_skill_dto(skill: RowMapping) -> SkillDTO:
     return SkillDTO(name=skill.name, id=skill.id)
 
 
-def convert_db_detailed_vacancy(  # noqa: PLR0913
-    vacancy: RowMapping,
-    skills: Sequence[RowMapping],
-    additional_skills: Sequence[RowMapping],
-    work_schedules: Sequence[RowMapping],
-    employment_types: Sequence[RowMapping],
-    work_formats: Sequence[RowMapping],
-) -> DetailedVacancyDTO:
+def convert_db_to_skill_list(skills: list[dict[str, Any]] | None) -> list[SkillDTO]:
+    """Decode skills aggregated by `aggregate_skills`."""
+    return msgspec.convert(skills or [], list[SkillDTO])
+
+
+def convert_db_detailed_vacancy(vacancy: RowMapping, dictionaries: "JobDictionaries") -> DetailedVacancyDTO:
     return DetailedVacancyDTO(
         title=vacancy.title,
         salary=SalaryDTO(from_=vacancy.salary_from, to=vacancy.salary_to),
@@ -40,11 +38,18 @@ def convert_db_detailed_vacancy(  # noqa: PLR0913
             email=vacancy.company_email if vacancy.company_email else "",
         ),
         work_exp=vacancy.work_exp,
-        work_schedules=[WorkScheduleDTO(name=s.name, id=s.id) for s in work_schedules],
-        employment_types=[EmploymentTypeDTO(name=t.name, id=t.id) for t in employment_types],
-        work_formats=[WorkFormatDTO(name=w.name, id=w.id) for w in work_formats],
-        skills=[SkillDTO(name=s.name, id=s.id) for s in skills],
-        additional_skills=[SkillDTO(name=s.name, id=s.id) for s in additional_skills],
+        work_schedules=[
+            WorkScheduleDTO(name=dictionaries.work_schedules[id_], id=id_) for id_ in vacancy.work_schedule_ids or ()
+        ],
+        employment_types=[
+            EmploymentTypeDTO(name=dictionaries.employment_types[id_], id=id_)
+            for id_ in vacancy.employment_type_ids or ()
+        ],
+        work_formats=[
+            WorkFormatDTO(name=dictionaries.work_formats[id_], id=id_) for id_ in vacancy.work_format_ids or ()
+        ],
+        skills=convert_db_to_skill_list(vacancy.skills),
+        additional_skills=convert_db_to_skill_list(vacancy.additional_skills),
         created_at=vacancy.created_at,
         email=vacancy.email,
         id=vacancy.id,
@@ -56,25 +61,18 @@ def convert_db_detailed_vacancy(  # noqa: PLR0913
     )
 
 
-def convert_db_to_vacancy(  # noqa: PLR0913
-    vacancy: RowMapping,
-    skills: Sequence[RowMapping],
-    additional_skills: Sequence[RowMapping],
-    work_schedules: Sequence[RowMapping],
-    employment_types: Sequence[RowMapping],
-    work_formats: Sequence[RowMapping],
-) -> VacancyDTO:
+def convert_db_to_vacancy(vacancy: RowMapping, dictionaries: "JobDictionaries") -> VacancyDTO:
     return VacancyDTO(
         title=vacancy.title,
         salary=SalaryDTO(from_=vacancy.salary_from, to=vacancy.salary_to),
         address=vacancy.address,
         author=AuthorDTO(name=vacancy.company_name if vacancy.company_name else ""),
         work_exp=vacancy.work_exp,
-        work_schedules=[s.name for s in work_schedules],
-        employment_types=[t.name for t in employment_types],
-        work_formats=[w.name for w in work_formats],
-        skills=[s.name for s in skills],
-        additional_skills=[s.name for s in additional_skills],
+        work_schedules=[dictionaries.work_schedules[id_] for id_ in vacancy.work_schedule_ids or ()],
+        employment_types=[dictionaries.employment_types[id_] for id_ in vacancy.employment_type_ids or ()],
+        work_formats=[dictionaries.work_formats[id_] for id_ in vacancy.work_format_ids or ()],
+        skills=[s["name"] for s in vacancy.skills or ()],
+        additional_skills=[s["name"] for s in vacancy.additional_skills or ()],
         created_at=vacancy.created_at,
         email=vacancy.email,
         education=vacancy.education,
@@ -82,75 +80,24 @@ def convert_db_to_vacancy(  # noqa: PLR0913
     )
 
 
-def convert_db_to_vacancy_list(  # noqa: PLR0913
-    vacancies: Sequence[RowMapping],
-    skills: Sequence[RowMapping],
-    additional_skills: Sequence[RowMapping],
-    work_schedules: Sequence[RowMapping],
-    employment_types: Sequence[RowMapping],
-    work_formats: Sequence[RowMapping],
-) -> list[VacancyDTO]:
-    skill_map: dict[UUID, list[RowMapping]] = defaultdict(list)
-    for skill in skills:
-        skill_map[skill.vacancy_id].append(skill)
-
-    additional_skills_map: dict[UUID, list[RowMapping]] = defaultdict(list)
-    for skill in additional_skills:
-        additional_skills_map[skill.vacancy_id].append(skill)
-
-    schedule_map: dict[UUID, list[RowMapping]] = defaultdict(list)
-    for schedule in work_schedules:
-        schedule_map[schedule.vacancy_id].append(schedule)
-
-    employment_map: dict[UUID, list[RowMapping]] = defaultdict(list)
-    for employment in employment_types:
-        employment_map[employment.vacancy_id].append(employment)
-
-    work_format_map: dict[UUID, list[RowMapping]] = defaultdict(list)
-    for work_format in work_formats:
-        work_format_map[work_format.vacancy_id].append(work_format)
-
-    return [
-        convert_db_to_vacancy(
-            vacancy=vacancy,
-            skills=skill_map[vacancy.id],
-            additional_skills=additional_skills_map[vacancy.id],
-            work_schedules=schedule_map[vacancy.id],
-            employment_types=employment_map[vacancy.id],
-            work_formats=work_format_map[vacancy.id],
-        )
-        for vacancy in vacancies
-    ]
-
-
-def convert_db_to_detailed_cv(  # noqa: PLR0913
-    cv: RowMapping,
-    skills: Sequence[RowMapping],
-    additional_skills: Sequence[RowMapping],
-    work_schedules: Sequence[RowMapping],
-    employment_types: Sequence[RowMapping],
-    work_formats: Sequence[RowMapping],
-    work_exp: Sequence[RowMapping],
-) -> DetailedCVDTO:
+def convert_db_to_vacancy_list(vacancies: Sequence[RowMapping], dictionaries: "JobDictionaries") -> list[VacancyDTO]:
+    return [convert_db_to_vacancy(vacancy, dictionaries) for vacancy in vacancies]
+
+
+def convert_db_to_detailed_cv(cv: RowMapping, dictionaries: "JobDictionaries") -> DetailedCVDTO:
     return DetailedCVDTO(
         title=cv.title,
         is_visible=cv.is_visible,
         salary=SalaryDTO(from_=cv.salary_from, to=cv.salary_to),
-        employment_types=[EmploymentTypeDTO(name=t.name, id=t.id) for t in employment_types],
-        work_schedules=[WorkScheduleDTO(name=s.name, id=s.id) for s in work_schedules],
-        work_exp=[
-            WorkExpDTO(
-                company_name=w.company_name,
-                title=w.title,
-                description=w.description,
-                start_date=w.start_date,
-                end_date=w.end_date,
-                is_relevant=w.is_relevant,
-            )
-            for w in work_exp
+        employment_types=[
+            EmploymentTypeDTO(name=dictionaries.employment_types[id_], id=id_) for id_ in cv.employment_type_ids or ()
+        ],
+        work_schedules=[
+            WorkScheduleDTO(name=dictionaries.work_schedules[id_], id=id_) for id_ in cv.work_schedule_ids or ()
         ],
-        work_formats=[WorkFormatDTO(name=w.name, id=w.id) for w in work_formats],
-        skills=[SkillDTO(name=s.name, id=s.id) for s in skills],
+        work_exp=msgspec.convert(cv.work_exp or [], list[WorkExpDTO]),
+        work_formats=[WorkFormatDTO(name=dictionaries.work_formats[id_], id=id_) for id_ in cv.work_format_ids or ()],
+        skills=convert_db_to_skill_list(cv.skills),
         education=cv.education,
         email=cv.email,
         author=CVAuthorDTO(
@@ -162,7 +109,7 @@ def convert_db_to_detailed_cv(  # noqa: PLR0913
                 ],
             ),
         ),
-        additional_skills=[SkillDTO(name=s.name, id=s.id) for s in additional_skills],
+        additional_skills=convert_db_to_skill_list(cv.additional_skills),
         address=cv.address,
         about_me=cv.about_me,
         cv_file=cv.cv_file,
@@ -1,7 +1,7 @@
 import uuid
 from datetime import date
 
-from sqlalchemy import BigInteger, Enum, ForeignKey, String
+from sqlalchemy import BigInteger, Enum, ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -16,6 +16,29 @@ class JobBase(TimedBaseModel):
 
 class Vacancy(JobBase):
     __tablename__ = "vacancy"
+    __table_args__ = (
+        Index("ix_vacancy_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        Index(
+            "ix_vacancy_responsibility_trgm",
+            "responsibility",
+            postgresql_using="gin",
+            postgresql_ops={"responsibility": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_vacancy_requirements_trgm",
+            "requirements",
+            postgresql_using="gin",
+            postgresql_ops={"requirements": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_vacancy_additional_description_trgm",
+            "additional_description",
+            postgresql_using="gin",
+            postgresql_ops={"additional_description": "gin_trgm_ops"},
+        ),
+        Index("ix_vacancy_created_at_id", text("created_at DESC"), text("id DESC")),
+        {"schema": "job"},
+    )
 
     responsibility: Mapped[str]
     requirements: Mapped[str]
@@ -40,6 +63,10 @@ class Vacancy(JobBase):
 
 class Skill(JobBase):
     __tablename__ = "skill"
+    __table_args__ = (
+        Index("ix_skill_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        {"schema": "job"},
+    )
 
     name: Mapped[str] = mapped_column(String, nullable=False, unique=True)
 
@@ -119,6 +146,16 @@ class RelVacancyAdditionalSkill(JobBase):
     vacancy_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("job.vacancy.id", ondelete="CASCADE"), primary_key=True)
 
 
+class SkillIdf(JobBase):
+    """Document frequency of skill, number of vacancies in `rel_vacancy_skill` with it."""
+
+    __tablename__ = "skill_idf"
+
+    id: None = None  # type: ignore  # noqa: PGH003
+    skill_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("job.skill.id", ondelete="CASCADE"), primary_key=True)
+    df: Mapped[int] = mapped_column(BigInteger, default=0)
+
+
 class Recruiter(JobBase):
     __tablename__ = "recruiter"
 
@@ -132,6 +169,10 @@ class Recruiter(JobBase):
 # --------------------------------------------CV--------------------------------------------------------------
 class CV(JobBase):
     __tablename__ = "cv"
+    __table_args__ = (
+        Index("ix_cv_created_at_id", text("created_at DESC"), text("id DESC")),
+        {"schema": "job"},
+    )
 
     title: Mapped[str]  # position
     is_visible: Mapped[bool]
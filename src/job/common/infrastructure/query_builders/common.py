@@ -1,8 +1,12 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
+from uuid import UUID
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import ColumnElement, Lateral, Select, Uuid, cast, func, literal, select, true
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 
+from common.infrastructure.repositories.search import trgm_distance, trgm_match
 from job.common.infrastructure.models import Skill
 
 _skill = Skill
@@ -15,10 +19,8 @@ class SkillFilters:
 
 
 def search_skill(qs: Select[Any], search: str) -> Select[Any]:
-    qs = qs.where(_skill.name.ilike(f"%{search}%"))
-    return qs.order_by(
-        func.similarity(func.lower(_skill.name), func.lower(search)).desc(),
-    )
+    qs = qs.where(trgm_match(_skill.name, search))
+    return qs.order_by(trgm_distance(_skill.name, search))
 
 
 def filter_skill(qs: Select[Any], filters: SkillFilters) -> Select[Any]:
@@ -37,3 +39,51 @@ def get_skill_qs(filters: SkillFilters | None = None, search: str | None = None)
     if search:
         qs = search_skill(qs, search)
     return qs
+
+
+def get_existing_skills_qs(owner_id: UUID, skill_ids: Iterable[UUID]) -> Select[tuple[UUID, UUID]]:
+    """Select `(owner_id, skill_id)` of given skills that exist, to map them with `INSERT ... FROM SELECT`.
+
+    Existence is checked by the insert itself, so skills created earlier in the same write batch are mapped too.
+    """
+    return select(cast(literal(owner_id), Uuid), _skill.id).where(_skill.id.in_(skill_ids))
+
+
+def aggregate_skills(
+    rel_owner_id: ColumnElement[Any],
+    rel_skill_id: ColumnElement[Any],
+    owner_id: ColumnElement[Any],
+    name: str,
+) -> Lateral:
+    """Aggregate skills of owner row into jsonb array of `{"id", "name"}` objects, NULL if there are none."""
+    return (
+        select(
+            func.jsonb_agg(func.jsonb_build_object("id", _skill.id, "name", _skill.name), type_=JSONB).label(name),
+        )
+        .where((rel_owner_id == owner_id) & (rel_skill_id == _skill.id))
+        .lateral(name)
+    )
+
+
+def aggregate_ids(
+    rel_owner_id: ColumnElement[Any],
+    rel_related_id: ColumnElement[Any],
+    owner_id: ColumnElement[Any],
+    name: str,
+) -> Lateral:
+    """Aggregate ids of related rows into array, NULL if there are none."""
+    return (
+        select(func.array_agg(rel_related_id, type_=ARRAY(rel_related_id.type)).label(name))
+        .where(rel_owner_id == owner_id)
+        .lateral(name)
+    )
+
+
+def add_aggregates(qs: Select[Any], *aggregates: Lateral) -> Select[Any]:
+    """Join aggregating LATERAL subqueries and select their columns.
+
+    Should be applied after count and pagination, so relations are aggregated for returned rows only.
+    """
+    for aggregate in aggregates:
+        qs = qs.outerjoin(aggregate, true()).add_columns(aggregate.c[aggregate.name])
+    return qs
@@ -1,25 +1,21 @@
+from collections.abc import Mapping
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import Select, select
+from sqlalchemy import Float, Lateral, Select, Uuid, column, desc, func, literal, select, true, union, values
+from sqlalchemy.dialects.postgresql import JSONB
 
 from auth.infrastructure.models import User
 from job.common.infrastructure.models import (
     CV,
-    EmploymentType,
     RelCVAdditionalSkill,
     RelCVEmploymentType,
     RelCVSkill,
     RelCVWorkFormat,
     RelCVWorkSchedule,
-    Skill,
     WorkExp,
-    WorkFormat,
-    WorkSchedule,
-)
-from job.common.infrastructure.query_builders.common import (
-    get_skill_qs,
 )
+from job.common.infrastructure.query_builders.common import add_aggregates, aggregate_ids, aggregate_skills
 
 _cv = CV
 _cv_author = User
@@ -30,10 +26,6 @@ _rel_cv_work_format = RelCVWorkFormat
 _rel_cv_additional_skill = RelCVAdditionalSkill
 
 _work_exp = WorkExp
-_skill = Skill
-_schedule = WorkSchedule
-_employment_type = EmploymentType
-_work_format = WorkFormat
 
 
 def get_cv_qs() -> Select[Any]:
@@ -55,76 +47,105 @@ def filter_cv_skill(qs: Select[Any], include_skills: set[UUID]) -> Select[Any]:
     )
 
     additional_skill = select(_rel_cv_additional_skill.cv_id).where(
-        _rel_cv_additional_skill.skill_id.in_(include_skills)
+        _rel_cv_additional_skill.skill_id.in_(include_skills),
     )
     return qs.where(
         _cv.id.in_(skill) | _cv.id.in_(additional_skill),
     )
 
 
-def get_cv_additional_skill_qs(
-    cv_ids: list[UUID],
-) -> Select[Any]:
-    return (
-        get_skill_qs()
-        .add_columns(_rel_cv_additional_skill.cv_id)
-        .join(
-            _rel_cv_additional_skill.__table__,
-            (_rel_cv_additional_skill.skill_id == _skill.id) & _rel_cv_additional_skill.cv_id.in_(cv_ids),
-        )
-    )
-
+def get_cv_scores_qs(weights: Mapping[UUID, float], limit: int, min_score: float | None = None) -> Select[Any]:
+    """Top `limit` CVs by sum of weights of matched skills, normalized by sum of all weights.
 
-def get_cv_skill_qs(
-    cv_ids: list[UUID],
-) -> Select[Any]:
-    return (
-        get_skill_qs()
-        .add_columns(_rel_cv_skill.cv_id)
-        .join(
-            _rel_cv_skill.__table__,
-            (_rel_cv_skill.skill_id == _skill.id) & _rel_cv_skill.cv_id.in_(cv_ids),
-        )
+    Skills are matched from both skills and additional skills of CV, every skill counts once.
+    """
+    skill_weights = values(column("skill_id", Uuid), column("weight", Float), name="skill_weights").data(
+        list(weights.items()),
+    )
+    cv_skills = union(
+        select(_rel_cv_skill.cv_id, _rel_cv_skill.skill_id).where(_rel_cv_skill.skill_id.in_(weights)),
+        select(_rel_cv_additional_skill.cv_id, _rel_cv_additional_skill.skill_id).where(
+            _rel_cv_additional_skill.skill_id.in_(weights),
+        ),
+    ).subquery("cv_skills")
+
+    total = sum(weights.values())
+    score = (func.sum(skill_weights.c.weight) / total) if total else literal(0.0, Float)
+    qs = (
+        select(cv_skills.c.cv_id, score.label("score"))
+        .join(skill_weights, skill_weights.c.skill_id == cv_skills.c.skill_id)
+        .group_by(cv_skills.c.cv_id)
+        .order_by(desc("score"), cv_skills.c.cv_id)
+        .limit(limit)
     )
+    if min_score is not None:
+        qs = qs.having(score >= min_score)
+    return qs
 
 
-def get_cv_work_schedules_qs(cv_ids: list[UUID]) -> Select[Any]:
-    qs = select(_schedule.__table__)
-    if cv_ids:
-        qs = qs.add_columns(
-            _rel_cv_schedule.cv_id,
-        ).join(
-            _rel_cv_schedule.__table__,
-            (_rel_cv_schedule.work_schedule_id == _schedule.id) & _rel_cv_schedule.cv_id.in_(cv_ids),
-        )
-    return qs
+def get_cv_skill_ids_qs(cv_id: UUID) -> Select[tuple[UUID | None]]:
+    """Ids of skills and additional skills of CV, a single `NULL` row for CV without skills."""
+    cv_skills = union(
+        select(_rel_cv_skill.skill_id).where(_rel_cv_skill.cv_id == cv_id),
+        select(_rel_cv_additional_skill.skill_id).where(_rel_cv_additional_skill.cv_id == cv_id),
+    ).subquery("cv_skills")
+    return select(cv_skills.c.skill_id).select_from(_cv).outerjoin(cv_skills, true()).where(_cv.id == cv_id)
 
 
-def get_cv_employment_type_qs(cv_ids: list[UUID]) -> Select[Any]:
-    qs = select(_employment_type.__table__)
-    if cv_ids:
-        qs = qs.add_columns(_rel_cv_employment_type.cv_id).join(
-            _rel_cv_employment_type.__table__,
-            (_rel_cv_employment_type.employment_type_id == _employment_type.id)
-            & _rel_cv_employment_type.cv_id.in_(cv_ids),
+def _aggregate_work_exp() -> Lateral:
+    return (
+        select(
+            func.jsonb_agg(
+                func.jsonb_build_object(
+                    "company_name",
+                    _work_exp.company_name,
+                    "title",
+                    _work_exp.title,
+                    "description",
+                    _work_exp.description,
+                    "start_date",
+                    _work_exp.start_date,
+                    "end_date",
+                    _work_exp.end_date,
+                    "is_relevant",
+                    _work_exp.is_relevant,
+                ),
+                type_=JSONB,
+            ).label("work_exp"),
         )
-    return qs
+        .where(_work_exp.cv_id == _cv.id)
+        .lateral("work_exp")
+    )
 
 
-def get_cv_work_format_qs(cv_ids: list[UUID]) -> Select[Any]:
-    qs = select(_work_format.__table__)
-    if cv_ids:
-        qs = qs.add_columns(_rel_cv_work_format.cv_id).join(
-            _rel_cv_work_format.__table__,
-            (_rel_cv_work_format.work_format_id == _work_format.id) & _rel_cv_work_format.cv_id.in_(cv_ids),
-        )
-    return qs
+def add_cv_skills(qs: Select[Any]) -> Select[Any]:
+    """Add skills of every CV as aggregated columns."""
+    return add_aggregates(
+        qs,
+        aggregate_skills(_rel_cv_skill.cv_id, _rel_cv_skill.skill_id, _cv.id, "skills"),
+        aggregate_skills(
+            _rel_cv_additional_skill.cv_id,
+            _rel_cv_additional_skill.skill_id,
+            _cv.id,
+            "additional_skills",
+        ),
+    )
 
 
-def get_cv_work_exp_qs(cv_ids: list[UUID]) -> Select[Any]:
-    qs = select(_work_exp.__table__)
-    if cv_ids:
-        qs = qs.where(
-            _work_exp.cv_id.in_(cv_ids),
-        )
-    return qs
+def add_cv_relations(qs: Select[Any]) -> Select[Any]:
+    """Add skills, work experience and ids of dictionaries of every CV as aggregated columns.
+
+    Dictionary names are taken from `DictionaryCache`.
+    """
+    return add_aggregates(
+        add_cv_skills(qs),
+        aggregate_ids(_rel_cv_schedule.cv_id, _rel_cv_schedule.work_schedule_id, _cv.id, "work_schedule_ids"),
+        aggregate_ids(
+            _rel_cv_employment_type.cv_id,
+            _rel_cv_employment_type.employment_type_id,
+            _cv.id,
+            "employment_type_ids",
+        ),
+        aggregate_ids(_rel_cv_work_format.cv_id, _rel_cv_work_format.work_format_id, _cv.id, "work_format_ids"),
+        _aggregate_work_exp(),
+    )
@@ -1,10 +1,29 @@
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from sqlalchemy import Float, Select, cast, desc, func, literal, or_, select
+from sqlalchemy import (
+    CompoundSelect,
+    Delete,
+    Float,
+    Select,
+    Update,
+    cast,
+    delete,
+    desc,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    true,
+    union,
+    update,
+)
+from sqlalchemy.dialects.postgresql import Insert, insert
 
+from common.infrastructure.repositories.search import trgm_distance, trgm_match
 from job.common.infrastructure.models import (
-    EmploymentType,
     Recruiter,
     RelVacancyAdditionalSkill,
     RelVacancyEmploymentType,
@@ -12,11 +31,16 @@ from job.common.infrastructure.models import (
     RelVacancyWorkFormat,
     RelVacancyWorkSchedule,
     Skill,
+    SkillIdf,
     Vacancy,
     WorkFormat,
-    WorkSchedule,
 )
-from job.common.infrastructure.query_builders.common import get_skill_qs
+from job.common.infrastructure.query_builders.common import (
+    add_aggregates,
+    aggregate_ids,
+    aggregate_skills,
+    get_existing_skills_qs,
+)
 
 if TYPE_CHECKING:
     from job.common.application.queries.get_vacancies import GetVacanciesQuery
@@ -24,8 +48,7 @@ if TYPE_CHECKING:
 _vacancy = Vacancy
 _recruiter = Recruiter
 _skill = Skill
-_schedule = WorkSchedule
-_employment_type = EmploymentType
+_skill_idf = SkillIdf
 _work_format = WorkFormat
 _rel_schedule_vacancy = RelVacancyWorkSchedule
 _rel_employment_vacancy = RelVacancyEmploymentType
@@ -71,93 +94,64 @@ def filter_vacancy(qs: Select[Any], filters: "GetVacanciesQuery") -> Select[Any]
     return qs
 
 
-def get_vacancy_additional_skill_qs(
-    vacancies_id: list[UUID],
-) -> Select[Any]:
-    return (
-        get_skill_qs()
-        .add_columns(_rel_additional_skill_vacancy.vacancy_id)
-        .join(
-            _rel_additional_skill_vacancy.__table__,
-            (_rel_additional_skill_vacancy.skill_id == _skill.id)
-            & _rel_additional_skill_vacancy.vacancy_id.in_(vacancies_id),
-        )
-    )
-
-
-def get_vacancy_skill_qs(
-    vacancy_ids: list[UUID],
-) -> Select[Any]:
-    return (
-        get_skill_qs()
-        .add_columns(_rel_skill_vacancy.vacancy_id)
-        .join(
-            _rel_skill_vacancy.__table__,
-            (_rel_skill_vacancy.skill_id == _skill.id) & _rel_skill_vacancy.vacancy_id.in_(vacancy_ids),
-        )
-    )
-
+def add_vacancy_relations(qs: Select[Any]) -> Select[Any]:
+    """Add skills and ids of dictionaries of every vacancy as aggregated columns.
 
-def get_work_schedules_qs(vacancies_id: list[UUID] | None = None) -> Select[Any]:
-    qs = select(_schedule.__table__)
-    if vacancies_id:
-        qs = qs.add_columns(
+    Dictionary names are taken from `DictionaryCache`.
+    """
+    return add_aggregates(
+        qs,
+        aggregate_skills(_rel_skill_vacancy.vacancy_id, _rel_skill_vacancy.skill_id, _vacancy.id, "skills"),
+        aggregate_skills(
+            _rel_additional_skill_vacancy.vacancy_id,
+            _rel_additional_skill_vacancy.skill_id,
+            _vacancy.id,
+            "additional_skills",
+        ),
+        aggregate_ids(
             _rel_schedule_vacancy.vacancy_id,
-        ).join(
-            _rel_schedule_vacancy.__table__,
-            (_rel_schedule_vacancy.work_schedule_id == _schedule.id)
-            & _rel_schedule_vacancy.vacancy_id.in_(vacancies_id),
-        )
-    return qs
-
-
-def get_employment_type_qs(vacancies_id: list[UUID] | None = None) -> Select[Any]:
-    qs = select(_employment_type.__table__)
-    if vacancies_id:
-        qs = qs.add_columns(_rel_employment_vacancy.vacancy_id).join(
-            _rel_employment_vacancy.__table__,
-            (_rel_employment_vacancy.employment_type_id == _employment_type.id)
-            & _rel_employment_vacancy.vacancy_id.in_(vacancies_id),
-        )
-    return qs
-
-
-def get_work_format_qs(vacancies_id: list[UUID] | None = None) -> Select[Any]:
-    qs = select(_work_format.__table__)
-    if vacancies_id:
-        qs = qs.add_columns(_rel_work_format_vacancy.vacancy_id).join(
-            _rel_work_format_vacancy.__table__,
-            (_rel_work_format_vacancy.work_format_id == _work_format.id)
-            & _rel_work_format_vacancy.vacancy_id.in_(vacancies_id),
-        )
-    return qs
+            _rel_schedule_vacancy.work_schedule_id,
+            _vacancy.id,
+            "work_schedule_ids",
+        ),
+        aggregate_ids(
+            _rel_employment_vacancy.vacancy_id,
+            _rel_employment_vacancy.employment_type_id,
+            _vacancy.id,
+            "employment_type_ids",
+        ),
+        aggregate_ids(
+            _rel_work_format_vacancy.vacancy_id,
+            _rel_work_format_vacancy.work_format_id,
+            _vacancy.id,
+            "work_format_ids",
+        ),
+    )
 
 
 def search_vacancy(qs: Select[Any], search: str) -> Select[Any]:
     if search == "":
         return qs
     search_table = _rel_skill_vacancy.__table__.join(_skill.__table__, _rel_skill_vacancy.skill_id == _skill.id)
-    skill = select(_rel_skill_vacancy.vacancy_id).select_from(search_table).where(_skill.name.ilike(f"%{search}%"))
+    skill = select(_rel_skill_vacancy.vacancy_id).select_from(search_table).where(trgm_match(_skill.name, search))
     additional_skill = select(_rel_additional_skill_vacancy.vacancy_id)
     additional_skill = additional_skill.select_from(
         _rel_additional_skill_vacancy.__table__.join(
             _skill.__table__,
             (_rel_additional_skill_vacancy.skill_id == _skill.id),
         ),
-    ).where(_skill.name.ilike(f"%{search}%"))
+    ).where(trgm_match(_skill.name, search))
 
     qs = qs.where(
         _vacancy.id.in_(skill)
         | _vacancy.id.in_(additional_skill)
-        | _vacancy.title.ilike(f"%{search}%")
+        | trgm_match(_vacancy.title, search)
         | _vacancy.responsibility.ilike(f"%{search}%")
         | _vacancy.requirements.ilike(f"%{search}%")
         | _vacancy.additional_description.ilike(f"%{search}%"),
     )
 
-    return qs.order_by(
-        func.similarity(func.lower(_vacancy.title), func.lower(search)).desc(),
-    )
+    return qs.order_by(trgm_distance(_vacancy.title, search))
 
 
 def get_vacancy_qs(filters: "GetVacanciesQuery | None" = None, search: str | None = None) -> Select[Any]:
@@ -176,31 +170,75 @@ def get_vacancy_qs(filters: "GetVacanciesQuery | None" = None, search: str | Non
     return qs
 
 
-def get_weight_qs(skill_ids: set[UUID]) -> Select[tuple[UUID, str, float]]:
-    doc_count = select(func.count().label("N")).select_from(_vacancy.__table__).cte("doc_count")
-
-    df = (  # noqa: PD901
+def get_weight_qs(skill_ids: set[UUID], vacancy_count: int) -> Select[tuple[UUID, str, float]]:
+    """Smoothed IDF of skills, read from `skill_idf` by primary key."""
+    return (
         select(
-            _rel_skill_vacancy.skill_id,
+            _skill_idf.skill_id,
             _skill.name.label("skill_name"),
-            func.count(func.distinct(_rel_skill_vacancy.vacancy_id)).label("df"),
+            func.log(cast(literal(vacancy_count), Float) / (_skill_idf.df + 1)).label("idf_smooth"),
         )
-        .join(_skill.__table__, (_skill.id == _rel_skill_vacancy.skill_id) & (_skill.id.in_(skill_ids)))
-        .group_by(_rel_skill_vacancy.skill_id, _skill.name)
-        .cte("df")
+        .join(_skill.__table__, _skill.id == _skill_idf.skill_id)
+        .where(_skill_idf.skill_id.in_(skill_ids), _skill_idf.df > 0)
+        .order_by(desc("idf_smooth"))
     )
 
+
+def get_vacancy_skills_qs(vacancy_ids: set[UUID] | None = None) -> CompoundSelect:
+    """Pairs of visible vacancy and any of its skills or additional skills."""
+    rels = (_rel_skill_vacancy, _rel_additional_skill_vacancy)
+    selects = [
+        select(rel.vacancy_id, rel.skill_id)
+        .join(_vacancy.__table__, (_vacancy.id == rel.vacancy_id) & _vacancy.is_visible)
+        .where(rel.vacancy_id.in_(vacancy_ids) if vacancy_ids is not None else true())
+        for rel in rels
+    ]
+    return union(*selects)
+
+
+def get_map_skills_qs(vacancy_id: UUID, skill_ids: Sequence[UUID]) -> Insert:
+    """Add existing skills to vacancy and count the vacancy in `skill_idf` of each of them in one statement."""
+    mapped = (
+        insert(_rel_skill_vacancy)
+        .from_select(["vacancy_id", "skill_id"], get_existing_skills_qs(vacancy_id, skill_ids))
+        .returning(_rel_skill_vacancy.skill_id)
+        .cte("mapped")
+    )
+    qs = insert(_skill_idf).from_select(["skill_id", "df"], select(mapped.c.skill_id, literal(1)))
+    return qs.on_conflict_do_update(
+        index_elements=[_skill_idf.skill_id],
+        set_={"df": _skill_idf.df + qs.excluded.df, "updated_at": func.now()},
+    ).add_cte(mapped)
+
+
+def get_unmap_skills_qs(vacancy_id: UUID) -> Update:
+    """Remove all skills of vacancy and uncount the vacancy in `skill_idf` of each of them in one statement."""
+    unmapped = (
+        delete(_rel_skill_vacancy)
+        .where(_rel_skill_vacancy.vacancy_id == vacancy_id)
+        .returning(_rel_skill_vacancy.skill_id)
+        .cte("unmapped")
+    )
     return (
-        select(
-            df.c.skill_id,
-            df.c.skill_name,
-            func.log(cast(doc_count.c.N, Float) / (df.c.df + 1)).label("idf_smooth"),
-        )
-        .select_from(
-            df.join(
-                doc_count,
-                literal(True),  # noqa: FBT003
-            ),
-        )
-        .order_by(desc("idf_smooth"))
+        update(_skill_idf)
+        .where(_skill_idf.skill_id.in_(select(unmapped.c.skill_id)))
+        .values(df=_skill_idf.df - 1, updated_at=func.now())
+        .add_cte(unmapped)
+    )
+
+
+def get_recount_skill_idf_qs() -> Insert:
+    """Recount document frequency of every mapped skill from `rel_vacancy_skill`."""
+    recount = select(_rel_skill_vacancy.skill_id, func.count().label("df")).group_by(_rel_skill_vacancy.skill_id)
+    qs = insert(_skill_idf).from_select(["skill_id", "df"], recount)
+    return qs.on_conflict_do_update(
+        index_elements=[_skill_idf.skill_id],
+        set_={"df": qs.excluded.df, "updated_at": func.now()},
+        where=_skill_idf.df != qs.excluded.df,
+    )
+
+
+def get_delete_unmapped_skill_idf_qs() -> Delete:
+    return delete(_skill_idf).where(
+        ~exists().where(_rel_skill_vacancy.skill_id == _skill_idf.skill_id),
     )
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator, Mapping
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, ClassVar
 from uuid import UUID
@@ -6,20 +7,27 @@ import job.common.infrastructure.query_builders.common
 from common.application.dto import PaginatedDTO
 from common.application.query import PaginationParams
 from common.infrastructure.repositories.base import AlchemyReader
+from common.infrastructure.repositories.dictionary import DictionaryCache
 from common.infrastructure.repositories.pagination import AlchemyPaginator
 from job.common.application.dto import EmploymentTypeDTO, SkillDTO, SkillWithWeightDTO, WorkFormatDTO, WorkScheduleDTO
 from job.common.application.exceptions import VacancyIdNotExistError
+from job.common.infrastructure.dictionaries import get_job_dictionaries
 from job.common.infrastructure.mapper import (
     convert_db_detailed_vacancy,
     convert_db_to_skill_dto,
     convert_db_to_vacancy_list,
 )
 from job.common.infrastructure.models import (
+    CV,
+    EmploymentType,
     Skill,
     Vacancy,
+    WorkFormat,
+    WorkSchedule,
 )
 from job.common.infrastructure.query_builders import cv as qb_cv
 from job.common.infrastructure.query_builders import vacancy as qb
+from job.common.infrastructure.skill_weights import SkillWeights
 from job.employment.application.dto import CVDTO
 from job.employment.infrastructure.mapper import convert_db_to_cv_list
 from job.recruitment.application.dto import (
@@ -36,8 +44,11 @@ class AlchemyVacancyReader:
     _paginator: ClassVar[type[AlchemyPaginator]] = AlchemyPaginator
     _vacancy: ClassVar[type[Vacancy]] = Vacancy
     _skill: ClassVar[type[Skill]] = Skill
+    _cv: ClassVar[type[CV]] = CV
 
     _base: AlchemyReader
+    _dictionaries: DictionaryCache
+    _skill_weights: SkillWeights
 
     async def get_vacancies(
         self,
@@ -49,48 +60,43 @@ class AlchemyVacancyReader:
             search=query.search,
         )
 
-        value_count = await self._base.count(qs)
-        qs = self._paginator.paginate(qs, pagination.page, pagination.per_page)
+        value_count = await self._base.count(qs) if pagination.with_count else None
+        # search results are ordered by relevance, so they can't be paginated by `(created_at, id)` cursor
+        if query.search:
+            qs = self._paginator.paginate(qs, pagination.page, pagination.per_page)
+        else:
+            qs = self._paginator.paginate_keyset(qs, pagination, self._vacancy.created_at, self._vacancy.id)
 
-        vacancies = await self._base.fetch_all(qs)
+        vacancies = await self._base.fetch_all(qb.add_vacancy_relations(qs))
         if not vacancies:
             return PaginatedDTO[VacancyDTO](count=value_count, page=pagination.page, results=[])
-        vacancies_id = [vacancy.id for vacancy in vacancies]
-        skills = await self._base.fetch_all(qb.get_vacancy_skill_qs(vacancies_id))
-        additional_skills = await self._base.fetch_all(qb.get_vacancy_additional_skill_qs(vacancies_id))
-        work_schedules = await self._base.fetch_all(qb.get_work_schedules_qs(vacancies_id))
-        employment_types = await self._base.fetch_all(qb.get_employment_type_qs(vacancies_id))
-        work_formats = await self._base.fetch_all(qb.get_work_format_qs(vacancies_id))
+        dictionaries = await get_job_dictionaries(self._dictionaries, self._base, vacancies)
 
         return PaginatedDTO[VacancyDTO](
             count=value_count,
             page=pagination.page,
-            results=convert_db_to_vacancy_list(
-                vacancies, skills, additional_skills, work_schedules, employment_types, work_formats
-            ),
+            results=convert_db_to_vacancy_list(vacancies, dictionaries),
+            next_cursor=None if query.search else self._paginator.get_next_cursor(vacancies, pagination.per_page),
         )
 
+    async def export_vacancies(self, query: "GetVacanciesQuery", batch_size: int) -> AsyncIterator[list[VacancyDTO]]:
+        qs = qb.get_vacancy_qs(filters=query, search=query.search)
+        if not query.search:
+            qs = qs.order_by(self._vacancy.created_at.desc(), self._vacancy.id.desc())
+
+        async for vacancies in self._base.stream(qb.add_vacancy_relations(qs), batch_size):
+            dictionaries = await get_job_dictionaries(self._dictionaries, self._base, vacancies)
+            yield convert_db_to_vacancy_list(vacancies, dictionaries)
+
     async def get_vacancy_by_id(self, vacancy_id: UUID) -> DetailedVacancyDTO:
         qs = qb.get_vacancy_qs().where(self._vacancy.id == vacancy_id)
 
-        vacancy = await self._base.fetch_one(qs)
+        vacancy = await self._base.fetch_one(qb.add_vacancy_relations(qs))
         if vacancy is None:
             raise VacancyIdNotExistError(vacancy_id)
 
-        skills = await self._base.fetch_all(qb.get_vacancy_skill_qs([vacancy.id]))
-        additional_skills = await self._base.fetch_all(qb.get_vacancy_additional_skill_qs([vacancy.id]))
-        work_schedules = await self._base.fetch_all(qb.get_work_schedules_qs([vacancy.id]))
-        employment_types = await self._base.fetch_all(qb.get_employment_type_qs([vacancy_id]))
-        work_formats = await self._base.fetch_all(qb.get_work_format_qs([vacancy.id]))
-
-        return convert_db_detailed_vacancy(
-            vacancy=vacancy,
-            skills=skills,
-            additional_skills=additional_skills,
-            work_schedules=work_schedules,
-            employment_types=employment_types,
-            work_formats=work_formats,
-        )
+        dictionaries = await get_job_dictionaries(self._dictionaries, self._base, [vacancy])
+        return convert_db_detailed_vacancy(vacancy, dictionaries)
 
     async def get_skills(self, search: str | None, pagination: PaginationParams) -> PaginatedDTO[SkillDTO]:
         qs = job.common.infrastructure.query_builders.common.get_skill_qs(search=search)
@@ -110,48 +116,36 @@ class AlchemyVacancyReader:
         )
 
     async def get_work_schedules(self) -> list[WorkScheduleDTO]:
-        qs = qb.get_work_schedules_qs()
-        work_schedules = await self._base.fetch_all(qs)
-        return [WorkScheduleDTO(id=work_schedule.id, name=work_schedule.name) for work_schedule in work_schedules]
+        work_schedules = await self._dictionaries.get(WorkSchedule.__table__, self._base)
+        return [WorkScheduleDTO(id=id_, name=name) for id_, name in work_schedules.items()]
 
     async def get_employment_types(self) -> list[EmploymentTypeDTO]:
-        qs = qb.get_employment_type_qs()
-        employment_types = await self._base.fetch_all(qs)
-        return [
-            EmploymentTypeDTO(id=employment_type.id, name=employment_type.name) for employment_type in employment_types
-        ]
+        employment_types = await self._dictionaries.get(EmploymentType.__table__, self._base)
+        return [EmploymentTypeDTO(id=id_, name=name) for id_, name in employment_types.items()]
 
     async def get_work_formats(self) -> list[WorkFormatDTO]:
-        qs = qb.get_work_format_qs()
-        work_formats = await self._base.fetch_all(qs)
-        return [WorkFormatDTO(id=work_format.id, name=work_format.name) for work_format in work_formats]
+        work_formats = await self._dictionaries.get(WorkFormat.__table__, self._base)
+        return [WorkFormatDTO(id=id_, name=name) for id_, name in work_formats.items()]
 
     async def get_weights(self, skill_ids: set[UUID]) -> list[SkillWithWeightDTO]:
-        qs = qb.get_weight_qs(skill_ids)
-        skills = await self._base.fetch_all(qs)
-        return [
-            SkillWithWeightDTO(
-                id=skill.skill_id,
-                name=skill.skill_name,
-                weight=skill.idf_smooth,
-            )
-            for skill in skills
-        ]
-
-    async def get_cvs(self, include_skills: set[UUID]) -> list[CVDTO]:
-        qs = qb_cv.get_cv_qs()
-        qs = qb_cv.filter_cv_skill(qs, include_skills)
-
-        cv = await self._base.fetch_all(qs)
-        if not cv:
-            return []
-        cv_ids = [cv.id for cv in cv]
-
-        skills = await self._base.fetch_all(qb_cv.get_cv_skill_qs(cv_ids))
-        additional_skills = await self._base.fetch_all(qb_cv.get_cv_additional_skill_qs(cv_ids))
+        return await self._skill_weights.get(self._base, skill_ids)
 
-        return convert_db_to_cv_list(
-            cv_list=cv,
-            skills=skills,
-            additional_skills=additional_skills,
+    async def get_recommended_cvs(
+        self,
+        weights: Mapping[UUID, float],
+        limit: int,
+        min_score: float | None = None,
+    ) -> list[tuple[CVDTO, float]]:
+        """Return top CVs with their scores, scoring is done by `qb_cv.get_cv_scores_qs`."""
+        if not weights:
+            return []
+        scores = qb_cv.get_cv_scores_qs(weights, limit, min_score).subquery("scores")
+        qs = (
+            qb_cv.get_cv_qs()
+            .join(scores, scores.c.cv_id == self._cv.id)
+            .add_columns(scores.c.score)
+            .order_by(scores.c.score.desc(), self._cv.id)
         )
+
+        cvs = await self._base.fetch_all(qb_cv.add_cv_skills(qs))
+        return list(zip(convert_db_to_cv_list(cvs), (cv.score for cv in cvs), strict=True))
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, ClassVar
 
@@ -48,3 +49,16 @@ class AlchemyVacancyResponseReader:
             page=pagination.page,
             results=[convert_db_to_vacancy_responses(i) for i in vacancy_responses],
         )
+
+    async def export_vacancy_responses(
+        self,
+        query: "GetVacancyResponsesQuery",
+        batch_size: int,
+    ) -> AsyncIterator[list[VacancyResponseDTO]]:
+        qs = qb.get_vacancy_responses_qs(filters=query).order_by(
+            self._rel_cv_vacancy.created_at.desc(),
+            self._rel_cv_vacancy.cv_id,
+            self._rel_cv_vacancy.vacancy_id,
+        )
+        async for vacancy_responses in self._base.stream(qs, batch_size):
+            yield [convert_db_to_vacancy_responses(i) for i in vacancy_responses]
@@ -0,0 +1,63 @@
+import asyncio
+from uuid import UUID
+
+import structlog
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from common.infrastructure.repositories.base import AlchemyReader
+from job.common.application.dto import SkillWithWeightDTO
+from job.common.infrastructure.models import Vacancy
+from job.common.infrastructure.query_builders import vacancy as qb
+
+logger = structlog.get_logger(__name__)
+
+
+class SkillWeights:
+    """IDF weights of vacancy skills.
+
+    Document frequencies are persisted in `skill_idf` and changed in the same statement as
+    `rel_vacancy_skill`, so weights are read by primary key. Vacancy count comes from `AlchemyReader.count`,
+    which answers large tables with the planner estimate. The table is periodically recounted
+    to repair drift left by cascade deletes and concurrent writers.
+    """
+
+    def __init__(self) -> None:
+        self._reconcile_task: asyncio.Task[None] | None = None
+
+    async def get(self, reader: AlchemyReader, skill_ids: set[UUID]) -> list[SkillWithWeightDTO]:
+        if not skill_ids or not (vacancy_count := await reader.count(select(Vacancy.id))):
+            return []
+        skills = await reader.fetch_all(qb.get_weight_qs(skill_ids, vacancy_count))
+        return [
+            SkillWithWeightDTO(
+                id=skill.skill_id,
+                name=skill.skill_name,
+                weight=skill.idf_smooth,
+            )
+            for skill in skills
+        ]
+
+    async def reconcile(self, session_maker: async_sessionmaker[AsyncSession]) -> None:
+        async with session_maker() as session:
+            await session.execute(qb.get_recount_skill_idf_qs())
+            await session.execute(qb.get_delete_unmapped_skill_idf_qs())
+            await session.commit()
+
+    async def _run(self, session_maker: async_sessionmaker[AsyncSession], interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.reconcile(session_maker)
+            except Exception:
+                logger.exception("skill idf reconciliation failed")
+
+    def start(self, session_maker: async_sessionmaker[AsyncSession], interval: float) -> None:
+        if self._reconcile_task is None and interval > 0:
+            self._reconcile_task = asyncio.create_task(self._run(session_maker, interval), name="skill-idf-reconcile")
+
+    async def stop(self) -> None:
+        if self._reconcile_task is not None:
+            self._reconcile_task.cancel()
+            await asyncio.gather(self._reconcile_task, return_exceptions=True)
+            self._reconcile_task = None
@@ -0,0 +1,232 @@
+import asyncio
+import time
+from collections import defaultdict
+from collections.abc import Coroutine, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, Self
+from uuid import UUID
+
+import numpy as np
+import structlog
+from scipy import sparse
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from job.common.infrastructure.query_builders import vacancy as qb
+
+logger = structlog.get_logger(__name__)
+
+_SESSION_KEY = "vacancy_index_refresh"
+_REBUILD_KEY = "vacancy_index_rebuild"
+_LISTENING_KEY = "vacancy_index_listening"
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class _SkillMatrix:
+    """Binary vacancy x skill CSR matrix with IDF of skills and inverse weight norms of vacancy rows.
+
+    Rows of changed vacancies are zeroed and their new skills appended as new rows, so `vacancy_ids`
+    maps row to vacancy and `rows` holds the current row of every vacancy in the matrix.
+    Only rows of changed vacancies are read from these mappings, so they are shared with matrices built
+    from this one, which saves copying hundreds of thousands of entries on every refresh.
+    """
+
+    matrix: sparse.csr_array
+    vacancy_ids: list[UUID]
+    rows: dict[UUID, int]
+    columns: dict[UUID, int]
+    df: np.ndarray
+    idf: np.ndarray
+    inv_norms: np.ndarray
+
+    @classmethod
+    def build(cls, skills: Mapping[UUID, Iterable[UUID]], base: Self | None = None) -> Self:
+        """Matrix of vacancy skills, or `base` with rows of `skills` vacancies replaced."""
+        if base is None:
+            data = np.zeros(0, dtype=np.float32)
+            indices = np.zeros(0, dtype=np.int32)
+            indptr = np.zeros(1, dtype=np.int32)
+            vacancy_ids, rows, columns = [], {}, {}
+            df = np.zeros(0, dtype=np.int64)
+        else:
+            data, indices, indptr = base.matrix.data.copy(), base.matrix.indices, base.matrix.indptr
+            vacancy_ids, rows, columns = base.vacancy_ids, base.rows, base.columns
+            df = base.df.copy()
+            for vacancy_id in skills:
+                if (row := rows.pop(vacancy_id, None)) is None:
+                    continue
+                row_data = slice(indptr[row], indptr[row + 1])
+                df[indices[row_data]] -= 1
+                data[row_data] = 0
+
+        added_indices: list[int] = []
+        added_indptr: list[int] = []
+        for vacancy_id, vacancy_skills in skills.items():
+            start = len(added_indices)
+            added_indices.extend(columns.setdefault(skill_id, len(columns)) for skill_id in set(vacancy_skills))
+            if len(added_indices) == start:
+                continue
+            rows[vacancy_id] = len(vacancy_ids)
+            vacancy_ids.append(vacancy_id)
+            added_indptr.append(len(added_indices))
+
+        # rows are appended by concatenation of CSR arrays, which is much cheaper than `sparse.vstack`
+        new_indices = np.array(added_indices, dtype=np.int32)
+        matrix = sparse.csr_array(
+            (
+                np.concatenate((data, np.ones(len(new_indices), dtype=np.float32))),
+                np.concatenate((indices, new_indices)),
+                np.concatenate((indptr, np.array(added_indptr, dtype=np.int32) + indptr[-1])),
+            ),
+            shape=(len(vacancy_ids), len(columns)),
+        )
+        df = np.concatenate((df, np.zeros(len(columns) - len(df), dtype=np.int64)))
+        np.add.at(df, new_indices, 1)
+
+        # N and df of skills change with every vacancy, so weights and norms of all rows are recomputed
+        idf = (np.log((1 + len(rows)) / (1 + df)) + 1).astype(np.float32)
+        norms = matrix @ idf
+        inv_norms = np.divide(1, norms, out=np.zeros_like(norms), where=norms > 0)
+        return cls(matrix, vacancy_ids, rows, columns, df, idf, inv_norms)
+
+    def top(self, skill_ids: Iterable[UUID], limit: int, min_score: float | None) -> list[tuple[UUID, float]]:
+        columns = [column for skill_id in set(skill_ids) if (column := self.columns.get(skill_id)) is not None]
+        if not columns or limit <= 0:
+            return []
+        query = np.zeros(self.matrix.shape[1], dtype=np.float32)
+        query[columns] = self.idf[columns]
+        scores = (self.matrix @ query) * self.inv_norms
+
+        # most scores are zero, partitioning them all is slow, so only matched rows take part
+        matched = np.flatnonzero(scores if min_score is None else (scores > 0) & (scores >= min_score))
+        if len(matched) > limit:
+            matched = matched[np.argpartition(scores[matched], len(matched) - limit)[-limit:]]
+        best = matched[np.argsort(-scores[matched], kind="stable")]
+        return [(self.vacancy_ids[row], float(scores[row])) for row in best]
+
+
+class VacancySkillIndex:
+    """In-memory sparse vacancy x skill matrix of visible vacancies in CSR format.
+
+    Skills and additional skills of vacancy weigh the same, every skill is weighted by smoothed IDF
+    `ln((1 + N) / (1 + df)) + 1`. Score of vacancy for a set of skills is the sum of weights of matched skills
+    divided by the sum of weights of all vacancy skills. It is taken for all vacancies at once with one
+    sparse matrix-vector product, and top-k with `argpartition`.
+
+    Vacancies changed through `refresh` are reloaded after the session commits, the whole index is rebuilt
+    in background when it is older than `ttl` seconds, which picks up changes of other processes
+    and compacts rows of changed vacancies.
+    """
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession], ttl: float) -> None:
+        self._session_maker = session_maker
+        self._ttl = ttl
+        self._matrix = _SkillMatrix.build({})
+        self._built_at: float | None = None
+        self._build_lock = asyncio.Lock()
+        self._rebuilding: set[UUID] | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._rebuild_task: asyncio.Task[None] | None = None
+
+    async def _load(self, vacancy_ids: set[UUID] | None = None) -> dict[UUID, set[UUID]]:
+        skills: dict[UUID, set[UUID]] = defaultdict(set)
+        async with self._session_maker() as session:
+            for vacancy_id, skill_id in await session.execute(qb.get_vacancy_skills_qs(vacancy_ids)):
+                skills[vacancy_id].add(skill_id)
+        return skills
+
+    async def rebuild(self) -> None:
+        self._rebuilding = set()
+        try:
+            skills = await self._load()
+            # building from hundreds of thousands of vacancies takes a while, the loop keeps serving meanwhile
+            self._matrix = await asyncio.to_thread(_SkillMatrix.build, skills)
+        except Exception:
+            self._rebuilding = None
+            raise
+        self._built_at = time.monotonic()
+
+        # vacancies committed while the snapshot was loaded
+        changed, self._rebuilding = self._rebuilding, None
+        if changed:
+            await self._reload(changed)
+
+    async def _ensure_fresh(self) -> None:
+        if self._built_at is None:
+            async with self._build_lock:
+                if self._built_at is None:
+                    await self.rebuild()
+        elif time.monotonic() - self._built_at > self._ttl and (not self._rebuild_task or self._rebuild_task.done()):
+            self._rebuild_task = self._spawn(self._rebuild_in_background())
+
+    async def _rebuild_in_background(self) -> None:
+        async with self._build_lock:
+            try:
+                await self.rebuild()
+            except Exception:
+                logger.exception("vacancy index rebuild failed")
+
+    async def top(
+        self,
+        skill_ids: Iterable[UUID],
+        limit: int,
+        min_score: float | None = None,
+    ) -> list[tuple[UUID, float]]:
+        """Return ids of best matching vacancies with scores, best first."""
+        await self._ensure_fresh()
+        return self._matrix.top(skill_ids, limit, min_score)
+
+    def _listen(self, session: AsyncSession) -> None:
+        if not session.info.get(_LISTENING_KEY):
+            event.listen(session.sync_session, "after_commit", self._on_commit)
+            event.listen(session.sync_session, "after_rollback", self._on_rollback)
+            session.info[_LISTENING_KEY] = True
+
+    def refresh(self, session: AsyncSession, vacancy_id: UUID) -> None:
+        """Reload vacancy into index when session commits."""
+        self._listen(session)
+        session.info.setdefault(_SESSION_KEY, set()).add(vacancy_id)
+
+    def rebuild_on_commit(self, session: AsyncSession) -> None:
+        """Rebuild the whole index in background when session commits, for changes of many vacancies."""
+        self._listen(session)
+        session.info[_REBUILD_KEY] = True
+
+    def _on_commit(self, session: Session) -> None:
+        if session.info.pop(_REBUILD_KEY, False) and self._built_at is not None:
+            session.info.pop(_SESSION_KEY, None)
+            # a rebuild in progress could load its snapshot before the commit, this one waits for it on the lock
+            self._rebuild_task = self._spawn(self._rebuild_in_background())
+            return
+        if not (vacancy_ids := session.info.pop(_SESSION_KEY, None)):
+            return
+        if self._rebuilding is not None:
+            self._rebuilding.update(vacancy_ids)
+        if self._built_at is not None:
+            self._spawn(self._reload(vacancy_ids))
+
+    @staticmethod
+    def _on_rollback(session: Session) -> None:
+        session.info.pop(_SESSION_KEY, None)
+        session.info.pop(_REBUILD_KEY, None)
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _reload(self, vacancy_ids: set[UUID]) -> None:
+        try:
+            skills = await self._load(vacancy_ids)
+        except Exception:
+            logger.exception("failed to reload vacancies into index", vacancy_ids=vacancy_ids)
+            return
+        self._matrix = _SkillMatrix.build(
+            {vacancy_id: skills.get(vacancy_id, ()) for vacancy_id in vacancy_ids},
+            self._matrix,
+        )
+
+    async def close(self) -> None:
+        await asyncio.gather(*self._tasks, return_exceptions=True)
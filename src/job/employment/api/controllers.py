@@ -13,7 +13,7 @@ from auth.api.schemas import JWTUserPayload
 from common.api.exception_handlers import error_handler
 from common.application.dto import PaginatedDTO
 from common.application.query import PaginationParams
-from job.common.application.exceptions import VacancyIdNotExistError
+from job.common.application.exceptions import CVIdNotExistError, VacancyIdNotExistError
 from job.common.application.queries.get_vacancies import GetVacanciesQuery
 from job.employment.api.schemas import (
     CreateCVSchema,
@@ -30,11 +30,14 @@ from job.employment.application.commands.update_cv import UpdateCVHandler
 from job.employment.application.dto import (
     CVDTO,
     VacancyDTO,
+    VacancyWithWeightDTO,
 )
 from job.employment.application.queries.get_cv_list import GetCvListHandler
+from job.employment.application.queries.get_recommendations import GetRecommendedVacanciesHandler
 from job.employment.application.queries.get_responses import GetResponsesHandler
 from job.employment.application.queries.get_vacancies import GetVacanciesHandler
 from job.recruitment.application.exceptions import EmptyEmploymentTypesError, EmptySkillsError, EmptyWorkSchedulesError
+from job.recruitment.application.queries.get_recommendations import DEFAULT_RECOMMENDATIONS_LIMIT
 
 
 class ResponseController(Controller):
@@ -43,6 +46,7 @@ class ResponseController(Controller):
         EmptyEmploymentTypesError: error_handler(status_codes.HTTP_400_BAD_REQUEST),
         EmptyWorkSchedulesError: error_handler(status_codes.HTTP_400_BAD_REQUEST),
         VacancyIdNotExistError: error_handler(status_codes.HTTP_404_NOT_FOUND),
+        CVIdNotExistError: error_handler(status_codes.HTTP_404_NOT_FOUND),
     }
 
     @get(
@@ -144,3 +148,20 @@ class ResponseController(Controller):
         delete_cv: Depends[DeleteCVHandler],
     ) -> None:
         return await delete_cv(cv_id=cv_id)
+
+    @get("/cv/{cv_id:uuid}/recommendations", status_code=status_codes.HTTP_200_OK)
+    @inject
+    async def get_recommended_vacancies(
+        self,
+        cv_id: UUID,
+        get_recommended_vacancies: Depends[GetRecommendedVacanciesHandler],
+        request: Request[JWTUserPayload, str, State],
+        limit: int = DEFAULT_RECOMMENDATIONS_LIMIT,
+        min_score: float | None = None,
+    ) -> list[VacancyWithWeightDTO]:
+        return await get_recommended_vacancies(
+            cv_id=cv_id,
+            employer_id=request.user.sub,
+            limit=limit,
+            min_score=min_score,
+        )
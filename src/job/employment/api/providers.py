@@ -5,6 +5,7 @@ from job.employment.application.commands.delete_cv import DeleteCVHandler
 from job.employment.application.commands.response_to_vacancy import ResponseToVacancyHandler
 from job.employment.application.commands.update_cv import UpdateCVHandler
 from job.employment.application.queries.get_cv_list import GetCvListHandler
+from job.employment.application.queries.get_recommendations import GetRecommendedVacanciesHandler
 from job.employment.application.queries.get_responses import GetResponsesHandler
 from job.employment.application.queries.get_vacancies import GetVacanciesHandler
 from job.employment.infrastructure.dao.employment_type import EmploymentTypeDAO
@@ -43,3 +44,4 @@ class EmploymentProvider(Provider):
     get_vacancies = provide(GetVacanciesHandler)
     get_responses = provide(GetResponsesHandler)
     get_cv_list = provide(GetCvListHandler)
+    get_recommended_vacancies = provide(GetRecommendedVacanciesHandler)
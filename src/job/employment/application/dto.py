@@ -86,3 +86,9 @@ class VacancyDTO(DTO):
     status: VacancyResponseStatusEnum | None
     education: EducationEnum
     id: UUID
+
+
+@dataclass(frozen=True, slots=True)
+class VacancyWithWeightDTO(DTO):
+    vacancy: VacancyDTO
+    weight: float
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from job.employment.application.dto import VacancyWithWeightDTO
+from job.employment.infrastructure.repositories.vacancy import AlchemyEmploymentVacancyReader
+from job.recruitment.application.queries.get_recommendations import (
+    DEFAULT_RECOMMENDATIONS_LIMIT,
+    MAX_RECOMMENDATIONS_LIMIT,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class GetRecommendedVacanciesHandler:
+    _reader: AlchemyEmploymentVacancyReader
+
+    async def __call__(
+        self,
+        cv_id: UUID,
+        employer_id: UUID,
+        limit: int = DEFAULT_RECOMMENDATIONS_LIMIT,
+        min_score: float | None = None,
+    ) -> list[VacancyWithWeightDTO]:
+        return await self._reader.get_recommended_vacancies(
+            cv_id=cv_id,
+            employer_id=employer_id,
+            limit=max(1, min(limit, MAX_RECOMMENDATIONS_LIMIT)),
+            min_score=min_score,
+        )
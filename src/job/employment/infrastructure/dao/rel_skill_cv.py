@@ -2,14 +2,15 @@ from dataclasses import dataclass
 from typing import ClassVar
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete
 from sqlalchemy.dialects.postgresql import insert
 
-from common.infrastructure.repositories.base import AlchemyReader, AlchemyRepo
+from common.infrastructure.repositories.base import AlchemyRepo
 from job.common.infrastructure.models import (
     RelCVSkill,
     Skill,
 )
+from job.common.infrastructure.query_builders.common import get_existing_skills_qs
 
 
 @dataclass(slots=True)
@@ -18,14 +19,12 @@ class RelCVSkillDAO:
     _skill: ClassVar[type[Skill]] = Skill
 
     _repo: AlchemyRepo
-    _reader: AlchemyReader
 
     async def map_skills_to_cv(self, cv_id: UUID, skills_id: list[UUID]) -> None:
-        existing_skills_id = await self._reader.fetch_sequence(
-            select(self._skill.id).where(self._skill.id.in_(skills_id)),
-        )
-        insert_stmt = insert(self._rel_skill_cv).values(
-            [{"cv_id": cv_id, "skill_id": skill_id} for skill_id in existing_skills_id]
+        if not skills_id:
+            return
+        insert_stmt = insert(self._rel_skill_cv).from_select(
+            ["cv_id", "skill_id"], get_existing_skills_qs(cv_id, skills_id)
         )
         await self._repo.execute(insert_stmt)
 
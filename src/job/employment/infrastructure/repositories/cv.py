@@ -1,6 +1,5 @@
-import asyncio
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import ClassVar
 from uuid import UUID
 
 from msgspec import UNSET
@@ -23,9 +22,6 @@ from job.employment.infrastructure.dao.work_format import WorkFormatDAO
 from job.employment.infrastructure.dao.work_schedule import WorkScheduleDAO
 from job.employment.infrastructure.mapper import convert_db_to_cv_list
 
-if TYPE_CHECKING:
-    from collections.abc import Coroutine
-
 
 @dataclass(slots=True)
 class AlchemyCVRepo:
@@ -49,21 +45,17 @@ class AlchemyCVRepo:
         values.pop("work_exp", None)
         values["salary_from"] = cv.salary.from_
         values["salary_to"] = cv.salary.to
-        await self._base.execute(insert(self._cv).values(values))
-
-        tasks: list[Coroutine[Any, Any, None]] = [
-            self._skill.create_skills_for_cv(cv.skills, cv.id),
-            self._employment_type.map_employment_types_to_cv(cv.id, cv.employment_type_ids),
-            self._work_schedule.map_work_schedules_to_cv(cv.id, cv.work_schedule_ids),
-            self._work_format.map_work_formats_to_cv(cv.id, cv.work_formats_id),
-            self._work_exp.create_work_exp(cv_id=cv.id, work_exp=cv.work_exp),
-        ]
-
-        if cv.additional_skills is not UNSET and cv.additional_skills:
-            s = [SkillSchema(id=skill.id, name=skill.name) for skill in cv.additional_skills]
-            tasks.append(self._skill.create_additional_skills_for_cv(s, cv.id))
-
-        await asyncio.gather(*tasks)
+        async with self._base.batch():
+            await self._base.execute(insert(self._cv).values(values))
+            await self._skill.create_skills_for_cv(cv.skills, cv.id)
+            await self._employment_type.map_employment_types_to_cv(cv.id, cv.employment_type_ids)
+            await self._work_schedule.map_work_schedules_to_cv(cv.id, cv.work_schedule_ids)
+            await self._work_format.map_work_formats_to_cv(cv.id, cv.work_formats_id)
+            await self._work_exp.create_work_exp(cv_id=cv.id, work_exp=cv.work_exp)
+
+            if cv.additional_skills is not UNSET and cv.additional_skills:
+                s = [SkillSchema(id=skill.id, name=skill.name) for skill in cv.additional_skills]
+                await self._skill.create_additional_skills_for_cv(s, cv.id)
 
     async def update_cv(self, cv_id: UUID, cv: UpdateCVSchema) -> None:
         values = cv.to_dict()
@@ -79,24 +71,21 @@ class AlchemyCVRepo:
             values["salary_to"] = cv.salary.to
 
         update_stmt = update(self._cv).where(self._cv.id == cv_id).values(values)
-        await self._base.execute(update_stmt)
-
-        tasks: list[Coroutine[Any, Any, None]] = []
-        if cv.skills is not UNSET:
-            tasks.append(self._skill.update_skills_for_cv(cv.skills, cv_id))
-        if cv.additional_skills is not UNSET:
-            s = [SkillSchema(id=skill.id, name=skill.name) for skill in cv.additional_skills]
-            tasks.append(self._skill.update_additional_skills_for_cv(s, cv_id))
-        if cv.employment_type_ids is not UNSET:
-            tasks.append(self._employment_type.update_employment_types_for_cv(cv_id, cv.employment_type_ids))
-        if cv.work_schedule_ids is not UNSET:
-            tasks.append(self._work_schedule.update_work_schedules_for_cv(cv_id, cv.work_schedule_ids))
-        if cv.work_formats_id is not UNSET:
-            tasks.append(self._work_format.update_work_formats_for_cv(cv_id, cv.work_formats_id))
-        if cv.work_exp is not UNSET:
-            tasks.append(self._work_exp.update_work_exp(cv_id, cv.work_exp))
-
-        await asyncio.gather(*tasks)
+        async with self._base.batch():
+            await self._base.execute(update_stmt)
+            if cv.skills is not UNSET:
+                await self._skill.update_skills_for_cv(cv.skills, cv_id)
+            if cv.additional_skills is not UNSET:
+                s = [SkillSchema(id=skill.id, name=skill.name) for skill in cv.additional_skills]
+                await self._skill.update_additional_skills_for_cv(s, cv_id)
+            if cv.employment_type_ids is not UNSET:
+                await self._employment_type.update_employment_types_for_cv(cv_id, cv.employment_type_ids)
+            if cv.work_schedule_ids is not UNSET:
+                await self._work_schedule.update_work_schedules_for_cv(cv_id, cv.work_schedule_ids)
+            if cv.work_formats_id is not UNSET:
+                await self._work_format.update_work_formats_for_cv(cv_id, cv.work_formats_id)
+            if cv.work_exp is not UNSET:
+                await self._work_exp.update_work_exp(cv_id, cv.work_exp)
 
     async def delete_cv(self, cv_id: UUID) -> None:
         await self._base.execute(delete(self._cv).where(self._cv.id == cv_id))
@@ -116,23 +105,14 @@ class AlchemyEmploymentCVReader:
     ) -> PaginatedDTO[CVDTO]:
         qs = qb.get_cv_qs().where(self._cv.author_id == employer_id)
 
-        value_counts = await self._base.count(qs)
-        qs = self._paginator.paginate(qs, pagination.page, pagination.per_page)
-
-        cv = await self._base.fetch_all(qs)
-        if not cv:
-            return PaginatedDTO[CVDTO](count=value_counts, page=pagination.page, results=[])
-        cv_ids = [cv.id for cv in cv]
+        value_counts = await self._base.count(qs) if pagination.with_count else None
+        qs = self._paginator.paginate_keyset(qs, pagination, self._cv.created_at, self._cv.id)
 
-        skills = await self._base.fetch_all(qb.get_cv_skill_qs(cv_ids))
-        additional_skills = await self._base.fetch_all(qb.get_cv_additional_skill_qs(cv_ids))
+        cv = await self._base.fetch_all(qb.add_cv_skills(qs))
 
         return PaginatedDTO[CVDTO](
             count=value_counts,
             page=pagination.page,
-            results=convert_db_to_cv_list(
-                cv_list=cv,
-                skills=skills,
-                additional_skills=additional_skills,
-            ),
+            results=convert_db_to_cv_list(cv),
+            next_cursor=self._paginator.get_next_cursor(cv, pagination.per_page),
         )
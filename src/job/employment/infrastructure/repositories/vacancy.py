@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, ClassVar
+from typing import ClassVar
 from uuid import UUID
 
 from sqlalchemy import select
@@ -7,23 +7,27 @@ from sqlalchemy import select
 from common.application.dto import PaginatedDTO
 from common.application.query import PaginationParams
 from common.infrastructure.repositories.base import AlchemyReader
+from common.infrastructure.repositories.dictionary import DictionaryCache
 from common.infrastructure.repositories.pagination import AlchemyPaginator
+from job.common.application.exceptions import CVIdNotExistError
+from job.common.application.queries.get_vacancies import GetVacanciesQuery
+from job.common.infrastructure.dictionaries import get_job_dictionaries
 from job.common.infrastructure.models import (
     CV,
     RelCVVacancy,
     Vacancy,
 )
+from job.common.infrastructure.query_builders import cv as cv_qb
 from job.common.infrastructure.query_builders import vacancy as qb
+from job.common.infrastructure.vacancy_index import VacancySkillIndex
 from job.employment.application.dto import (
     VacancyDTO,
+    VacancyWithWeightDTO,
 )
 from job.employment.infrastructure.mapper import (
     convert_db_to_vacancy_list,
 )
 
-if TYPE_CHECKING:
-    from job.common.application.queries.get_vacancies import GetVacanciesQuery
-
 
 @dataclass(slots=True)
 class AlchemyEmploymentVacancyReader:
@@ -33,10 +37,12 @@ class AlchemyEmploymentVacancyReader:
     _rel_cv_vacancy: ClassVar[type[RelCVVacancy]] = RelCVVacancy
 
     _base: AlchemyReader
+    _dictionaries: DictionaryCache
+    _index: VacancySkillIndex
 
     def get_vacancy_qs(
         self,
-        query: "GetVacanciesQuery",
+        query: GetVacanciesQuery,
         employer_id: UUID,
     ) -> qb.Select[qb.Any]:
         qs = qb.get_vacancy_qs(
@@ -57,7 +63,7 @@ class AlchemyEmploymentVacancyReader:
 
     def get_responses_qs(
         self,
-        query: "GetVacanciesQuery",
+        query: GetVacanciesQuery,
         employer_id: UUID,
     ) -> qb.Select[qb.Any]:
         qs = qb.get_vacancy_qs(
@@ -78,58 +84,84 @@ class AlchemyEmploymentVacancyReader:
 
     async def get_vacancies(
         self,
-        query: "GetVacanciesQuery",
+        query: GetVacanciesQuery,
         employer_id: UUID,
         pagination: PaginationParams,
     ) -> PaginatedDTO[VacancyDTO]:
         qs = self.get_vacancy_qs(query, employer_id)
 
-        value_count = await self._base.count(qs)
-        qs = self._paginator.paginate(qs, pagination.page, pagination.per_page)
+        value_count = await self._base.count(qs) if pagination.with_count else None
+        # search results are ordered by relevance, so they can't be paginated by `(created_at, id)` cursor
+        if query.search:
+            qs = self._paginator.paginate(qs, pagination.page, pagination.per_page)
+        else:
+            qs = self._paginator.paginate_keyset(qs, pagination, self._vacancy.created_at, self._vacancy.id)
 
-        vacancies = await self._base.fetch_all(qs)
+        vacancies = await self._base.fetch_all(qb.add_vacancy_relations(qs))
         if not vacancies:
             return PaginatedDTO[VacancyDTO](count=value_count, page=pagination.page, results=[])
-        vacancies_id = [vacancy.id for vacancy in vacancies]
-        skills = await self._base.fetch_all(qb.get_vacancy_skill_qs(vacancies_id))
-        additional_skills = await self._base.fetch_all(qb.get_vacancy_additional_skill_qs(vacancies_id))
-        work_schedules = await self._base.fetch_all(qb.get_work_schedules_qs(vacancies_id))
-        employment_types = await self._base.fetch_all(qb.get_employment_type_qs(vacancies_id))
-        work_formats = await self._base.fetch_all(qb.get_work_format_qs(vacancies_id))
+        dictionaries = await get_job_dictionaries(self._dictionaries, self._base, vacancies)
 
         return PaginatedDTO[VacancyDTO](
             count=value_count,
             page=pagination.page,
-            results=convert_db_to_vacancy_list(
-                vacancies, skills, additional_skills, work_schedules, employment_types, work_formats
-            ),
+            results=convert_db_to_vacancy_list(vacancies, dictionaries),
+            next_cursor=None if query.search else self._paginator.get_next_cursor(vacancies, pagination.per_page),
         )
 
     async def get_responses(
         self,
-        query: "GetVacanciesQuery",
+        query: GetVacanciesQuery,
         employer_id: UUID,
         pagination: PaginationParams,
     ) -> PaginatedDTO[VacancyDTO]:
         qs = self.get_responses_qs(query, employer_id)
 
-        value_count = await self._base.count(qs)
-        qs = self._paginator.paginate(qs, pagination.page, pagination.per_page)
+        value_count = await self._base.count(qs) if pagination.with_count else None
+        # search results are ordered by relevance, so they can't be paginated by `(created_at, id)` cursor
+        if query.search:
+            qs = self._paginator.paginate(qs, pagination.page, pagination.per_page)
+        else:
+            qs = self._paginator.paginate_keyset(qs, pagination, self._vacancy.created_at, self._vacancy.id)
 
-        vacancies = await self._base.fetch_all(qs)
+        vacancies = await self._base.fetch_all(qb.add_vacancy_relations(qs))
         if not vacancies:
             return PaginatedDTO[VacancyDTO](count=value_count, page=pagination.page, results=[])
-        vacancies_id = [vacancy.id for vacancy in vacancies]
-        skills = await self._base.fetch_all(qb.get_vacancy_skill_qs(vacancies_id))
-        additional_skills = await self._base.fetch_all(qb.get_vacancy_additional_skill_qs(vacancies_id))
-        work_schedules = await self._base.fetch_all(qb.get_work_schedules_qs(vacancies_id))
-        employment_types = await self._base.fetch_all(qb.get_employment_type_qs(vacancies_id))
-        work_formats = await self._base.fetch_all(qb.get_work_format_qs(vacancies_id))
+        dictionaries = await get_job_dictionaries(self._dictionaries, self._base, vacancies)
 
         return PaginatedDTO[VacancyDTO](
             count=value_count,
             page=pagination.page,
-            results=convert_db_to_vacancy_list(
-                vacancies, skills, additional_skills, work_schedules, employment_types, work_formats
-            ),
+            results=convert_db_to_vacancy_list(vacancies, dictionaries),
+            next_cursor=None if query.search else self._paginator.get_next_cursor(vacancies, pagination.per_page),
+        )
+
+    async def get_recommended_vacancies(
+        self,
+        cv_id: UUID,
+        employer_id: UUID,
+        limit: int,
+        min_score: float | None = None,
+    ) -> list[VacancyWithWeightDTO]:
+        """Top `limit` visible vacancies by skills of CV, best first."""
+        skill_ids = await self._base.fetch_sequence(cv_qb.get_cv_skill_ids_qs(cv_id))
+        if not skill_ids:
+            raise CVIdNotExistError(cv_id)
+
+        top = await self._index.top({skill_id for skill_id in skill_ids if skill_id}, limit, min_score)
+        if not top:
+            return []
+        scores = dict(top)
+
+        qs = self.get_vacancy_qs(GetVacanciesQuery(), employer_id).where(
+            self._vacancy.id.in_(scores),
+            self._vacancy.is_visible,
         )
+        vacancies = await self._base.fetch_all(qb.add_vacancy_relations(qs))
+        dictionaries = await get_job_dictionaries(self._dictionaries, self._base, vacancies)
+
+        results = [
+            VacancyWithWeightDTO(vacancy=vacancy, weight=scores[vacancy.id])
+            for vacancy in convert_db_to_vacancy_list(vacancies, dictionaries)
+        ]
+        return sorted(results, key=lambda result: result.weight, reverse=True)
@@ -1,5 +1,5 @@
 from collections.abc import Mapping
-from typing import ClassVar
+from typing import Annotated, ClassVar
 from uuid import UUID
 
 from dishka import FromDishka as Depends
@@ -8,13 +8,18 @@ from litestar import Controller, Request, Response, delete, get, patch, post, st
 from litestar.datastructures import State
 from litestar.di import Provide
 from litestar.dto import DTOData
+from litestar.params import Parameter
+from litestar.response import Stream
 
 from auth.api.schemas import JWTUserPayload
 from common.api.exception_handlers import error_handler
+from common.api.export import ExportFormat, export_response
 from common.application.dto import PaginatedDTO
 from common.application.query import PaginationParams
 from job.common.application.dto import RecommendationsDTO
 from job.common.application.exceptions import VacancyIdNotExistError
+from job.common.application.queries.export_vacancies import ExportVacanciesHandler
+from job.common.application.queries.export_vacancy_responses import ExportVacancyResponsesHandler
 from job.common.application.queries.get_vacancies import GetVacanciesHandler, GetVacanciesQuery
 from job.common.application.queries.get_vacancy_responses import GetVacancyResponsesHandler, GetVacancyResponsesQuery
 from job.employment.api.schemas import GetVacanciesFilters
@@ -34,10 +39,17 @@ from job.recruitment.application.commands.create_recruiter import CreateRecruite
 from job.recruitment.application.commands.create_vacancy import CreateVacancyHandler
 from job.recruitment.application.commands.delete_vacancy import DeleteVacancyHandler
 from job.recruitment.application.commands.edit_vacancy import UpdateVacancyHandler
+from job.recruitment.application.commands.import_vacancies import (
+    MAX_IMPORT_SIZE,
+    ImportVacancies,
+    ImportVacanciesHandler,
+    VacancyImportFormat,
+)
 from job.recruitment.application.commands.update_recruiter import UpdateRecruiterHandler
 from job.recruitment.application.dto import (
     DetailedAuthorDTO,
     VacancyDTO,
+    VacancyImportDTO,
 )
 from job.recruitment.application.exceptions import (
     EmptyEmploymentTypesError,
@@ -45,7 +57,10 @@ from job.recruitment.application.exceptions import (
     EmptyWorkSchedulesError,
     RecruiterIdNotFoundError,
 )
-from job.recruitment.application.queries.get_recommendations import GetRecommendationsHandler
+from job.recruitment.application.queries.get_recommendations import (
+    DEFAULT_RECOMMENDATIONS_LIMIT,
+    GetRecommendationsHandler,
+)
 from job.recruitment.application.queries.get_recruiter import GetRecruiterHandler
 
 
@@ -73,6 +88,23 @@ class VacancyController(Controller):
         await create_vacancy(data.create_instance(author_id=request.user.sub))
         return Response(content="", status_code=status_codes.HTTP_201_CREATED)
 
+    @post(
+        "/vacancies/import",
+        status_code=status_codes.HTTP_200_OK,
+        request_max_body_size=MAX_IMPORT_SIZE,
+    )
+    @inject
+    async def import_vacancies(
+        self,
+        import_vacancies: Depends[ImportVacanciesHandler],
+        request: Request[JWTUserPayload, str, State],
+        file_format: Annotated[VacancyImportFormat, Parameter(query="format")] = VacancyImportFormat.JSONL,
+    ) -> VacancyImportDTO:
+        """Create vacancies from JSON lines or CSV streamed in request body, invalid rows are reported."""
+        return await import_vacancies(
+            ImportVacancies(body=request.stream(), file_format=file_format, author_id=request.user.sub),
+        )
+
     @patch(
         "/vacancies/{vacancy_id:uuid}",
         status_code=status_codes.HTTP_200_OK,
@@ -114,6 +146,22 @@ class VacancyController(Controller):
             query=GetVacanciesQuery(**filters.to_dict(), author_id=request.user.sub), pagination=pagination_params
         )
 
+    @get(
+        "/vacancies/export",
+        status_code=status_codes.HTTP_200_OK,
+        dependencies={"filters": Provide(GetVacanciesFilters)},
+    )
+    @inject
+    async def export_vacancies(
+        self,
+        filters: GetVacanciesFilters,
+        export_vacancies: Depends[ExportVacanciesHandler],
+        request: Request[JWTUserPayload, str, State],
+        file_format: Annotated[ExportFormat, Parameter(query="format")] = ExportFormat.JSONL,
+    ) -> Stream:
+        batches = export_vacancies(GetVacanciesQuery(**filters.to_dict(), author_id=request.user.sub))
+        return export_response(batches, VacancyDTO, file_format, filename="vacancies")
+
     @post("/vacancies/author", status_code=status_codes.HTTP_201_CREATED, dto=create_recruiter_dto)
     @inject
     async def create_recruiter(
@@ -162,6 +210,18 @@ class VacancyController(Controller):
             query=GetVacancyResponsesQuery(vacancy_id=vacancy_id, vacancy_author_id=request.user.sub),
         )
 
+    @get("/responses/export", status_code=status_codes.HTTP_200_OK)
+    @inject
+    async def export_responses(
+        self,
+        export_responses: Depends[ExportVacancyResponsesHandler],
+        request: Request[JWTUserPayload, str, State],
+        vacancy_id: UUID | None = None,
+        file_format: Annotated[ExportFormat, Parameter(query="format")] = ExportFormat.JSONL,
+    ) -> Stream:
+        batches = export_responses(GetVacancyResponsesQuery(vacancy_id=vacancy_id, vacancy_author_id=request.user.sub))
+        return export_response(batches, VacancyResponseDTO, file_format, filename="responses")
+
     @patch("/responses", status_code=status_codes.HTTP_200_OK)
     @inject
     async def change_response_status(
@@ -179,5 +239,7 @@ class VacancyController(Controller):
         self,
         get_recommendations: Depends[GetRecommendationsHandler],
         vacancy_id: UUID,
+        limit: int = DEFAULT_RECOMMENDATIONS_LIMIT,
+        min_score: float | None = None,
     ) -> RecommendationsDTO:
-        return await get_recommendations(vacancy_id=vacancy_id)
+        return await get_recommendations(vacancy_id=vacancy_id, limit=limit, min_score=min_score)
@@ -5,6 +5,7 @@ from job.recruitment.application.commands.create_recruiter import CreateRecruite
 from job.recruitment.application.commands.create_vacancy import CreateVacancyHandler
 from job.recruitment.application.commands.delete_vacancy import DeleteVacancyHandler
 from job.recruitment.application.commands.edit_vacancy import UpdateVacancyHandler
+from job.recruitment.application.commands.import_vacancies import ImportVacanciesHandler
 from job.recruitment.application.commands.update_recruiter import UpdateRecruiterHandler
 from job.recruitment.application.queries.get_recommendations import GetRecommendationsHandler
 from job.recruitment.application.queries.get_recruiter import GetRecruiterHandler
@@ -16,6 +17,7 @@ from job.recruitment.infrastructure.dao.work_format import WorkFormatDAO
 from job.recruitment.infrastructure.dao.work_schedule import WorkScheduleDAO
 from job.recruitment.infrastructure.repositories.response_to_vacancy import AlchemyRecruitmentVacancyResponseRepo
 from job.recruitment.infrastructure.repositories.vacancy import AlchemyRecruitmentVacancyReader, AlchemyVacancyRepo
+from job.recruitment.infrastructure.repositories.vacancy_import import AlchemyVacancyImportRepo
 
 
 class RecruitmentProvider(Provider):
@@ -24,6 +26,7 @@ class RecruitmentProvider(Provider):
     vacancy_repo = provide(AlchemyVacancyRepo)
     response_repo = provide(AlchemyRecruitmentVacancyResponseRepo)
     vacancy_reader = provide(AlchemyRecruitmentVacancyReader)
+    vacancy_import_repo = provide(AlchemyVacancyImportRepo)
 
     rel_additional_skill_vacancy = provide(RelVacancyAdditionalSkillDAO)
     rel_skill_vacancy = provide(RelVacancySkillDAO)
@@ -35,6 +38,7 @@ class RecruitmentProvider(Provider):
     create_vacancy = provide(CreateVacancyHandler)
     update_vacancy = provide(UpdateVacancyHandler)
     delete_vacancy = provide(DeleteVacancyHandler)
+    import_vacancies = provide(ImportVacanciesHandler)
     create_recruiter = provide(CreateRecruiterHandler)
     update_recruiter = provide(UpdateRecruiterHandler)
     change_response_status = provide(ChangeResponseStatusHandler)
@@ -0,0 +1,186 @@
+import csv
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+from dataclasses import dataclass
+from enum import Enum
+from functools import partial
+from typing import Any
+from uuid import UUID
+
+import msgspec
+
+from common.application.exceptions import ApplicationError
+from common.application.uow import UnitOfWork
+from job.recruitment.api.schemas import CreateVacancySchema
+from job.recruitment.application.dto import VacancyImportDTO, VacancyImportErrorDTO, VacancyReferencesDTO
+from job.recruitment.application.exceptions import (
+    EmptyEmploymentTypesError,
+    EmptySkillsError,
+    EmptyWorkSchedulesError,
+    UnknownReferenceIdsError,
+)
+from job.recruitment.infrastructure.repositories.vacancy_import import AlchemyVacancyImportRepo
+
+IMPORT_BATCH_SIZE = 5000
+MAX_IMPORT_ERRORS = 1000
+MAX_IMPORT_SIZE = 512 * 1024 * 1024  # bytes
+CSV_LIST_SEPARATOR = ";"
+
+_CSV_LIST_FIELDS = frozenset(("employment_type_ids", "work_schedule_ids", "work_formats_id"))
+_CSV_SKILL_FIELDS = frozenset(("skills", "additional_skills"))
+_CSV_SALARY_FIELDS = {"salary_from": "from", "salary_to": "to"}
+
+
+class VacancyImportFormat(str, Enum):
+    JSONL = "jsonl"
+    CSV = "csv"
+
+
+@dataclass(frozen=True, slots=True)
+class ImportVacancies:
+    """Rows of `CreateVacancySchema` streamed as JSON lines or CSV.
+
+    CSV header names schema fields, salary goes in `salary_from` and `salary_to` columns,
+    lists are separated by `CSV_LIST_SEPARATOR` and skills are given by name.
+    """
+
+    body: AsyncIterable[bytes]
+    file_format: VacancyImportFormat
+    author_id: UUID
+
+
+async def _iter_lines(body: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    buffer = b""
+    async for chunk in body:
+        *lines, buffer = (buffer + chunk).split(b"\n")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
+
+
+async def _iter_csv_records(body: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Yield CSV records, joining lines while a quoted field is open."""
+    pending: list[str] = []
+    async for line in _iter_lines(body):
+        pending.append(line.decode(errors="replace").removesuffix("\r"))
+        if sum(part.count('"') for part in pending) % 2:
+            continue
+        yield "\n".join(pending)
+        pending = []
+    if pending:
+        yield "\n".join(pending)
+
+
+def _split(value: str) -> list[str]:
+    return [item for item in (item.strip() for item in value.split(CSV_LIST_SEPARATOR)) if item]
+
+
+def _convert_csv_record(header: list[str], record: str) -> dict[str, Any]:
+    values = next(csv.reader([record]))
+    if len(values) != len(header):
+        msg = f"Expected {len(header)} columns, got {len(values)}"
+        raise ValueError(msg)
+
+    row: dict[str, Any] = {}
+    salary: dict[str, str] = {}
+    for name, raw in zip(header, values, strict=True):
+        if not (value := raw.strip()):
+            continue
+        if name in _CSV_SALARY_FIELDS:
+            salary[_CSV_SALARY_FIELDS[name]] = value
+        elif name in _CSV_LIST_FIELDS:
+            row[name] = _split(value)
+        elif name in _CSV_SKILL_FIELDS:
+            row[name] = [{"name": skill} for skill in _split(value)]
+        else:
+            row[name] = value
+    if salary:
+        row["salary"] = salary
+    return row
+
+
+def _convert_json_line(line: bytes) -> dict[str, Any]:
+    row = msgspec.json.decode(line)
+    if not isinstance(row, dict):
+        msg = "Expected JSON object"
+        raise TypeError(msg)
+    return row
+
+
+def _check_references(field: str, ids: Iterable[UUID], existing: frozenset[UUID]) -> None:
+    if unknown := [_id for _id in ids if _id not in existing]:
+        raise UnknownReferenceIdsError(field=field, ids=unknown)
+
+
+@dataclass(slots=True)
+class ImportVacanciesHandler:
+    _repo: AlchemyVacancyImportRepo
+    _uow: UnitOfWork
+
+    @staticmethod
+    async def _iter_rows(command: ImportVacancies) -> AsyncIterator[tuple[int, Callable[[], dict[str, Any]]]]:
+        """Yield number of row with converter of it into schema fields, blank lines are skipped."""
+        number = 0
+        if command.file_format is VacancyImportFormat.JSONL:
+            async for line in _iter_lines(command.body):
+                if line.strip():
+                    number += 1
+                    yield number, partial(_convert_json_line, line)
+            return
+
+        header: list[str] | None = None
+        async for record in _iter_csv_records(command.body):
+            if not record.strip():
+                continue
+            if header is None:
+                header = [name.strip() for name in next(csv.reader([record]))]
+                continue
+            number += 1
+            yield number, partial(_convert_csv_record, header, record)
+
+    @staticmethod
+    def _validate(row: dict[str, Any], author_id: UUID, references: VacancyReferencesDTO) -> CreateVacancySchema:
+        # imported vacancies are always new and belong to the importing recruiter
+        row.pop("id", None)
+        row["author_id"] = author_id
+        vacancy = msgspec.convert(row, CreateVacancySchema, strict=False)
+
+        if not vacancy.skills:
+            raise EmptySkillsError
+        if not vacancy.employment_type_ids:
+            raise EmptyEmploymentTypesError
+        if not vacancy.work_schedule_ids:
+            raise EmptyWorkSchedulesError
+        _check_references("employment_type_ids", vacancy.employment_type_ids, references.employment_type_ids)
+        _check_references("work_schedule_ids", vacancy.work_schedule_ids, references.work_schedule_ids)
+        _check_references("work_formats_id", vacancy.work_formats_id, references.work_format_ids)
+        return vacancy
+
+    async def __call__(self, command: ImportVacancies) -> VacancyImportDTO:
+        """Import valid rows in one transaction and report errors of the others."""
+        references = await self._repo.get_references()
+        imported = failed = 0
+        errors: list[VacancyImportErrorDTO] = []
+        batch: list[CreateVacancySchema] = []
+
+        async for number, convert in self._iter_rows(command):
+            try:
+                batch.append(self._validate(convert(), command.author_id, references))
+            except (msgspec.MsgspecError, ValueError, TypeError, csv.Error, ApplicationError) as error:
+                failed += 1
+                if len(errors) < MAX_IMPORT_ERRORS:
+                    message = error.message if isinstance(error, ApplicationError) else str(error)
+                    errors.append(VacancyImportErrorDTO(row=number, message=message))
+                continue
+
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                await self._repo.import_vacancies(batch)
+                imported += len(batch)
+                batch = []
+
+        if batch:
+            await self._repo.import_vacancies(batch)
+            imported += len(batch)
+        if imported:
+            await self._uow.commit()
+        return VacancyImportDTO(imported=imported, failed=failed, errors=errors)
@@ -57,3 +57,23 @@ class DetailedVacancyDTO(DTO):
     additional_description: str | None
     address: str | None
     id: UUID
+
+
+@dataclass(frozen=True, slots=True)
+class VacancyReferencesDTO(DTO):
+    employment_type_ids: frozenset[UUID]
+    work_schedule_ids: frozenset[UUID]
+    work_format_ids: frozenset[UUID]
+
+
+@dataclass(frozen=True, slots=True)
+class VacancyImportErrorDTO(DTO):
+    row: int
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class VacancyImportDTO(DTO):
+    imported: int
+    failed: int
+    errors: list[VacancyImportErrorDTO]
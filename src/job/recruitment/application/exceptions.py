@@ -39,3 +39,13 @@ class RecruiterIdNotFoundError(ApplicationError):
     @property
     def message(self) -> str:
         return f"Recruiter with id {self.recruiter_id} not found"
+
+
+@dataclass(slots=True, eq=False)
+class UnknownReferenceIdsError(ApplicationError):
+    field: str
+    ids: list[UUID]
+
+    @property
+    def message(self) -> str:
+        return f"Unknown {self.field}: {', '.join(str(_id) for _id in self.ids)}"
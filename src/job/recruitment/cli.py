@@ -0,0 +1,58 @@
+"""Import vacancies from a file.
+
+python -m job.recruitment.cli vacancies.csv --author-id <recruiter id> --format csv
+"""
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+from uuid import UUID
+
+import msgspec
+
+from infrastructure.di import get_ioc
+from job.recruitment.application.commands.import_vacancies import (
+    ImportVacancies,
+    ImportVacanciesHandler,
+    VacancyImportFormat,
+)
+from job.recruitment.application.dto import VacancyImportDTO
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+async def _read_file(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as file:
+        while chunk := await asyncio.to_thread(file.read, READ_CHUNK_SIZE):
+            yield chunk
+
+
+async def import_vacancies(path: Path, file_format: VacancyImportFormat, author_id: UUID) -> VacancyImportDTO:
+    container = get_ioc()
+    try:
+        async with container() as request_container:
+            handler = await request_container.get(ImportVacanciesHandler)
+            return await handler(ImportVacancies(body=_read_file(path), file_format=file_format, author_id=author_id))
+    finally:
+        await container.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import vacancies from JSON lines or CSV file.")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--author-id", type=UUID, required=True)
+    parser.add_argument(
+        "--format",
+        choices=[file_format.value for file_format in VacancyImportFormat],
+        default=VacancyImportFormat.JSONL.value,
+        dest="file_format",
+    )
+    args = parser.parse_args()
+
+    result = asyncio.run(import_vacancies(args.path, VacancyImportFormat(args.file_format), args.author_id))
+    print(msgspec.json.format(msgspec.json.encode(result)).decode())  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
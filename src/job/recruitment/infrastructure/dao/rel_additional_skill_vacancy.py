@@ -2,14 +2,15 @@ from dataclasses import dataclass
 from typing import ClassVar
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete
 from sqlalchemy.dialects.postgresql import insert
 
-from common.infrastructure.repositories.base import AlchemyReader, AlchemyRepo
+from common.infrastructure.repositories.base import AlchemyRepo
 from job.common.infrastructure.models import (
     RelVacancyAdditionalSkill,
     Skill,
 )
+from job.common.infrastructure.query_builders.common import get_existing_skills_qs
 
 
 @dataclass(slots=True)
@@ -18,14 +19,12 @@ class RelVacancyAdditionalSkillDAO:
     _rel_additional_skill_vacancy: ClassVar[type[RelVacancyAdditionalSkill]] = RelVacancyAdditionalSkill
 
     _repo: AlchemyRepo
-    _reader: AlchemyReader
 
     async def map_additional_skills_to_vacancy(self, vacancy_id: UUID, skills_id: list[UUID]) -> None:
-        existing_skills_id = await self._reader.fetch_sequence(
-            select(self._skill.id).where(self._skill.id.in_(skills_id)),
-        )
-        insert_stmt = insert(self._rel_additional_skill_vacancy).values(
-            [{"vacancy_id": vacancy_id, "skill_id": skill_id} for skill_id in existing_skills_id]
+        if not skills_id:
+            return
+        insert_stmt = insert(self._rel_additional_skill_vacancy).from_select(
+            ["vacancy_id", "skill_id"], get_existing_skills_qs(vacancy_id, skills_id)
         )
         await self._repo.execute(insert_stmt)
 
@@ -1,6 +1,5 @@
-import asyncio
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import ClassVar
 from uuid import UUID
 
 from msgspec import UNSET
@@ -12,6 +11,7 @@ from job.common.infrastructure.models import (
     Recruiter,
     Vacancy,
 )
+from job.common.infrastructure.vacancy_index import VacancySkillIndex
 from job.recruitment.api.schemas import (
     CreateRecruiterSchema,
     CreateVacancySchema,
@@ -27,9 +27,6 @@ from job.recruitment.infrastructure.dao.skill import SkillDAO
 from job.recruitment.infrastructure.dao.work_format import WorkFormatDAO
 from job.recruitment.infrastructure.dao.work_schedule import WorkScheduleDAO
 
-if TYPE_CHECKING:
-    from collections.abc import Coroutine
-
 
 @dataclass(slots=True)
 class AlchemyVacancyRepo:
@@ -46,6 +43,7 @@ class AlchemyVacancyRepo:
     _work_schedule: WorkScheduleDAO
     _work_format: WorkFormatDAO
     _employment_type: EmploymentTypeDAO
+    _index: VacancySkillIndex
 
     async def create_vacancy(self, vacancy: CreateVacancySchema) -> None:
         values = vacancy.to_dict()
@@ -57,22 +55,19 @@ class AlchemyVacancyRepo:
         values.pop("work_formats_id", None)
         values["salary_from"] = vacancy.salary.from_
         values["salary_to"] = vacancy.salary.to
-        await self._repo.execute(insert(self._vacancy).values(values))
-
-        tasks: list[Coroutine[Any, Any, None]] = [
-            self._skill.create_skills_for_vacancy(vacancy.skills, vacancy.id),
-            self._employment_type.map_employment_types_to_vacancy(vacancy.id, vacancy.employment_type_ids),
-            self._work_schedule.map_work_schedules_to_vacancy(vacancy.id, vacancy.work_schedule_ids),
-            self._work_format.map_work_format_to_vacancy(vacancy.id, vacancy.work_formats_id),
-        ]
+        async with self._repo.batch():
+            await self._repo.execute(insert(self._vacancy).values(values))
+            await self._skill.create_skills_for_vacancy(vacancy.skills, vacancy.id)
+            await self._employment_type.map_employment_types_to_vacancy(vacancy.id, vacancy.employment_type_ids)
+            await self._work_schedule.map_work_schedules_to_vacancy(vacancy.id, vacancy.work_schedule_ids)
+            await self._work_format.map_work_format_to_vacancy(vacancy.id, vacancy.work_formats_id)
 
-        if vacancy.additional_skills is not UNSET and vacancy.additional_skills:
-            from job.common.api.schemas import SkillSchema
+            if vacancy.additional_skills is not UNSET and vacancy.additional_skills:
+                from job.common.api.schemas import SkillSchema
 
-            s = [SkillSchema(id=skill.id, name=skill.name) for skill in vacancy.additional_skills]
-            tasks.append(self._skill.create_additional_skills_for_vacancy(s, vacancy.id))
-
-        await asyncio.gather(*tasks)
+                s = [SkillSchema(id=skill.id, name=skill.name) for skill in vacancy.additional_skills]
+                await self._skill.create_additional_skills_for_vacancy(s, vacancy.id)
+        self._index.refresh(self._repo.session, vacancy.id)
 
     async def update_vacancy(self, vacancy_id: UUID, vacancy: UpdateVacancySchema) -> None:
         values = vacancy.to_dict()
@@ -87,27 +82,29 @@ class AlchemyVacancyRepo:
             values["salary_to"] = vacancy.salary.to
 
         update_stmt = update(self._vacancy).where(self._vacancy.id == vacancy_id).values(values)
-        await self._repo.execute(update_stmt)
-
-        tasks: list[Coroutine[Any, Any, None]] = []
-        if vacancy.skills is not UNSET:
-            tasks.append(self._skill.update_skills(vacancy.skills, vacancy_id))
-        if vacancy.additional_skills is not UNSET:
-            from job.common.api.schemas import SkillSchema
-
-            s = [SkillSchema(id=skill.id, name=skill.name) for skill in vacancy.additional_skills]
-            tasks.append(self._skill.update_additional_skills(s, vacancy_id))
-        if vacancy.employment_type_ids is not UNSET:
-            tasks.append(self._employment_type.update_employment_types(vacancy_id, vacancy.employment_type_ids))
-        if vacancy.work_schedule_ids is not UNSET:
-            tasks.append(self._work_schedule.update_work_schedules(vacancy_id, vacancy.work_schedule_ids))
-        if vacancy.work_formats_id is not UNSET:
-            tasks.append(self._work_format.update_work_format(vacancy_id, vacancy.work_formats_id))
-
-        await asyncio.gather(*tasks)
+        async with self._repo.batch():
+            await self._repo.execute(update_stmt)
+            if vacancy.skills is not UNSET:
+                await self._skill.update_skills(vacancy.skills, vacancy_id)
+            if vacancy.additional_skills is not UNSET:
+                from job.common.api.schemas import SkillSchema
+
+                s = [SkillSchema(id=skill.id, name=skill.name) for skill in vacancy.additional_skills]
+                await self._skill.update_additional_skills(s, vacancy_id)
+            if vacancy.employment_type_ids is not UNSET:
+                await self._employment_type.update_employment_types(vacancy_id, vacancy.employment_type_ids)
+            if vacancy.work_schedule_ids is not UNSET:
+                await self._work_schedule.update_work_schedules(vacancy_id, vacancy.work_schedule_ids)
+            if vacancy.work_formats_id is not UNSET:
+                await self._work_format.update_work_format(vacancy_id, vacancy.work_formats_id)
+        self._index.refresh(self._repo.session, vacancy_id)
 
     async def delete_vacancy(self, vacancy_id: UUID) -> None:
-        await self._repo.execute(delete(self._vacancy).where(self._vacancy.id == vacancy_id))
+        # skills are unmapped explicitly instead of cascade to keep `skill_idf` in sync
+        async with self._repo.batch():
+            await self._rel_skill_vacancy.unmap_skills_from_vacancy(vacancy_id)
+            await self._repo.execute(delete(self._vacancy).where(self._vacancy.id == vacancy_id))
+        self._index.refresh(self._repo.session, vacancy_id)
 
     async def create_recruiter(self, command: CreateRecruiterSchema) -> None:
         insert_stmt = insert(self._recruiter).values(command.to_dict())
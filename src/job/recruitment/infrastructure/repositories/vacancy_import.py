@@ -0,0 +1,191 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import ClassVar
+
+from msgspec import UNSET
+from sqlalchemy import Boolean, Column, MetaData, String, Table, Uuid, delete, func, select
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.schema import CreateTable
+
+from common.infrastructure.repositories.base import AlchemyReader, AlchemyRepo
+from common.infrastructure.repositories.batch import copy_records
+from job.common.infrastructure.models import (
+    EmploymentType,
+    RelVacancyAdditionalSkill,
+    RelVacancyEmploymentType,
+    RelVacancySkill,
+    RelVacancyWorkFormat,
+    RelVacancyWorkSchedule,
+    Skill,
+    SkillIdf,
+    Vacancy,
+    WorkFormat,
+    WorkSchedule,
+)
+from job.common.infrastructure.vacancy_index import VacancySkillIndex
+from job.recruitment.api.schemas import CreateVacancySchema
+from job.recruitment.application.dto import VacancyReferencesDTO
+
+_VACANCY_COLUMNS = (
+    "id",
+    "title",
+    "is_visible",
+    "salary_from",
+    "salary_to",
+    "work_exp",
+    "education",
+    "email",
+    "responsibility",
+    "requirements",
+    "additional_description",
+    "address",
+    "author_id",
+)
+
+# staging tables live until the end of the import transaction
+_staging = MetaData()
+_vacancy_import = Table(
+    "vacancy_import",
+    _staging,
+    *(Column(name, Vacancy.__table__.c[name].type) for name in _VACANCY_COLUMNS),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+_vacancy_import_skill = Table(
+    "vacancy_import_skill",
+    _staging,
+    Column("vacancy_id", Uuid),
+    Column("name", String),
+    Column("is_additional", Boolean),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+_vacancy_import_ref = Table(
+    "vacancy_import_ref",
+    _staging,
+    Column("vacancy_id", Uuid),
+    Column("kind", String),
+    Column("ref_id", Uuid),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+_REF_RELATIONS = {
+    "employment_type": (RelVacancyEmploymentType.__table__, "employment_type_id"),
+    "work_schedule": (RelVacancyWorkSchedule.__table__, "work_schedule_id"),
+    "work_format": (RelVacancyWorkFormat.__table__, "work_format_id"),
+}
+
+
+def _get_map_skills_qs(*, is_additional: bool) -> Insert:
+    """Map staged skills to vacancies by name, main skills are counted in `skill_idf` by the same statement."""
+    stage = _vacancy_import_skill
+    staged = (
+        select(stage.c.vacancy_id, Skill.id)
+        .join(Skill, Skill.name == stage.c.name)
+        .where(stage.c.is_additional.is_(is_additional))
+        .distinct()
+    )
+    if is_additional:
+        return insert(RelVacancyAdditionalSkill).from_select(["vacancy_id", "skill_id"], staged)
+
+    mapped = (
+        insert(RelVacancySkill)
+        .from_select(["vacancy_id", "skill_id"], staged)
+        .returning(RelVacancySkill.skill_id)
+        .cte("mapped")
+    )
+    qs = insert(SkillIdf).from_select(
+        ["skill_id", "df"],
+        select(mapped.c.skill_id, func.count()).group_by(mapped.c.skill_id),
+    )
+    return qs.on_conflict_do_update(
+        index_elements=[SkillIdf.skill_id],
+        set_={"df": SkillIdf.df + qs.excluded.df, "updated_at": func.now()},
+    ).add_cte(mapped)
+
+
+def _get_map_refs_qs(kind: str) -> Insert:
+    table, ref_column = _REF_RELATIONS[kind]
+    stage = _vacancy_import_ref
+    staged = select(stage.c.vacancy_id, stage.c.ref_id).where(stage.c.kind == kind).distinct()
+    return insert(table).from_select(["vacancy_id", ref_column], staged)
+
+
+@dataclass(slots=True)
+class AlchemyVacancyImportRepo:
+    """Bulk vacancy import.
+
+    Vacancies, their skills and relations are loaded with `COPY` into temporary staging tables
+    and moved into job tables with a few set-based inserts. Skills are resolved by name,
+    missing ones are created, ids of skills in rows are ignored.
+    """
+
+    _staging_tables: ClassVar[tuple[Table, ...]] = (_vacancy_import, _vacancy_import_skill, _vacancy_import_ref)
+
+    _repo: AlchemyRepo
+    _reader: AlchemyReader
+    _index: VacancySkillIndex
+
+    async def get_references(self) -> VacancyReferencesDTO:
+        return VacancyReferencesDTO(
+            employment_type_ids=frozenset(await self._reader.fetch_sequence(select(EmploymentType.id))),
+            work_schedule_ids=frozenset(await self._reader.fetch_sequence(select(WorkSchedule.id))),
+            work_format_ids=frozenset(await self._reader.fetch_sequence(select(WorkFormat.id))),
+        )
+
+    async def import_vacancies(self, vacancies: Sequence[CreateVacancySchema]) -> None:
+        session = self._repo.session
+        for table in self._staging_tables:
+            await session.execute(CreateTable(table, if_not_exists=True))
+
+        skills: list[tuple[object, ...]] = []
+        refs: list[tuple[object, ...]] = []
+        for vacancy in vacancies:
+            skills.extend((vacancy.id, skill.name, False) for skill in vacancy.skills)
+            if vacancy.additional_skills is not UNSET:
+                skills.extend((vacancy.id, skill.name, True) for skill in vacancy.additional_skills)
+            refs.extend((vacancy.id, "employment_type", _id) for _id in vacancy.employment_type_ids)
+            refs.extend((vacancy.id, "work_schedule", _id) for _id in vacancy.work_schedule_ids)
+            refs.extend((vacancy.id, "work_format", _id) for _id in vacancy.work_formats_id)
+
+        await copy_records(session, _vacancy_import, [self._to_record(vacancy) for vacancy in vacancies])
+        await copy_records(session, _vacancy_import_skill, skills)
+        await copy_records(session, _vacancy_import_ref, refs)
+
+        async with self._repo.batch():
+            await self._repo.execute(
+                insert(Vacancy).from_select(list(_VACANCY_COLUMNS), select(_vacancy_import)),
+            )
+            await self._repo.execute(
+                insert(Skill)
+                .from_select(["name"], select(_vacancy_import_skill.c.name).distinct())
+                .on_conflict_do_nothing(index_elements=[Skill.name]),
+            )
+            await self._repo.execute(_get_map_skills_qs(is_additional=False))
+            await self._repo.execute(_get_map_skills_qs(is_additional=True))
+            for kind in _REF_RELATIONS:
+                await self._repo.execute(_get_map_refs_qs(kind))
+            for table in self._staging_tables:
+                await self._repo.execute(delete(table))
+
+        self._index.rebuild_on_commit(session)
+
+    @staticmethod
+    def _to_record(vacancy: CreateVacancySchema) -> tuple[object, ...]:
+        return (
+            vacancy.id,
+            vacancy.title,
+            vacancy.is_visible,
+            vacancy.salary.from_,
+            vacancy.salary.to,
+            # enum columns keep member names
+            vacancy.work_exp.name,
+            vacancy.education.name,
+            vacancy.email,
+            vacancy.responsibility,
+            vacancy.requirements,
+            vacancy.additional_description or None,
+            vacancy.address or None,
+            vacancy.author_id,
+        )
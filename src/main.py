@@ -8,8 +8,9 @@ from litestar.openapi.config import OpenAPIConfig
 from litestar.openapi.spec import Components, SecurityScheme
 
 from auth.infrastructure.middlewares import JWTAuthMiddleware
+from common.infrastructure.repositories.replica import ReadRoutingMiddleware
 from config import get_settings
-from infrastructure.api import router
+from infrastructure.api import internal_router, router
 from infrastructure.db import admin
 from infrastructure.di import get_ioc
 
@@ -34,11 +35,12 @@ def get_litestar_app() -> Litestar:
         wrapper_class=structlog.make_filtering_bound_logger(10),  # 10 = DEBUG
     )
     litestar_app = Litestar(
-        route_handlers=[router],
+        route_handlers=[router, internal_router],
         plugins=[admin.admin],
         debug=True,
-        middleware=[auth_mw],
+        middleware=[auth_mw, ReadRoutingMiddleware],
         logging_config=StructLoggingConfig(),
+        on_shutdown=[container.close],
         openapi_config=OpenAPIConfig(
             title="Empath API",
             version="0.0.1",
@@ -0,0 +1,76 @@
+import uuid
+
+from sqlalchemy import Column, ForeignKey, Integer, MetaData, String, Table, delete, insert, select, update
+from sqlalchemy.dialects import postgresql
+
+from common.infrastructure.repositories.batch import combine_statements, group_statements
+
+metadata = MetaData()
+vacancy = Table("vacancy", metadata, Column("id", Integer, primary_key=True), Column("title", String))
+skill = Table("skill", metadata, Column("id", Integer, primary_key=True), Column("name", String))
+rel_skill_vacancy = Table(
+    "rel_skill_vacancy",
+    metadata,
+    Column("vacancy_id", ForeignKey("vacancy.id", ondelete="CASCADE")),
+    Column("skill_id", ForeignKey("skill.id", ondelete="CASCADE")),
+)
+response = Table("response", metadata, Column("vacancy_id", ForeignKey("vacancy.id")), Column("text", String))
+
+
+def test_independent_statements_are_grouped() -> None:
+    statements = [
+        insert(vacancy).values(id=1, title="python developer"),
+        insert(skill).values(id=1, name="python"),
+        update(response).where(response.c.vacancy_id == 2).values(text="closed"),
+    ]
+
+    assert group_statements(statements) == [statements]
+
+
+def test_statement_touching_written_table_starts_group() -> None:
+    create = insert(vacancy).values(id=1, title="python developer")
+    map_skills = insert(rel_skill_vacancy).values(vacancy_id=1, skill_id=1)
+    # reads vacancy inserted by the first statement, so it must see its row
+    rename = update(skill).where(skill.c.id.in_(select(vacancy.c.id))).values(name="python")
+
+    assert group_statements([create, map_skills, rename]) == [[create, map_skills], [rename]]
+
+
+def test_delete_cascades_are_written_tables() -> None:
+    remove = delete(vacancy).where(vacancy.c.id == 1)
+    map_skills = insert(rel_skill_vacancy).values(vacancy_id=2, skill_id=1)
+    add_response = insert(response).values(vacancy_id=2, text="hello")
+
+    # rel_skill_vacancy rows are deleted by cascade, response has no ondelete action
+    assert group_statements([remove, map_skills, add_response]) == [[remove], [map_skills, add_response]]
+
+
+def test_combined_statement_keeps_bind_parameters() -> None:
+    title = f"'); DROP TABLE vacancy; -- {uuid.uuid4()}"
+    statements = [
+        delete(rel_skill_vacancy).where(rel_skill_vacancy.c.vacancy_id == 1),
+        update(vacancy).where(vacancy.c.id == 1).values(title=title),
+        insert(skill).values(id=1, name="python"),
+    ]
+
+    compiled = combine_statements(statements).compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+
+    assert sql.startswith("WITH batch_0 AS")
+    # earlier statements become CTEs in order, the last one is the main statement
+    assert sql.index("DELETE FROM rel_skill_vacancy") < sql.index("batch_1 AS") < sql.index("UPDATE vacancy")
+    assert sql.index("UPDATE vacancy") < sql.index("INSERT INTO skill")
+    assert title not in sql
+    assert title in compiled.params.values()
+    assert "python" in compiled.params.values()
+
+
+def test_combined_statement_text_does_not_depend_on_values() -> None:
+    def get_sql(vacancy_id: int, title: str) -> str:
+        statements = [
+            update(vacancy).where(vacancy.c.id == vacancy_id).values(title=title),
+            insert(response).values(vacancy_id=vacancy_id, text=title),
+        ]
+        return str(combine_statements(statements).compile(dialect=postgresql.dialect()))
+
+    assert get_sql(1, "python developer") == get_sql(2, "go developer")
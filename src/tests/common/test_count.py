@@ -0,0 +1,82 @@
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from sqlalchemy import Column, Connection, Integer, MetaData, Select, String, Table, create_engine, func, select
+
+from common.infrastructure.repositories import count
+from common.infrastructure.repositories.count import CountCache, get_count_cache_key, get_count_qs
+
+metadata = MetaData()
+article = Table("article", metadata, Column("id", Integer, primary_key=True), Column("title", String))
+like = Table("like", metadata, Column("article_id", Integer), Column("user_id", Integer))
+
+
+@pytest.fixture(scope="module")
+def connection() -> Iterator[Connection]:
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        metadata.create_all(connection)
+        connection.execute(article.insert(), [{"id": i, "title": f"title {i % 3}"} for i in range(10)])
+        connection.execute(like.insert(), [{"article_id": i, "user_id": 1} for i in range(0, 10, 2)])
+        yield connection
+    engine.dispose()
+
+
+def test_count_ignores_ordering_and_pagination(connection: Connection) -> None:
+    is_liked = select(like.c.user_id).where(like.c.article_id == article.c.id).exists().label("is_liked")
+    query = select(article, is_liked).where(article.c.id > 2).order_by(article.c.title).limit(3).offset(3)
+
+    count_qs = get_count_qs(query)
+
+    assert connection.execute(count_qs).scalar_one() == 7
+    compiled = str(count_qs)
+    assert "ORDER BY" not in compiled
+    assert "LIMIT" not in compiled
+    assert "is_liked" not in compiled
+
+
+def test_count_keeps_columns_of_grouped_and_distinct_queries(connection: Connection) -> None:
+    grouped = select(article.c.title, func.count()).group_by(article.c.title)
+    distinct = select(article.c.title).distinct()
+
+    assert connection.execute(get_count_qs(grouped)).scalar_one() == 3
+    assert connection.execute(get_count_qs(distinct)).scalar_one() == 3
+
+
+def test_count_cache_key_ignores_dropped_subquery_params() -> None:
+    def get_query(user_id: int) -> Select[Any]:
+        is_liked = select(like.c.user_id).where(like.c.article_id == article.c.id, like.c.user_id == user_id)
+        return select(article, is_liked.exists().label("is_liked")).where(article.c.title == "title 1")
+
+    assert get_count_cache_key(get_count_qs(get_query(1))) == get_count_cache_key(get_count_qs(get_query(2)))
+
+
+def test_count_cache_expires_values(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 100.0
+    monkeypatch.setattr(count.time, "monotonic", lambda: now)
+    cache = CountCache(ttl=5, maxsize=10)
+    cache.set(("a", ""), 1)
+
+    assert cache.get(("a", "")) == 1
+    now = 106.0
+    assert cache.get(("a", "")) is None
+
+
+def test_count_cache_evicts_least_recently_used() -> None:
+    cache = CountCache(ttl=60, maxsize=2)
+    cache.set(("a", ""), 1)
+    cache.set(("b", ""), 2)
+    cache.get(("a", ""))
+    cache.set(("c", ""), 3)
+
+    assert cache.get(("a", "")) == 1
+    assert cache.get(("b", "")) is None
+    assert cache.get(("c", "")) == 3
+
+
+def test_count_cache_disabled_by_zero_ttl() -> None:
+    cache = CountCache(ttl=0, maxsize=10)
+    cache.set(("a", ""), 1)
+
+    assert cache.get(("a", "")) is None
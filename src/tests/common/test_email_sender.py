@@ -0,0 +1,119 @@
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+from jinja2 import Template
+
+from common.infrastructure.adapters.email_sender import EmailDeliveryWorker, EmailSender
+from config import EmailSettings
+
+
+@dataclass
+class StubSMTPServer:
+    """Minimal SMTP server, which accepts every message."""
+
+    messages: list[str] = field(default_factory=list)
+    connections: int = 0
+    fail_next: int = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        writer.write(b"220 stub ESMTP\r\n")
+        while line := await reader.readline():
+            command = line.decode().strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                writer.write(b"250 stub\r\n")
+            elif command.startswith("DATA"):
+                writer.write(b"354 go ahead\r\n")
+                await writer.drain()
+                data = await reader.readuntil(b"\r\n.\r\n")
+                if self.fail_next:
+                    self.fail_next -= 1
+                    writer.write(b"451 try again later\r\n")
+                else:
+                    self.messages.append(data.decode())
+                    writer.write(b"250 queued\r\n")
+            elif command.startswith("QUIT"):
+                writer.write(b"221 bye\r\n")
+                await writer.drain()
+                break
+            else:
+                writer.write(b"250 ok\r\n")
+            await writer.drain()
+        writer.close()
+
+
+@pytest.fixture
+async def smtp_server() -> AsyncIterator[tuple[StubSMTPServer, int]]:
+    stub = StubSMTPServer()
+    server = await asyncio.start_server(stub.handle, "127.0.0.1", 0)
+    async with server:
+        yield stub, server.sockets[0].getsockname()[1]
+
+
+def get_email_settings(port: int, **kwargs: Any) -> EmailSettings:  # noqa: ANN401
+    return EmailSettings(
+        MAIL_HOST="127.0.0.1",
+        MAIL_PORT=port,
+        MAIL_USERNAME="noreply@empath.test",
+        MAIL_PASSWORD="",
+        MAIL_USE_TLS=False,
+        MAIL_WORKERS=1,
+        **{"MAIL_RETRY_BACKOFF": 0.01, **kwargs},
+    )
+
+
+async def test_send_email_reuses_connection(smtp_server: tuple[StubSMTPServer, int]) -> None:
+    stub, port = smtp_server
+    worker = EmailDeliveryWorker(get_email_settings(port), templates={"code.html": Template("code {{ code }}")})
+    worker.start()
+    sender = EmailSender(worker)
+
+    for code in range(5):
+        await sender.send_email_template(emails=["user@empath.test"], template_name="code.html", code=code)
+    await worker.stop()
+
+    assert len(stub.messages) == 5
+    assert "code 4" in stub.messages[-1]
+    assert stub.connections == 1
+
+
+async def test_send_email_retries_failed_message(smtp_server: tuple[StubSMTPServer, int]) -> None:
+    stub, port = smtp_server
+    stub.fail_next = 1
+    worker = EmailDeliveryWorker(get_email_settings(port), templates={"code.html": Template("code {{ code }}")})
+    worker.start()
+
+    await EmailSender(worker).send_email_template(emails=["user@empath.test"], template_name="code.html", code=1)
+    await asyncio.sleep(0.2)
+    await worker.stop()
+
+    assert len(stub.messages) == 1
+
+
+async def test_stop_sends_messages_waiting_for_retry(smtp_server: tuple[StubSMTPServer, int]) -> None:
+    stub, port = smtp_server
+    stub.fail_next = 1
+    worker = EmailDeliveryWorker(
+        get_email_settings(port, MAIL_RETRY_BACKOFF=60),
+        templates={"code.html": Template("code {{ code }}")},
+    )
+    worker.start()
+
+    await EmailSender(worker).send_email_template(emails=["user@empath.test"], template_name="code.html", code=1)
+    await worker.stop(timeout=5)
+
+    assert len(stub.messages) == 1
+
+
+async def test_enqueue_drops_message_when_queue_is_full() -> None:
+    worker = EmailDeliveryWorker(get_email_settings(1, MAIL_QUEUE_SIZE=1), templates={})
+    sender = EmailSender(worker)
+
+    async with asyncio.timeout(1):
+        await sender.send_email_template(emails=["first@empath.test"], template_name="code.html")
+        await sender.send_email_template(emails=["second@empath.test"], template_name="code.html")
+
+    assert worker.queue_depth == 1
@@ -0,0 +1,46 @@
+from collections.abc import AsyncIterator, Iterable
+
+import pytest
+
+from common.infrastructure.adapters.file_storage import _iter_parts
+from file_storage.application.exceptions import FileTooLargeError
+
+
+async def _aiter(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def _collect(chunks: Iterable[bytes], part_size: int, max_size: int = 1024) -> list[bytes]:
+    return [part async for part in _iter_parts(_aiter(chunks), part_size, max_size)]
+
+
+@pytest.mark.parametrize(
+    ("chunks", "parts"),
+    [
+        ([b"abc", b"defg", b"h"], [b"abcd", b"efgh"]),
+        ([b"abcdefghij"], [b"abcd", b"efgh", b"ij"]),
+        ([b"a", b"b", b"c", b"d", b"e"], [b"abcd", b"e"]),
+        ([b"ab"], [b"ab"]),
+        ([b"", b"abcd", b""], [b"abcd"]),
+    ],
+)
+async def test_iter_parts_regroups_chunks(chunks: list[bytes], parts: list[bytes]) -> None:
+    assert await _collect(chunks, part_size=4) == parts
+
+
+async def test_iter_parts_yields_empty_part_for_empty_file() -> None:
+    assert await _collect([], part_size=4) == [b""]
+
+
+async def test_iter_parts_accepts_file_of_max_size() -> None:
+    assert await _collect([b"abcd", b"ef"], part_size=4, max_size=6) == [b"abcd", b"ef"]
+
+
+async def test_iter_parts_rejects_file_over_max_size() -> None:
+    parts = _iter_parts(_aiter([b"abcd", b"efgh", b"i", b"jklm"]), 4, 8)
+
+    assert [await anext(parts), await anext(parts)] == [b"abcd", b"efgh"]
+    # the chunk over the limit is rejected before it gets into a part
+    with pytest.raises(FileTooLargeError):
+        await anext(parts)
@@ -0,0 +1,155 @@
+import csv
+import io
+import uuid
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+
+from job.recruitment.api.schemas import CreateVacancySchema
+from job.recruitment.application.commands.import_vacancies import (
+    ImportVacancies,
+    ImportVacanciesHandler,
+    VacancyImportFormat,
+)
+from job.recruitment.application.dto import VacancyReferencesDTO
+
+FULL_TIME, REMOTE, FLEXIBLE = (uuid.uuid4() for _ in range(3))
+HEADER = [
+    "title",
+    "is_visible",
+    "salary_from",
+    "salary_to",
+    "employment_type_ids",
+    "work_schedule_ids",
+    "work_exp",
+    "work_formats_id",
+    "skills",
+    "responsibility",
+    "requirements",
+    "education",
+    "email",
+]
+
+
+@dataclass
+class StubImportRepo:
+    """Vacancy import repo, which keeps imported vacancies in memory."""
+
+    imported: list[CreateVacancySchema] = field(default_factory=list)
+
+    async def get_references(self) -> VacancyReferencesDTO:
+        return VacancyReferencesDTO(
+            employment_type_ids=frozenset((FULL_TIME,)),
+            work_schedule_ids=frozenset((FLEXIBLE,)),
+            work_format_ids=frozenset((REMOTE,)),
+        )
+
+    async def import_vacancies(self, vacancies: list[CreateVacancySchema]) -> None:
+        self.imported.extend(vacancies)
+
+
+@dataclass
+class StubUnitOfWork:
+    commits: int = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+def get_row(**kwargs: Any) -> dict[str, Any]:  # noqa: ANN401
+    return {
+        "title": "Python developer",
+        "is_visible": "true",
+        "salary_from": "100000",
+        "salary_to": "",
+        "employment_type_ids": str(FULL_TIME),
+        "work_schedule_ids": str(FLEXIBLE),
+        "work_exp": "1-3 year",
+        "work_formats_id": str(REMOTE),
+        "skills": "python; sql",
+        "responsibility": "write code",
+        "requirements": "python",
+        "education": "bachelor",
+        "email": "hr@example.com",
+        **kwargs,
+    }
+
+
+def to_csv(rows: Iterable[dict[str, Any]]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, HEADER)
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue().encode()
+
+
+async def split_chunks(data: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def import_csv(data: bytes, chunk_size: int = 7) -> tuple[Any, StubImportRepo, StubUnitOfWork]:
+    repo, uow = StubImportRepo(), StubUnitOfWork()
+    handler = ImportVacanciesHandler(_repo=repo, _uow=uow)  # type: ignore[arg-type]
+    command = ImportVacancies(split_chunks(data, chunk_size), VacancyImportFormat.CSV, author_id=uuid.uuid4())
+    return await handler(command), repo, uow
+
+
+async def test_csv_keeps_quoted_newlines_in_one_row() -> None:
+    responsibility = 'write code\r\nreview "pull requests"\n\nmentor'
+
+    result, repo, uow = await import_csv(
+        to_csv([get_row(responsibility=responsibility), get_row(title="Go developer")])
+    )
+
+    assert (result.imported, result.failed, result.errors) == (2, 0, [])
+    assert repo.imported[0].responsibility == responsibility.replace("\r\n", "\n")
+    assert repo.imported[1].title == "Go developer"
+    assert uow.commits == 1
+
+
+async def test_csv_salary_and_list_columns() -> None:
+    result, repo, _ = await import_csv(to_csv([get_row(salary_from="90000", salary_to="150000")]))
+
+    assert result.imported == 1
+    vacancy = repo.imported[0]
+    assert (vacancy.salary.from_, vacancy.salary.to) == (90000, 150000)
+    assert [skill.name for skill in vacancy.skills] == ["python", "sql"]
+    assert vacancy.employment_type_ids == [FULL_TIME]
+
+
+@pytest.mark.parametrize(
+    ("row", "message"),
+    [
+        (get_row(salary_from="lots"), "salary"),
+        (get_row(skills=""), "skill"),
+        (get_row(work_formats_id=str(uuid.uuid4())), "work_formats_id"),
+        (get_row(education="kindergarten"), "education"),
+    ],
+)
+async def test_csv_reports_errors_per_row(row: dict[str, Any], message: str) -> None:
+    result, repo, _ = await import_csv(to_csv([get_row(), row, get_row()]))
+
+    assert (result.imported, result.failed) == (2, 1)
+    assert [error.row for error in result.errors] == [2]
+    assert message in result.errors[0].message.lower()
+    assert len(repo.imported) == 2
+
+
+async def test_csv_reports_row_with_wrong_column_count() -> None:
+    data = to_csv([get_row()]) + b"only,three,columns\n"
+
+    result, _, _ = await import_csv(data)
+
+    assert (result.imported, result.failed) == (1, 1)
+    assert result.errors[0].row == 2
+    assert "columns" in result.errors[0].message
+
+
+async def test_import_without_valid_rows_does_not_commit() -> None:
+    result, _, uow = await import_csv(to_csv([get_row(skills="")]))
+
+    assert (result.imported, result.failed) == (0, 1)
+    assert uow.commits == 0
@@ -0,0 +1,68 @@
+import base64
+import uuid
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import Column, Connection, DateTime, MetaData, Table, Uuid, create_engine, select
+
+from common.application.exceptions import InvalidCursorError
+from common.application.query import PaginationParams
+from common.infrastructure.repositories.pagination import AlchemyPaginator
+
+metadata = MetaData()
+vacancy = Table("vacancy", metadata, Column("id", Uuid, primary_key=True), Column("created_at", DateTime))
+START = datetime(2026, 1, 1)  # noqa: DTZ001
+
+
+@pytest.fixture(scope="module")
+def connection() -> Iterator[Connection]:
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        metadata.create_all(connection)
+        # pairs of rows share created_at, so the order depends on id too
+        rows = [{"id": uuid.uuid4(), "created_at": START + timedelta(minutes=i // 2)} for i in range(11)]
+        connection.execute(vacancy.insert(), rows)
+        yield connection
+    engine.dispose()
+
+
+def test_cursor_round_trip() -> None:
+    created_at = datetime(2026, 10, 18, 12, 30, 15, 123456, tzinfo=UTC)
+    id_ = uuid.uuid4()
+
+    cursor = AlchemyPaginator.encode_cursor(created_at, id_)
+
+    assert "=" not in cursor
+    assert AlchemyPaginator.decode_cursor(cursor) == (created_at, id_)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        base64.urlsafe_b64encode(b'["2026-10-18T12:00:00"]').decode(),
+        base64.urlsafe_b64encode(b'["yesterday", "0"]').decode(),
+        base64.urlsafe_b64encode(b"{").decode(),
+    ],
+)
+def test_decode_malformed_cursor(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        AlchemyPaginator.decode_cursor(cursor)
+
+
+def test_keyset_pages_cover_all_rows_once(connection: Connection) -> None:
+    query = select(vacancy.c.id, vacancy.c.created_at)
+    expected = connection.execute(query.order_by(vacancy.c.created_at.desc(), vacancy.c.id.desc())).all()
+
+    seen = []
+    cursor = None
+    while True:
+        pagination = PaginationParams(page=1, per_page=4, cursor=cursor)
+        page_qs = AlchemyPaginator.paginate_keyset(query, pagination, vacancy.c.created_at, vacancy.c.id)
+        rows = connection.execute(page_qs).mappings().all()
+        seen.extend((row.id, row.created_at) for row in rows)
+        if (cursor := AlchemyPaginator.get_next_cursor(rows, pagination.per_page)) is None:
+            break
+
+    assert seen == [tuple(row) for row in expected]
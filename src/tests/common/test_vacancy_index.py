@@ -0,0 +1,71 @@
+import math
+import uuid
+from uuid import UUID
+
+import pytest
+
+from job.common.infrastructure.vacancy_index import VacancySkillIndex
+
+PYTHON, SQL, GO, RUST = (uuid.uuid4() for _ in range(4))
+BACKEND, ANALYST, SYSTEMS = (uuid.uuid4() for _ in range(3))
+VACANCY_SKILLS = {
+    BACKEND: {PYTHON, SQL},
+    ANALYST: {SQL},
+    SYSTEMS: {GO, RUST},
+}
+
+
+@pytest.fixture
+def vacancy_skills() -> dict[UUID, set[UUID]]:
+    return dict(VACANCY_SKILLS)
+
+
+@pytest.fixture
+async def index(vacancy_skills: dict[UUID, set[UUID]]) -> VacancySkillIndex:
+    index = VacancySkillIndex(session_maker=None, ttl=60)  # type: ignore[arg-type]
+
+    async def load(vacancy_ids: set[UUID] | None = None) -> dict[UUID, set[UUID]]:
+        return {id_: skills for id_, skills in vacancy_skills.items() if vacancy_ids is None or id_ in vacancy_ids}
+
+    index._load = load  # type: ignore[method-assign]  # noqa: SLF001
+    return index
+
+
+async def test_top_scores_by_share_of_idf_weight(index: VacancySkillIndex) -> None:
+    top = await index.top([PYTHON], limit=10)
+
+    # idf = ln((1 + N) / (1 + df)) + 1 with N = 3 vacancies, python is in one of them and sql in two
+    python_weight = math.log(4 / 2) + 1
+    sql_weight = math.log(4 / 3) + 1
+    assert top == [(BACKEND, pytest.approx(python_weight / (python_weight + sql_weight)))]
+
+
+async def test_top_orders_best_first_and_limits(index: VacancySkillIndex) -> None:
+    assert [vacancy_id for vacancy_id, _ in await index.top([SQL, GO], limit=10)] == [ANALYST, SYSTEMS, BACKEND]
+    assert [vacancy_id for vacancy_id, _ in await index.top([SQL, GO], limit=2)] == [ANALYST, SYSTEMS]
+
+
+async def test_top_filters_by_min_score(index: VacancySkillIndex) -> None:
+    top = await index.top([SQL, GO], limit=10, min_score=0.6)
+
+    assert [vacancy_id for vacancy_id, _ in top] == [ANALYST]
+
+
+async def test_top_ignores_unknown_skills(index: VacancySkillIndex) -> None:
+    assert await index.top([uuid.uuid4()], limit=10) == []
+
+
+async def test_refresh_reweights_other_vacancies(
+    index: VacancySkillIndex,
+    vacancy_skills: dict[UUID, set[UUID]],
+) -> None:
+    await index.top([PYTHON], limit=10)
+    data_engineer = uuid.uuid4()
+    vacancy_skills[data_engineer] = {PYTHON}
+    del vacancy_skills[SYSTEMS]
+
+    await index._reload({data_engineer, SYSTEMS})  # noqa: SLF001
+
+    # python and sql are both in two of N = 3 vacancies now, so they weigh the same for backend too
+    assert await index.top([PYTHON], limit=10) == [(data_engineer, pytest.approx(1.0)), (BACKEND, pytest.approx(0.5))]
+    assert await index.top([GO], limit=10) == []
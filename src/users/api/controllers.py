@@ -1,5 +1,4 @@
 from collections.abc import Mapping
-from io import BytesIO
 from typing import Annotated, ClassVar
 from uuid import UUID
 
@@ -14,7 +13,9 @@ from litestar.response import Response
 
 from auth.api.schemas import JWTUserPayload
 from common.api.exception_handlers import error_handler
+from common.api.files import MAX_UPLOAD_BODY_SIZE, iter_upload_file
 from common.application.query import PaginationParams
+from file_storage.application.exceptions import FileTooLargeError
 from users.api.schemas import UpdateAvatarResponse, UserUpdateFullnameSchema, UserUpdateSchema
 from users.application.commands.update_avatar import UpdateAvatar, UpdateAvatarHandler
 from users.application.commands.update_fullname import UpdateFullname, UpdateFullnameHandler
@@ -28,6 +29,7 @@ from users.application.queries.user_by_id import GetUserById, GetUserByIdHandler
 class UserController(Controller):
     exception_handlers: ClassVar[Mapping] = {  # type: ignore  # noqa: PGH003
         UserIdNotExistError: error_handler(status_codes.HTTP_400_BAD_REQUEST),
+        FileTooLargeError: error_handler(status_codes.HTTP_413_REQUEST_ENTITY_TOO_LARGE),
     }
 
     @get(path="/me", status_code=status_codes.HTTP_200_OK)
@@ -51,7 +53,7 @@ class UserController(Controller):
     ) -> PaginatedUserDTO:
         return await get_users(GetUsers(page=pagination_params.page, per_page=pagination_params.per_page))
 
-    @put(path="/me/avatar", status_code=status_codes.HTTP_200_OK)
+    @put(path="/me/avatar", status_code=status_codes.HTTP_200_OK, request_max_body_size=MAX_UPLOAD_BODY_SIZE)
     @inject
     async def update_user_avatar(
         self,
@@ -59,8 +61,7 @@ class UserController(Controller):
         update_avatar: Depends[UpdateAvatarHandler],
         request: Request[JWTUserPayload, str, State],
     ) -> UpdateAvatarResponse:
-        content = await data.read()
-        command = UpdateAvatar(user_id=request.user.sub, file=BytesIO(content), filename=data.filename)
+        command = UpdateAvatar(user_id=request.user.sub, file=iter_upload_file(data), filename=data.filename)
         new_url = await update_avatar(command)
         return UpdateAvatarResponse(url=new_url)
 
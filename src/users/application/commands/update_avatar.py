@@ -1,5 +1,5 @@
+from collections.abc import AsyncIterable
 from dataclasses import dataclass
-from io import BytesIO
 from uuid import UUID, uuid4
 
 from common.application.command import Command, CommandHandler
@@ -11,7 +11,7 @@ from users.application.ports.repo import UserRepo
 @dataclass(frozen=True)
 class UpdateAvatar(Command[str]):
     user_id: UUID
-    file: BytesIO
+    file: AsyncIterable[bytes]
     filename: str
 
 
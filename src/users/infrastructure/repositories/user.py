@@ -3,6 +3,7 @@ from uuid import UUID
 
 from sqlalchemy import Select, insert, select, update
 
+from articles.infrastructure.repositories.qb import ArticleQueryBuilder
 from auth.infrastructure.models import User
 from common.application.dto import PaginatedDTO
 from common.infrastructure.repositories.base import AlchemyReader, AlchemyRepo
@@ -20,6 +21,9 @@ from users.infrastructure.mapper import (
 
 class AlchemyUserRepo(AlchemyRepo, UserRepo):
     user = User
+    article_qb = ArticleQueryBuilder
+    # profile fields copied into the article feed, rating is read from the user on list
+    author_fields = frozenset(("nickname", "name", "lastname", "patronymic", "image"))
 
     async def create_user(self, user: entities.User) -> None:
         query = insert(self.user).values(**convert_user_entity_to_db_model(user=user))
@@ -28,6 +32,8 @@ class AlchemyUserRepo(AlchemyRepo, UserRepo):
     async def update_user(self, values: dict[str, Any], filters: dict[str, Any]) -> None:
         query = update(self.user).values(**values).filter_by(**filters)
         await self.execute(query=query)
+        if not self.author_fields.isdisjoint(values):
+            await self.execute(query=self.article_qb.get_refresh_feed_authors_qs(filters))
 
 
 class AlchemyUserReader(AlchemyReader, UserReader):